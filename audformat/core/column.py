@@ -8,8 +8,7 @@ import pandas as pd
 
 from audformat.core import define
 from audformat.core.common import HeaderBase
-from audformat.core.common import to_audformat_dtype
-from audformat.core.common import to_pandas_dtype
+from audformat.core.common import next_version
 from audformat.core.index import index_type
 from audformat.core.index import is_scalar
 from audformat.core.index import to_array
@@ -38,21 +37,11 @@ def assert_values(
     ):
         if is_scalar(values):
             values = [values]
-        elif isinstance(values, pd.Series):
-            values = values.values
-        elif isinstance(values, np.ndarray):
-            if scheme.is_numeric:
-                # Support type object with None entries,
-                # which need to be converted to NaN
-                # to support min/max
-                values = values.astype(float)
-                values = [
-                    np.nanmin(values),
-                    np.nanmax(values),
-                ]
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+        values = values[~scheme._contains_values(values)]
         # Get unique values and preserve order
-        values = list(dict.fromkeys(values))
-        bad_values = [value for value in values if value not in scheme]
+        bad_values = values.drop_duplicates().tolist()
 
     if len(bad_values) > 0:
         max_display = 10
@@ -208,10 +197,17 @@ class Column(HeaderBase):
         if self._table is None:
             raise RuntimeError("Column is not assigned to a table.")
 
+        columns = None
+        if self._table._use_memory_map():
+            # Convert only this column
+            # of the memory-mapped table
+            columns = self._id
+
         if hasattr(self._table, "type"):
             result = self._table.get(
                 index,
                 copy=False,
+                columns=columns,
                 as_segmented=as_segmented,
                 allow_nat=allow_nat,
                 root=root,
@@ -222,71 +218,13 @@ class Column(HeaderBase):
             result = self._table.get(
                 index,
                 copy=False,
+                columns=columns,
             )
         result = result[self._id]
 
         if map is not None:
             copy = False  # to avoid another copy
-
-            if self.scheme_id is None:
-                raise ValueError(f"Column '{self._id}' is not assigned to a scheme.")
-
-            scheme = self._table._db.schemes[self.scheme_id]
-            labels = scheme._labels_to_dict()
-
-            if labels is None:
-                raise ValueError(f"Scheme '{self.scheme_id}' has no labels.")
-
-            if not any(labels.values()):
-                raise ValueError(
-                    f"Scheme '{self.scheme_id}' provides no mapping " "for its labels."
-                )
-
-            # Check that at least one key is available for map
-            # if labels are stored as dictionary
-            keys = []
-            for key, value in labels.items():
-                if isinstance(value, dict):
-                    keys += list(value.keys())
-            keys = sorted(list(set(keys)))
-            if len(keys) > 0 and map not in keys:
-                raise ValueError(
-                    f"Cannot map "
-                    f"'{self._id}' "
-                    f"to "
-                    f"'{map}'. "
-                    f"Expected one of "
-                    f"{list(keys)}."
-                )
-
-            mapping = {}
-            for key, value in labels.items():
-                if isinstance(value, dict):
-                    if map in value:
-                        value = value[map]
-                    else:
-                        value = np.nan
-                mapping[key] = value
-
-            result = result.map(mapping)
-            result.name = map
-
-            if (
-                scheme.uses_table
-                and self._table._db[scheme.labels][map].scheme is not None
-                #                       ^           ^
-                #                   misc table   column
-            ):
-                # Infer dtype from misc table
-                misc_table_id = scheme.labels
-                column = self._table._db[misc_table_id][map]
-                dtype = column.scheme.to_pandas_dtype()
-            else:
-                # Infer dtype from actual labels
-                dtype = pd.api.types.infer_dtype(list(result.values))
-                dtype = to_pandas_dtype(to_audformat_dtype(dtype))
-
-            result = result.astype(dtype)
+            result = self._map(result, map)
 
         return result.copy() if copy else result
 
@@ -318,6 +256,9 @@ class Column(HeaderBase):
                 using a segmented index
             ValueError: if values cannot be converted
                 to match the schemes dtype
+            ValueError: if values do not match
+                the labels or the minimum and maximum value
+                of the scheme
 
         """
         if self._table is None:
@@ -374,14 +315,106 @@ class Column(HeaderBase):
                     index=index,
                     dtype=dtype,
                 )
+            self._table._update_version()
 
     def __eq__(
         self,
         other: "Column",
     ) -> bool:
         r"""Compare if column equals another column."""
-        if self.dump() != other.dump():
+        if self._structure() != other._structure():
             return False
         if self._table is not None and other._table is not None:
             return self._table.df[self._id].equals(other._table.df[other._id])
         return self._table is None and other._table is None
+
+    def __setattr__(self, name: str, value: typing.Any):
+        r"""Set attribute and track change of scheme."""
+        super().__setattr__(name, value)
+        if (
+            name == "scheme_id"
+            and getattr(self, "_table", None) is not None
+            and self._table._db is not None
+        ):
+            # Columns matching a scheme
+            # depend on the database version
+            self._table._db._version = next_version()
+
+    def _map(
+        self,
+        y: pd.Series,
+        map: str,
+    ) -> pd.Series:
+        r"""Map column values to scheme labels or label field.
+
+        Args:
+            y: column values
+            map: scheme label field
+
+        Returns:
+            mapped values
+
+        Raises:
+            ValueError: if trying to map without a scheme,
+                or from a scheme that has no labels,
+                or from a scheme that has only a list of labels,
+                or to a non-existing field
+
+        """
+        if self.scheme_id is None:
+            raise ValueError(f"Column '{self._id}' is not assigned to a scheme.")
+
+        scheme = self._table._db.schemes[self.scheme_id]
+        mapping = scheme._label_mapping()
+
+        if mapping is None:
+            raise ValueError(f"Scheme '{self.scheme_id}' has no labels.")
+
+        if not mapping.has_mapping:
+            raise ValueError(
+                f"Scheme '{self.scheme_id}' provides no mapping " "for its labels."
+            )
+
+        # Check that at least one key is available for map
+        # if labels are stored as dictionary
+        keys = mapping.keys
+        if len(keys) > 0 and map not in keys:
+            raise ValueError(
+                f"Cannot map "
+                f"'{self._id}' "
+                f"to "
+                f"'{map}'. "
+                f"Expected one of "
+                f"{list(keys)}."
+            )
+
+        # Infer dtype from labels
+        # if it is not provided by misc table
+        dtype = None
+        if (
+            scheme.uses_table
+            and self._table._db[scheme.labels][map].scheme is not None
+            #                       ^           ^
+            #                   misc table   column
+        ):
+            # Infer dtype from misc table
+            misc_table_id = scheme.labels
+            column = self._table._db[misc_table_id][map]
+            dtype = column.scheme.to_pandas_dtype()
+        values = mapping.values(map, dtype)
+
+        # Map labels by their position,
+        # values that are no label are mapped to NaN
+        if isinstance(y.dtype, pd.CategoricalDtype):
+            codes = y.cat.codes.to_numpy()
+            categories = y.cat.categories
+        else:
+            codes, categories = pd.factorize(y)
+        positions = np.append(mapping.index.get_indexer(categories), -1)
+        y = pd.Series(
+            values.take(positions[codes], allow_fill=True),
+            index=y.index,
+            name=map,
+        )
+
+        return y
@@ -1,11 +1,24 @@
 from collections import OrderedDict
+from collections.abc import MutableMapping
+import contextlib
 import inspect
+import itertools
 import os
 import textwrap
+import threading
 import typing
+import uuid
 
 import oyaml as yaml
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as parquet
+
+
+try:
+    from yaml import CDumper as Dumper
+except ImportError:  # pragma: nocover
+    from yaml import Dumper
 
 from audformat import define
 from audformat.core.errors import BadKeyError
@@ -13,6 +26,11 @@ from audformat.core.errors import BadTypeError
 from audformat.core.errors import BadValueError
 
 
+# Counter of version numbers,
+# see next_version()
+_versions = itertools.count()
+
+
 class HeaderDict(OrderedDict):
     r"""Custom implementation of a dictionary.
 
@@ -33,6 +51,7 @@ class HeaderDict(OrderedDict):
         value_type: only accept values of this type
         get_callback: call this function when an item is requested
         set_callback: call this function when an item is added
+        del_callback: call this function when an item is removed
         **kwargs: default keyword arguments
 
     Raises:
@@ -74,6 +93,7 @@ class HeaderDict(OrderedDict):
         value_type: type = None,
         get_callback: typing.Callable = None,
         set_callback: typing.Callable = None,
+        del_callback: typing.Callable = None,
         **kwargs,
     ):
         self.sort_by_key = sort_by_key
@@ -84,9 +104,16 @@ class HeaderDict(OrderedDict):
         r"""Callback function when item is requested"""
         self.set_callback = set_callback
         r"""Callback function when item is added"""
+        self.del_callback = del_callback
+        r"""Callback function when item is removed"""
 
         super().__init__(*args, **kwargs)
 
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        if self.del_callback is not None:
+            self.del_callback(key)
+
     def __getitem__(self, key):
         if key not in self:
             raise BadKeyError(key, list(self))
@@ -118,6 +145,13 @@ class HeaderDict(OrderedDict):
                 raise BadTypeError(value, self.value_type)
         super().__setitem__(key, value)
 
+    def clear(self):
+        keys = list(self)
+        super().clear()
+        if self.del_callback is not None:
+            for key in keys:
+                self.del_callback(key)
+
     def dump(self) -> str:
         if not self:
             return ""
@@ -138,6 +172,13 @@ class HeaderDict(OrderedDict):
     def keys(self):
         return iter([key for key, _ in self.items()])
 
+    def pop(self, key, *args):
+        removed = key in self
+        value = super().pop(key, *args)
+        if removed and self.del_callback is not None:
+            self.del_callback(key)
+        return value
+
     def popitem(self, last: bool = True):
         if len(self) > 0 and self.sort_by_key:
             keys = list(self)
@@ -146,14 +187,288 @@ class HeaderDict(OrderedDict):
             else:
                 key = keys[0]
             value = super().pop(key)
-            return key, value
         else:
-            return super().popitem(last)
+            key, value = super().popitem(last)
+        if self.del_callback is not None:
+            self.del_callback(key)
+        return key, value
 
     def values(self):
         return iter([value for _, value in self.items()])
 
 
+class FilesDuration(MutableMapping):
+    r"""Cache of file durations.
+
+    Maps absolute file paths
+    to durations as :class:`pandas.Timedelta` objects.
+    The cache can be stored to a PARQUET file,
+    which holds for every file under a root folder
+    its relative path,
+    size,
+    and modification time.
+    Entries loaded from disk are checked lazily
+    and only used
+    if size and modification time
+    of the file did not change.
+    The cache is thread-safe.
+
+    Examples:
+        >>> durations = FilesDuration()
+        >>> durations["/f.wav"] = pd.Timedelta(1, unit="s")
+        >>> "/f.wav" in durations
+        True
+        >>> durations["/f.wav"]
+        Timedelta('0 days 00:00:01')
+
+    """
+
+    def __init__(self):
+        self._durations = {}
+        # Entries loaded from disk,
+        # which are not yet checked
+        # against the file on disk
+        self._stored = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, file) -> bool:
+        with self._lock:
+            if file in self._durations:
+                return True
+            if file not in self._stored:
+                return False
+            size, mtime, dur = self._stored.pop(file)
+            try:
+                stat = os.stat(file)
+            except OSError:
+                return False
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+            self._durations[file] = dur
+            return True
+
+    def __delitem__(self, file):
+        with self._lock:
+            self._stored.pop(file, None)
+            del self._durations[file]
+
+    def __getitem__(self, file) -> pd.Timedelta:
+        if file not in self:
+            raise KeyError(file)
+        return self._durations[file]
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __iter__(self):
+        return iter(list(self._durations))
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+    def __setitem__(self, file, dur):
+        with self._lock:
+            self._stored.pop(file, None)
+            self._durations[file] = dur
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._durations.clear()
+            self._stored.clear()
+
+    def load(self, path: str, root: str):
+        r"""Load cached durations from disk.
+
+        Args:
+            path: path to PARQUET file
+            root: root folder of relative file paths
+
+        """
+        table = parquet.read_table(path)
+        files = table.column("file").to_pylist()
+        sizes = table.column("size").to_pylist()
+        mtimes = table.column("mtime").to_pylist()
+        durs = table.column("duration").to_pandas()
+        with self._lock:
+            for file, size, mtime, dur in zip(files, sizes, mtimes, durs):
+                file = os.path.join(root, *file.split("/"))
+                if file not in self._durations:
+                    self._stored[file] = (size, mtime, dur)
+
+    def save(self, path: str, root: str):
+        r"""Store cached durations of files under root folder.
+
+        Files outside of ``root``
+        or files that no longer exist
+        are skipped.
+        If no entries remain,
+        no file is written.
+
+        Args:
+            path: path to PARQUET file
+            root: root folder of relative file paths
+
+        """
+        with self._lock:
+            durations = self._durations.copy()
+            entries = self._stored.copy()
+        for file, dur in durations.items():
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            entries[file] = (stat.st_size, stat.st_mtime_ns, dur)
+
+        files = []
+        sizes = []
+        mtimes = []
+        durs = []
+        for file, (size, mtime, dur) in entries.items():
+            file = os.path.relpath(file, root)
+            if file.startswith(os.pardir):
+                continue
+            files.append(file.replace(os.sep, "/"))
+            sizes.append(size)
+            mtimes.append(mtime)
+            durs.append(dur)
+
+        if not files:
+            return
+
+        table = pa.table(
+            {
+                "file": pa.array(files, type=pa.string()),
+                "size": pa.array(sizes, type=pa.int64()),
+                "mtime": pa.array(mtimes, type=pa.int64()),
+                "duration": pa.array(durs, type=pa.duration("ns")),
+            }
+        )
+        with atomic_path(path) as tmp_path:
+            parquet.write_table(table, tmp_path)
+
+
+class ResultCache:
+    r"""Least recently used cache of results.
+
+    Stores data frames and series
+    up to a maximum size in bytes,
+    as returned by :meth:`pandas.DataFrame.memory_usage`
+    with ``deep=True``.
+    If the maximum size is exceeded,
+    the least recently used results are discarded.
+    Results larger than the maximum size
+    are not stored.
+    Results are copied
+    when they are added or requested,
+    so that changes to a returned object
+    do not affect the cache.
+    The cache is thread-safe.
+
+    Args:
+        max_size: maximum size of cached results in bytes
+
+    Examples:
+        >>> cache = ResultCache(1024)
+        >>> cache.put("key", pd.Series([1, 2]))
+        >>> cache.get("key")
+        0    1
+        1    2
+        dtype: int64
+        >>> cache.get("other") is None
+        True
+
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        r"""Maximum size of cached results in bytes"""
+        self._results = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        r"""Size of cached results in bytes.
+
+        Returns:
+            size in bytes
+
+        """
+        return self._size
+
+    def clear(self):
+        r"""Remove all results."""
+        with self._lock:
+            self._results.clear()
+            self._size = 0
+
+    def get(
+        self,
+        key: typing.Hashable,
+    ) -> typing.Optional[typing.Union[pd.DataFrame, pd.Series]]:
+        r"""Get copy of cached result.
+
+        Args:
+            key: key of result
+
+        Returns:
+            result or ``None`` if not cached
+
+        """
+        with self._lock:
+            if key not in self._results:
+                return None
+            self._results.move_to_end(key)
+            obj, _ = self._results[key]
+        return obj.copy()
+
+    def put(
+        self,
+        key: typing.Hashable,
+        obj: typing.Union[pd.DataFrame, pd.Series],
+    ):
+        r"""Add copy of result.
+
+        Args:
+            key: key of result
+            obj: result
+
+        """
+        size = obj.memory_usage(index=True, deep=True)
+        if isinstance(obj, pd.DataFrame):
+            size = size.sum()
+        size = int(size)
+        if size > self.max_size:
+            return
+        obj = obj.copy()
+        with self._lock:
+            if key in self._results:
+                self._size -= self._results.pop(key)[1]
+            self._results[key] = (obj, size)
+            self._size += size
+            while self._size > self.max_size:
+                _, (_, discarded_size) = self._results.popitem(last=False)
+                self._size -= discarded_size
+
+
 class HeaderBase:
     r"""Base class for header objects.
 
@@ -204,6 +519,35 @@ class HeaderBase:
             return False
         return True
 
+    @staticmethod
+    def _freeze(value):
+        # Hashable representation of a serialized value,
+        # which distinguishes types
+        # as the YAML representation does,
+        # e.g. 1, 1.0, and True
+        if isinstance(value, dict):
+            return (
+                dict,
+                tuple((key, HeaderBase._freeze(v)) for key, v in value.items()),
+            )
+        elif isinstance(value, list):
+            return (list, tuple(HeaderBase._freeze(v) for v in value))
+        elif value is None or isinstance(value, (bool, int, str)):
+            return (type(value), value)
+        else:
+            return (type(value), repr(value))
+
+    def _structure(self) -> tuple:
+        r"""Hashable representation of header object.
+
+        Two header objects have the same structure
+        if they have the same YAML representation,
+        but creating the structure
+        avoids the costly YAML serialization.
+
+        """
+        return self._freeze(self.to_dict())
+
     def to_dict(self) -> dict:
         r"""Serialize object to dictionary.
 
@@ -263,16 +607,17 @@ class HeaderBase:
             default_flow_style=None,
             indent=indent,
             allow_unicode=True,
+            Dumper=Dumper,
         )
 
     def __eq__(
         self,
         other: "HeaderBase",
     ) -> bool:
-        return self.dump() == other.dump()
+        return self._structure() == other._structure()
 
     def __hash__(self) -> int:
-        return hash(self.dump())
+        return hash(self._structure())
 
     def __repr__(self):
         s = self.dump()
@@ -301,6 +646,45 @@ class DefineBase:
         )
 
 
+@contextlib.contextmanager
+def atomic_path(path: str) -> typing.Iterator[str]:
+    r"""Temporary path to write a file atomically.
+
+    The file is written to a temporary path
+    in the same folder,
+    which is renamed to ``path``
+    when the context is left without error.
+    Otherwise,
+    the temporary file is removed
+    and an existing file at ``path`` is kept.
+
+    Args:
+        path: file path
+
+    Yields:
+        temporary file path
+
+    Examples:
+        >>> path = "file.txt"
+        >>> with atomic_path(path) as tmp_path:
+        ...     with open(tmp_path, "w") as fp:
+        ...         _ = fp.write("content")
+        >>> with open(path) as fp:
+        ...     fp.read()
+        'content'
+
+    """
+    root, name = os.path.split(path)
+    tmp_path = os.path.join(root, f".{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def format_series_as_html():  # pragma: no cover (only used in documentation)
     setattr(pd.Series, "_repr_html_", series_to_html)
     setattr(pd.Index, "_repr_html_", index_to_html)
@@ -323,6 +707,22 @@ def is_relative_path(path):
     )
 
 
+def next_version() -> int:
+    r"""Unique version number.
+
+    Objects store a new version number
+    whenever they are modified,
+    which is used to invalidate cached results,
+    compare :class:`audformat.core.common.ResultCache`.
+    Version numbers are unique among all objects.
+
+    Returns:
+        version number
+
+    """
+    return next(_versions)
+
+
 def series_to_html(self):  # pragma: no cover
     df = self.to_frame()
     return df.to_html()
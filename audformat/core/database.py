@@ -1,6 +1,8 @@
 import datetime
+import hashlib
 import itertools
 import os
+import pickle
 import shutil
 import typing
 
@@ -20,9 +22,14 @@ from audformat.core import define
 from audformat.core import utils
 from audformat.core.attachment import Attachment
 from audformat.core.column import Column
+from audformat.core.column import assert_values
+from audformat.core.common import FilesDuration
 from audformat.core.common import HeaderBase
 from audformat.core.common import HeaderDict
+from audformat.core.common import ResultCache
+from audformat.core.common import atomic_path
 from audformat.core.common import is_relative_path
+from audformat.core.common import next_version
 from audformat.core.errors import BadIdError
 from audformat.core.errors import BadKeyError
 from audformat.core.errors import TableExistsError
@@ -33,6 +40,7 @@ from audformat.core.scheme import Scheme
 from audformat.core.split import Split
 from audformat.core.table import MiscTable
 from audformat.core.table import Table
+from audformat.core.table import _assert_parquet_options
 
 
 class Database(HeaderBase):
@@ -204,6 +212,7 @@ class Database(HeaderBase):
         self.schemes = HeaderDict(
             value_type=Scheme,
             set_callback=self._set_scheme,
+            del_callback=self._del_item,
         )
         r"""Dictionary of schemes"""
         self.splits = HeaderDict(value_type=Split)
@@ -211,17 +220,23 @@ class Database(HeaderBase):
         self.tables = HeaderDict(
             value_type=Table,
             set_callback=self._set_table,
+            del_callback=self._del_item,
         )
         r"""Dictionary of audformat tables"""
         self.misc_tables = HeaderDict(
             value_type=MiscTable,
             set_callback=self._set_table,
+            del_callback=self._del_item,
         )
         r"""Dictionary of miscellaneous tables"""
 
-        self._files_duration = {}
+        self._cache = None
+        self._files_duration = FilesDuration()
         self._name = None
         self._root = None
+        self._scheme_sources = {}
+        self._scheme_sources_version = None
+        self._version = next_version()
 
     @property
     def files(self) -> pd.Index:
@@ -290,6 +305,15 @@ class Database(HeaderBase):
         index, _ = index.sortlevel()
         return index
 
+    def disable_cache(self):
+        r"""Disable cache of results.
+
+        Removes all cached results,
+        see :meth:`audformat.Database.enable_cache`.
+
+        """
+        self._cache = None
+
     def drop_files(
         self,
         files: typing.Union[
@@ -361,11 +385,69 @@ class Database(HeaderBase):
                 available_tables = {**self.tables, **self.misc_tables}
                 raise BadIdError("table", table_id, available_tables)
 
+    def enable_cache(
+        self,
+        max_size: int = 512 * 1024**2,
+    ):
+        r"""Enable cache of results.
+
+        Results of :meth:`audformat.Database.get`
+        and mapped results of :meth:`audformat.Table.get`
+        and :meth:`audformat.MiscTable.get`,
+        or results read from disk by those methods,
+        are kept in memory
+        and returned again
+        when the method is called with the same arguments.
+        Cached results are invalidated
+        when tables, columns, or schemes
+        are added or removed,
+        or modified by methods like
+        :meth:`audformat.Column.set`,
+        :meth:`audformat.Table.update`,
+        :meth:`audformat.Table.drop_files`,
+        :meth:`audformat.Table.extend_index`,
+        or :meth:`audformat.Scheme.replace_labels`.
+        Changes applied directly to :attr:`audformat.Table.df`
+        or to :attr:`audformat.Scheme.labels`
+        are not tracked.
+        If the size of the cached results exceeds ``max_size``,
+        the least recently used results are discarded.
+        Callables,
+        e.g. ``aggregate_function``,
+        are compared by identity.
+
+        Args:
+            max_size: maximum size of cached results in bytes
+
+        Examples:
+            >>> db = Database("mydb")
+            >>> db.schemes["label"] = Scheme("str")
+            >>> db["files"] = Table(filewise_index(["f1", "f2"]))
+            >>> db["files"]["label"] = Column(scheme_id="label")
+            >>> db["files"]["label"].set(["a", "b"])
+            >>> db.enable_cache()
+            >>> db.get("label")
+               label
+            file
+            f1     a
+            f2     b
+            >>> db["files"]["label"].set(["c", "d"])
+            >>> db.get("label")
+               label
+            file
+            f1     c
+            f2     d
+
+        """
+        self._cache = ResultCache(max_size)
+
     def files_duration(
         self,
         files: typing.Union[str, typing.Sequence[str]],
         *,
         root: str = None,
+        num_workers: typing.Optional[int] = 1,
+        verbose: bool = False,
     ) -> pd.Series:
         r"""Duration of files in the database.
 
@@ -377,8 +459,14 @@ class Database(HeaderBase):
         .. note:: Durations are cached,
             i.e. changing the files on disk after calling
             this function can lead to wrong results.
-            The cache is cleared when the
-            database is reloaded from disk.
+            When the database is saved,
+            durations of files under its root
+            are stored to
+            ``<root>/.<name>.files_duration.parquet``,
+            together with size and modification time of the files.
+            When the database is loaded,
+            the stored durations are reused
+            for all files that have not changed since.
 
         Args:
             files: file names
@@ -386,6 +474,10 @@ class Database(HeaderBase):
                 Provide if file names are relative and
                 database was not saved or loaded from disk.
                 If ``None`` :attr:`audformat.Database.root` is used
+            num_workers: number of parallel jobs.
+                If ``None`` will be set to the number of processors
+                on the machine multiplied by 5
+            verbose: show progress bar
 
         Returns:
             mapping from file to duration
@@ -399,8 +491,7 @@ class Database(HeaderBase):
         """
         root = root or self.root
 
-        def duration(file: str) -> pd.Timedelta:
-            # expand file path
+        def full_path(file: str) -> str:
             if os.path.isabs(file):
                 full_file = file
             else:
@@ -413,9 +504,10 @@ class Database(HeaderBase):
                         f"provide a root folder."
                     )
                 full_file = os.path.join(root, file)
+            return audeer.path(full_file)
 
+        def duration(full_file: str) -> pd.Timedelta:
             # check cache
-            full_file = audeer.path(full_file)
             if full_file in self._files_duration:
                 return self._files_duration[full_file]
 
@@ -427,11 +519,24 @@ class Database(HeaderBase):
             return dur
 
         files = audeer.to_list(files)
+        full_files = [full_path(file) for file in files]
+
+        # Read duration only once per file
+        unique_files = list(dict.fromkeys(full_files))
+        durs = audeer.run_tasks(
+            duration,
+            params=[([file], {}) for file in unique_files],
+            num_workers=num_workers,
+            progress_bar=verbose,
+            task_description="Read duration",
+        )
+        durs = dict(zip(unique_files, durs))
+
         y = pd.Series(
-            files,
+            full_files,
             index=files,
             name=define.IndexField.FILE,
-        ).map(duration)
+        ).map(durs)
 
         return y
 
@@ -445,7 +550,9 @@ class Database(HeaderBase):
         strict: bool = False,
         map: bool = True,
         original_column_names: bool = False,
-        aggregate_function: typing.Callable[[pd.Series], typing.Any] = None,
+        aggregate_function: typing.Union[
+            str, typing.Callable[[pd.Series], typing.Any]
+        ] = None,
         aggregate_strategy: str = "mismatch",
     ) -> pd.DataFrame:
         r"""Get labels by scheme.
@@ -511,7 +618,10 @@ class Database(HeaderBase):
                 to average the values
                 or to
                 ``tuple``
-                to return them as a tuple
+                to return them as a tuple.
+                Or the name of a built-in aggregation,
+                see :func:`audformat.utils.concat`,
+                e.g. ``'majority_vote'``
             aggregate_strategy: if ``aggregate_function`` is not ``None``,
                 ``aggregate_strategy`` decides
                 when ``aggregate_function`` is applied.
@@ -527,6 +637,8 @@ class Database(HeaderBase):
         Raises:
             ValueError: if different labels are found
                 for a requested scheme under the same index entry
+            ValueError: if ``aggregate_function`` is not a valid
+                name of a built-in aggregation
             ValueError: if ``original_column_names`` is ``True``
                 and two columns in the returned data frame
                 have the same name
@@ -682,20 +794,6 @@ class Database(HeaderBase):
 
         """  # noqa: E501
 
-        def append_series(ys, y, column_id):
-            if y is not None:
-                if original_column_names:
-                    y.name = column_id
-                ys.append(y)
-
-        def dtypes_of_categories(objs):
-            dtypes = [
-                obj.dtype.categories.dtype
-                for obj in objs
-                if isinstance(obj.dtype, pd.CategoricalDtype)
-            ]
-            return sorted(list(set(dtypes)))
-
         def empty_frame(name):
             return pd.DataFrame(
                 {name: []},
@@ -703,23 +801,6 @@ class Database(HeaderBase):
                 dtype="object",
             )
 
-        def empty_series(name):
-            return pd.Series(
-                index=filewise_index(),
-                dtype="object",
-                name=name,
-            )
-
-        def scheme_in_column(scheme_id, column, column_id):
-            # Check if scheme_id
-            # is attached to a column,
-            # or identical with the column name
-            return (
-                scheme_id == column_id
-                and not strict
-                or (column.scheme_id is not None and scheme_id == column.scheme_id)
-            )
-
         requested_scheme = scheme
         additional_schemes = audeer.to_list(additional_schemes)
 
@@ -730,113 +811,33 @@ class Database(HeaderBase):
         if splits is not None:
             splits = audeer.to_list(splits)
 
-        # --- Check if requested scheme is stored as label in other schemes
-        scheme_mappings = []
-        for scheme_id, scheme in self.schemes.items():
-            # Labels stored as misc table
-            if scheme.uses_table and scheme_id in self.misc_tables:
-                for column_id, column in self[scheme_id].columns.items():
-                    if scheme_in_column(
-                        requested_scheme,
-                        column,
-                        column_id,
-                    ):
-                        scheme_mappings.append((scheme_id, column_id))
-
-            # Labels stored in scheme
-            elif (
-                not strict
-                and isinstance(scheme.labels, dict)
-                # Skip simple mappings like {'a0': 'a text'}
-                and isinstance(list(scheme.labels.values())[0], dict)
-            ):
-                labels = pd.DataFrame.from_dict(
-                    scheme.labels,
-                    orient="index",
-                )
-                if requested_scheme in labels:
-                    scheme_mappings.append((scheme_id, requested_scheme))
+        if self._cache is not None:
+            key = (
+                "get",
+                requested_scheme,
+                tuple(additional_schemes),
+                tuple(tables),
+                None if splits is None else tuple(splits),
+                strict,
+                map,
+                original_column_names,
+                aggregate_function,
+                aggregate_strategy,
+                self._version,
+            )
+            obj = self._cache.get(key)
+            if obj is not None:
+                return obj
 
         # --- Get data for requested schemes
-        ys = []
-        for table_id in tables:
-            # Handle non-existing tables
-            if table_id not in self.tables:
-                continue
-            else:
-                table = self[table_id]
-
-            # Limit search by split
-            if splits is not None and table.split_id not in splits:
-                continue
-
-            for column_id, column in table.columns.items():
-                y = None
-                # Scheme directly stored in column
-                if scheme_in_column(requested_scheme, column, column_id):
-                    if requested_scheme in self.schemes:
-                        labels = self.schemes[requested_scheme].labels
-                    # If map=True we want to expand scheme labels like
-                    # {'a': 'Full a', 'b': 'Full b'},
-                    # nut not scheme labels like
-                    # {'a': {'d': 1}, 'b': {'d': 2}}
-                    if (
-                        map is True
-                        and requested_scheme in self.schemes
-                        and isinstance(labels, dict)
-                        # Ensure simple mappings like {'a0': 'a text'}
-                        and not isinstance(list(labels.values())[0], dict)
-                        # map=requested_scheme can only be performed
-                        # if scheme is assigned
-                        and column.scheme_id == requested_scheme
-                    ):
-                        y = column.get(map=requested_scheme)
-                    else:
-                        y = column.get()
-                    y.name = requested_scheme
-                    append_series(ys, y, column_id)
-                # Get series based on label of scheme
-                else:
-                    for scheme_id, mapping in scheme_mappings:
-                        if scheme_in_column(scheme_id, column, column_id):
-                            if column.scheme_id is None:
-                                y = empty_series(requested_scheme)
-                            else:
-                                y = column.get(map=mapping)
-                                y.name = requested_scheme
-                            append_series(ys, y, column_id)
-
-        # --- Ensure we have a common dtype for requested scheme
-        dtypes = dtypes_of_categories(ys)
-        if len(dtypes) > 0:
-            if len(dtypes) > 1:
-                # Don't know if this can ever be triggered,
-                # but make sure we raise the same error as
-                # pd.api.types.union_categoricals
-                raise TypeError(  # pragma: nocover
-                    f"Cannot join labels for scheme '{requested_scheme}' "
-                    "with different data types: "
-                    f"{', '.join(dtypes)}"
-                )
-            dtype = dtypes[0]
-            # Convert everything to categorical data
-            for n, y in enumerate(ys):
-                if not isinstance(y.dtype, pd.CategoricalDtype):
-                    ys[n] = y.astype(
-                        pd.CategoricalDtype(y.array.dropna().unique().astype(dtype))
-                    )
-            # Find union of categorical data
-            data = [y.array for y in ys]
-            try:
-                data = pd.api.types.union_categoricals(data)
-            except TypeError:
-                dtypes = [str(dtype) for dtype in dtypes_of_categories(data)]
-                raise TypeError(
-                    f"Cannot join labels for scheme '{requested_scheme}' "
-                    "with different data types: "
-                    f"{', '.join(dtypes)}"
-                )
-            ys = [y.astype(data.dtype) for y in ys]
+        ys = self._get_labels(
+            requested_scheme,
+            tables,
+            splits,
+            strict,
+            map,
+            original_column_names,
+        )
 
         # --- Combine all labels
         index = utils.union([y.index for y in ys])
@@ -853,6 +854,11 @@ class Database(HeaderBase):
             obj = obj.to_frame()
 
         # --- Append additional schemes
+        # Labels of every additional scheme
+        # are only combined among themselves,
+        # before all schemes are aligned
+        # to the index of the requested scheme
+        # with a single call to utils.concat()
         objs = [obj]
         for scheme in additional_schemes:
             if len(obj) == 0:
@@ -860,13 +866,20 @@ class Database(HeaderBase):
                 # if main scheme does return empty frame
                 additional_obj = empty_frame(scheme)
             else:
-                additional_obj = self.get(
+                ys = self._get_labels(
                     scheme,
-                    strict=strict,
-                    map=map,
-                    original_column_names=original_column_names,
+                    list(self.tables),
+                    None,
+                    strict,
+                    map,
+                    original_column_names,
+                )
+                additional_obj = utils.concat(
+                    ys,
                     aggregate_function=aggregate_function,
                 )
+                if len(additional_obj) == 0:
+                    additional_obj = empty_frame(scheme)
             objs.append(additional_obj)
         if len(objs) > 1:
             obj = utils.concat(objs)
@@ -874,8 +887,93 @@ class Database(HeaderBase):
             if len(obj) == 0:
                 obj.index = filewise_index()
 
+        if self._cache is not None:
+            self._cache.put(key, obj)
+
         return obj
 
+    def iter_batches(
+        self,
+        scheme: str,
+        *,
+        tables: typing.Union[str, typing.Sequence[str]] = None,
+        splits: typing.Union[str, typing.Sequence[str]] = None,
+        strict: bool = False,
+        original_column_names: bool = False,
+        batch_size: int = 65536,
+    ) -> typing.Iterator[pd.DataFrame]:
+        r"""Iterate over labels of scheme in batches of rows.
+
+        Streaming counterpart of :meth:`audformat.Database.get`
+        for labels that are directly stored in columns.
+        Columns are selected if they are assigned to the scheme,
+        or if their ID matches the scheme ID
+        and ``strict`` is ``False``.
+        The labels of every selected column
+        are returned batch by batch
+        using :meth:`audformat.Table.iter_batches`,
+        i.e. they are streamed from PARQUET files
+        when the database was loaded with ``load_data=False``.
+
+        In contrast to :meth:`audformat.Database.get`,
+        labels are neither mapped
+        nor combined across columns or tables,
+        so the same index entry might be returned
+        in several batches.
+
+        Args:
+            scheme: scheme ID
+            tables: limit search for ``scheme`` to selected tables
+            splits: limit search for ``scheme`` to selected splits
+            strict: if ``False``
+                columns with an ID matching ``scheme``
+                are selected as well,
+                even if they are not assigned to the scheme
+            original_column_names: if ``True``
+                keep the original column names
+                instead of renaming them to ``scheme``
+            batch_size: maximum number of rows per batch
+
+        Returns:
+            iterator over labels of batches of rows
+
+        Raises:
+            ValueError: if ``batch_size`` is smaller than 1
+
+        """
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' has to be at least 1, but is {batch_size}.")
+        if tables is None:
+            tables = list(self.tables)
+        else:
+            tables = audeer.to_list(tables)
+        if splits is not None:
+            splits = audeer.to_list(splits)
+
+        selected = []
+        for table_id in tables:
+            # Handle non-existing tables
+            if table_id not in self.tables:
+                continue
+            table = self[table_id]
+
+            # Limit search by split
+            if splits is not None and table.split_id not in splits:
+                continue
+
+            for column_id, column in table.columns.items():
+                if (scheme == column_id and not strict) or (
+                    column.scheme_id is not None and scheme == column.scheme_id
+                ):
+                    name = column_id if original_column_names else scheme
+                    selected.append((table, column_id, name))
+
+        return (
+            df.rename(columns={column_id: name})
+            for table, column_id, name in selected
+            for df in table.iter_batches(batch_size, columns=column_id)
+        )
+
     def map_files(
         self,
         func: typing.Callable[[str], str],
@@ -972,18 +1070,40 @@ class Database(HeaderBase):
         indent: int = 2,
         storage_format: str = define.TableStorageFormat.PARQUET,
         update_other_formats: bool = True,
+        parquet_options: typing.Dict[str, typing.Any] = None,
         header_only: bool = False,
         num_workers: typing.Optional[int] = 1,
         verbose: bool = False,
-    ):
+    ) -> typing.List[str]:
         r"""Save database to disk.
 
         Creates a header ``<root>/<name>.yaml``
-        and for every table a file ``<root>/<name>.<table-id>.[csv,parquet,pkl]``.
+        and for every table a file
+        ``<root>/<name>.<table-id>.[csv,feather,parquet,pkl]``.
+        Tables are only written
+        if their files do not exist yet,
+        or the table data changed
+        since it was loaded from or saved to the files.
+        Changes are detected with :func:`audformat.utils.hash`,
+        which is stored in the PARQUET or FEATHER file of a table.
+        Tables stored only as CSV or PKL files
+        are always written.
+        Tables loaded from disk are always written
+        the first time the database is saved,
+        if no hash is stored in the PARQUET file of the table,
+        or a CSV file of the table exists.
+        If durations of files under ``root`` are cached,
+        see :meth:`audformat.Database.files_duration`,
+        they are stored to ``<root>/.<name>.files_duration.parquet``.
 
         Existing files will be overwritten.
         If ``update_other_formats`` is provided,
         it will overwrite all existing files in others formats as well.
+        Every file is first written to a temporary file
+        in the same folder,
+        which is then renamed,
+        so that a file is never partially written.
+        The header is written last.
 
         Args:
             root: root directory (possibly created)
@@ -995,33 +1115,58 @@ class Database(HeaderBase):
             update_other_formats: if ``True`` it will not only save
                 to the given ``storage_format``,
                 but update all files stored in other storage formats as well
+            parquet_options: options for writing PARQUET files of tables,
+                e.g. ``{"compression": "zstd", "sort_by_file": True}``.
+                The options are stored
+                in the metadata of every written PARQUET file.
+                If ``None``,
+                the options of an existing PARQUET file of a table are used.
+                See :meth:`audformat.Table.save`
+                for supported options
             header_only: store header only
             num_workers: number of parallel jobs.
                 If ``None`` will be set to the number of processors
                 on the machine multiplied by 5
             verbose: show progress bar
 
+        Returns:
+            IDs of (misc) tables that were written
+
+        Raises:
+            RuntimeError: if a table was loaded
+                with selected columns or files,
+                see :meth:`audformat.Database.load`
+            ValueError: if ``parquet_options`` contains unknown keys
+
         """
+        _assert_parquet_options(parquet_options)
+        for table in self.tables.values():
+            table._assert_not_partially_loaded()
         root = audeer.path(root, follow_symlink=True)
         audeer.mkdir(root)
 
-        ext = ".yaml"
-        header_path = os.path.join(root, name + ext)
-        with open(header_path, "w") as fp:
-            self.dump(fp, indent=indent)
-
+        table_ids = []
         if not header_only:
             # Store (misc) tables
             def job(obj_id, obj):
                 path = os.path.join(root, f"{name}.{obj_id}")
+                if obj._is_saved(
+                    path,
+                    storage_format,
+                    update_other_formats,
+                    parquet_options,
+                ):
+                    return None
                 obj.save(
                     path,
                     storage_format=storage_format,
                     update_other_formats=update_other_formats,
+                    parquet_options=parquet_options,
                 )
+                return obj_id
 
             objs = {**self.tables, **self.misc_tables}
-            audeer.run_tasks(
+            table_ids = audeer.run_tasks(
                 job,
                 params=[([obj_id, obj], {}) for obj_id, obj in objs.items()],
                 num_workers=num_workers,
@@ -1029,9 +1174,24 @@ class Database(HeaderBase):
                 task_description="Save tables",
             )
 
+            # Store durations of files
+            path = os.path.join(root, f".{name}.files_duration.parquet")
+            self._files_duration.save(path, root)
+
+        # Store header last,
+        # so that it never references tables
+        # that are not completely written
+        ext = ".yaml"
+        header_path = os.path.join(root, name + ext)
+        with atomic_path(header_path) as tmp_path:
+            with open(tmp_path, "w") as fp:
+                self.dump(fp, indent=indent)
+
         self._name = name
         self._root = root
 
+        return [table_id for table_id in table_ids if table_id is not None]
+
     def update(
         self,
         others: typing.Union["Database", typing.Sequence["Database"]],
@@ -1293,6 +1453,59 @@ class Database(HeaderBase):
 
         return self
 
+    def validate(self):
+        r"""Check that values of all tables match their schemes.
+
+        Values of columns that are assigned to a scheme
+        are checked against the labels,
+        or the minimum and maximum value
+        of the scheme.
+        :meth:`audformat.Column.set` checks values
+        when they are assigned,
+        whereas this checks all tables at once,
+        e.g. after changing :attr:`audformat.Table.df`
+        or :attr:`audformat.MiscTable.df` directly.
+
+        Raises:
+            ValueError: if values of a column do not match its scheme
+
+        Examples:
+            >>> db = Database("mydb")
+            >>> db.schemes["rating"] = Scheme("int", minimum=0, maximum=5)
+            >>> db["table"] = Table(filewise_index(["f1", "f2"]))
+            >>> db["table"]["rating"] = Column(scheme_id="rating")
+            >>> db["table"]["rating"].set([1, 3])
+            >>> db.validate()
+            >>> db["table"].df["rating"] = [1, 6]
+            >>> db.validate()
+            Traceback (most recent call last):
+                ...
+            ValueError: Column 'rating' of table 'table' does not match its scheme.
+            Some value(s) do not match scheme
+            {dtype: int, minimum: 0, maximum: 5}
+            with scheme ID 'rating':
+            6
+
+        """
+        for table_id, table in itertools.chain(
+            self.tables.items(),
+            self.misc_tables.items(),
+        ):
+            for column_id, column in table.columns.items():
+                if column.scheme_id is None:
+                    continue
+                try:
+                    assert_values(
+                        table.df[column_id],
+                        self.schemes[column.scheme_id],
+                    )
+                except ValueError as ex:
+                    raise ValueError(
+                        f"Column '{column_id}' of table '{table_id}' "
+                        f"does not match its scheme.\n"
+                        f"{ex}"
+                    ) from ex
+
     def __contains__(
         self,
         table_id: str,
@@ -1333,10 +1546,12 @@ class Database(HeaderBase):
         other: "Database",
     ) -> bool:
         r"""Comparison if database equals another database."""
-        if self.dump() != other.dump():
+        # Header of database includes headers of tables,
+        # so only table data is compared afterwards
+        if self._structure() != other._structure():
             return False
         for table_id in list(self.tables) + list(self.misc_tables):
-            if self[table_id] != other[table_id]:
+            if not self[table_id].df.equals(other[table_id].df):
                 return False
         return True
 
@@ -1377,14 +1592,23 @@ class Database(HeaderBase):
         *,
         name: str = "db",
         load_data: bool = False,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
+        files: typing.Union[str, typing.Sequence[str]] = None,
+        memory_map: bool = False,
+        cache_root: str = None,
         num_workers: typing.Optional[int] = 1,
         verbose: bool = False,
     ) -> "Database":
         r"""Load database from disk.
 
         Expects a header ``<root>/<name>.yaml``
-        and for every table a file ``<root>/<name>.<table-id>.[csv|parquet|pkl]``
+        and for every table a file
+        ``<root>/<name>.<table-id>.[csv|feather|parquet|pkl]``.
         Media files should be located under ``root``.
+        Cached file durations are loaded
+        from ``<root>/.<name>.files_duration.parquet``
+        if present,
+        see :meth:`audformat.Database.files_duration`.
 
         Args:
             root: root directory
@@ -1398,6 +1622,52 @@ class Database(HeaderBase):
                 Set to ``True`` to load all
                 :class:`audformat.Table`
                 data immediately
+            columns: only load selected columns
+                of :class:`audformat.Table` objects.
+                All other columns are removed from the tables.
+                Column IDs that are not part of a table are ignored.
+                If table data is stored as PARQUET,
+                other columns are not read from disk.
+                Tables loaded with selected columns
+                cannot be saved
+            files: only load rows of selected files
+                of :class:`audformat.Table` objects.
+                If table data is stored as PARQUET,
+                row groups that do not contain
+                any of the selected files
+                are not read from disk.
+                Tables loaded with selected files
+                cannot be saved
+            memory_map: if ``True``
+                and ``load_data`` is ``False``,
+                table data read from a FEATHER or PARQUET file
+                is memory-mapped
+                and only the columns and rows requested by
+                :meth:`audformat.Column.get`,
+                :meth:`audformat.Table.get`,
+                or :meth:`audformat.Database.get`
+                are converted to a dataframe,
+                without keeping the table data in memory.
+                Processes reading the same database
+                share the memory-mapped files
+                via the page cache of the operating system.
+                Accessing ``df`` of a table
+                still loads its data into memory.
+                Tables read from a CSV or PKL file,
+                e.g. as a PKL file is newer
+                than the FEATHER or PARQUET file,
+                are not memory-mapped,
+                but loaded into memory on first access
+            cache_root: if not ``None``,
+                the parsed header is cached
+                in a pickle file inside this folder,
+                named after the MD5 sum of the header file.
+                As parsing a large header is slow,
+                loading the same header again
+                reads the cached header instead.
+                Only use a folder
+                that cannot be written by others,
+                as the cached header is unpickled
             num_workers: number of parallel jobs.
                 If ``None`` will be set to the number of processors
                 on the machine multiplied by 5
@@ -1409,8 +1679,10 @@ class Database(HeaderBase):
         Raises:
             FileNotFoundError: if the database header file cannot be found
                 under ``root``
-            RuntimeError: if a CSV or PARQUET table file is newer
-                than the corresponding PKL file
+            RuntimeError: if a CSV, FEATHER or PARQUET table file is newer
+                than the corresponding PKL file,
+                or a CSV or PARQUET table file is newer
+                than the corresponding FEATHER file
 
         """
         ext = ".yaml"
@@ -1420,42 +1692,58 @@ class Database(HeaderBase):
         if not os.path.exists(path):
             raise FileNotFoundError(path)
 
-        with open(path, "r") as fp:
-            header = yaml.load(fp, Loader=Loader)
-            db = Database.load_header_from_yaml(header)
+        header = _load_header(path, cache_root)
+        db = Database.load_header_from_yaml(header)
 
-            params = []
-            table_ids = []
+        params = []
+        table_ids = []
 
-            if "tables" in header and header["tables"]:
-                for table_id in header["tables"]:
-                    table_ids.append(table_id)
+        if "tables" in header and header["tables"]:
+            for table_id in header["tables"]:
+                table_ids.append(table_id)
 
-            if "misc_tables" in header and header["misc_tables"]:
-                for table_id in header["misc_tables"]:
-                    table_ids.append(table_id)
+        if "misc_tables" in header and header["misc_tables"]:
+            for table_id in header["misc_tables"]:
+                table_ids.append(table_id)
 
-            for table_id in table_ids:
-                table = db[table_id]
-                if load_data:
-                    table_path = os.path.join(root, name + "." + table_id)
-                    params.append(([table, table_path], {}))
-                else:
-                    table._df = None
+        for table_id in table_ids:
+            table = db[table_id]
+            # Selection of columns and files
+            # is only applied to tables,
+            # but not to misc tables
+            kwargs = {}
+            if table_id in db.tables:
+                kwargs = {"columns": columns, "files": files}
+                table._partially_loaded = columns is not None or files is not None
+            if load_data:
+                table_path = os.path.join(root, name + "." + table_id)
+                params.append(([table, table_path], kwargs))
+            else:
+                if table_id in db.tables:
+                    if columns is not None:
+                        table._remove_other_columns(columns)
+                    table._load_columns = columns
+                    table._load_files = files
+                table._memory_map = memory_map
+                table._df = None
 
-            if params:
+        if params:
 
-                def job(obj, obj_path):
-                    obj.load(obj_path)
+            def job(obj, obj_path, **kwargs):
+                obj.load(obj_path, **kwargs)
 
-                # load all objects into memory
-                audeer.run_tasks(
-                    job,
-                    params=params,
-                    num_workers=num_workers,
-                    progress_bar=verbose,
-                    task_description="Load tables",
-                )
+            # load all objects into memory
+            audeer.run_tasks(
+                job,
+                params=params,
+                num_workers=num_workers,
+                progress_bar=verbose,
+                task_description="Load tables",
+            )
+
+        path = os.path.join(root, f".{name}.files_duration.parquet")
+        if os.path.exists(path):
+            db._files_duration.load(path, root)
 
         db._name = name
         db._root = root
@@ -1553,12 +1841,8 @@ class Database(HeaderBase):
             for scheme_id, scheme in misc_table_schemes.items():
                 db.schemes[scheme_id] = scheme
             # restore order of scheme IDs
-            order = list(header["schemes"])
             db.schemes = HeaderDict(
-                sorted(
-                    db.schemes.items(),
-                    key=lambda item: order.index(item[0]),
-                ),
+                [(scheme_id, db.schemes[scheme_id]) for scheme_id in header["schemes"]],
                 value_type=Scheme,
                 set_callback=db._set_scheme,
             )
@@ -1590,6 +1874,219 @@ class Database(HeaderBase):
 
         return db
 
+    def _del_item(self, item_id: str):
+        # Scheme or (misc) table was removed
+        self._version = next_version()
+
+    def _get_labels(
+        self,
+        scheme: str,
+        tables: typing.Sequence[str],
+        splits: typing.Optional[typing.Sequence[str]],
+        strict: bool,
+        map: bool,
+        original_column_names: bool,
+    ) -> typing.List[pd.Series]:
+        r"""Collect labels of scheme from columns.
+
+        Helper function for :meth:`audformat.Database.get`,
+        which returns the labels of every matching column
+        with a common categorical data type.
+
+        Args:
+            scheme: scheme ID
+            tables: search for ``scheme`` in selected tables
+            splits: limit search for ``scheme`` to selected splits
+            strict: see :meth:`audformat.Database.get`
+            map: see :meth:`audformat.Database.get`
+            original_column_names: see :meth:`audformat.Database.get`
+
+        Returns:
+            labels of matching columns
+
+        Raises:
+            TypeError: if labels of different data type are found
+
+        """
+
+        def dtypes_of_categories(objs):
+            dtypes = [
+                obj.dtype.categories.dtype
+                for obj in objs
+                if isinstance(obj.dtype, pd.CategoricalDtype)
+            ]
+            return sorted(list(set(dtypes)))
+
+        def empty_series(name):
+            return pd.Series(
+                index=filewise_index(),
+                dtype="object",
+                name=name,
+            )
+
+        # --- Get data for requested scheme
+        sources = self._get_scheme_sources(scheme, strict)
+        ys = []
+        for table_id in tables:
+            # Handle non-existing tables
+            if table_id not in self.tables or table_id not in sources:
+                continue
+            else:
+                table = self[table_id]
+
+            # Limit search by split
+            if splits is not None and table.split_id not in splits:
+                continue
+
+            for column_id, mapping in sources[table_id]:
+                column = table.columns[column_id]
+                # Scheme directly stored in column
+                if mapping is None:
+                    if scheme in self.schemes:
+                        labels = self.schemes[scheme].labels
+                    # If map=True we want to expand scheme labels like
+                    # {'a': 'Full a', 'b': 'Full b'},
+                    # nut not scheme labels like
+                    # {'a': {'d': 1}, 'b': {'d': 2}}
+                    if (
+                        map is True
+                        and scheme in self.schemes
+                        and isinstance(labels, dict)
+                        # Ensure simple mappings like {'a0': 'a text'}
+                        and not isinstance(list(labels.values())[0], dict)
+                        # map=scheme can only be performed
+                        # if scheme is assigned
+                        and column.scheme_id == scheme
+                    ):
+                        y = column.get(map=scheme)
+                    else:
+                        y = column.get()
+                    y.name = scheme
+                # Get series based on label of scheme
+                elif column.scheme_id is None:
+                    y = empty_series(scheme)
+                else:
+                    y = column.get(map=mapping)
+                    y.name = scheme
+                if original_column_names:
+                    y.name = column_id
+                ys.append(y)
+
+        # --- Ensure we have a common dtype for requested scheme
+        dtypes = dtypes_of_categories(ys)
+        if len(dtypes) > 0:
+            if len(dtypes) > 1:
+                # Don't know if this can ever be triggered,
+                # but make sure we raise the same error as
+                # pd.api.types.union_categoricals
+                raise TypeError(  # pragma: nocover
+                    f"Cannot join labels for scheme '{scheme}' "
+                    "with different data types: "
+                    f"{', '.join(dtypes)}"
+                )
+            dtype = dtypes[0]
+            # Convert everything to categorical data
+            for n, y in enumerate(ys):
+                if not isinstance(y.dtype, pd.CategoricalDtype):
+                    ys[n] = y.astype(
+                        pd.CategoricalDtype(y.array.dropna().unique().astype(dtype))
+                    )
+            # Find union of categorical data
+            data = [y.array for y in ys]
+            try:
+                data = pd.api.types.union_categoricals(data)
+            except TypeError:
+                dtypes = [str(dtype) for dtype in dtypes_of_categories(data)]
+                raise TypeError(
+                    f"Cannot join labels for scheme '{scheme}' "
+                    "with different data types: "
+                    f"{', '.join(dtypes)}"
+                )
+            ys = [y.astype(data.dtype) for y in ys]
+
+        return ys
+
+    def _get_scheme_sources(
+        self,
+        scheme_id: str,
+        strict: bool,
+    ) -> typing.Dict[str, typing.List[typing.Tuple[str, typing.Optional[str]]]]:
+        r"""Columns providing labels for a scheme.
+
+        Scheme IDs are resolved once
+        and cached until the version of the database changes,
+        i.e. when schemes, tables, or columns
+        are added or removed,
+        scheme labels are replaced,
+        or a column is assigned to another scheme.
+
+        Args:
+            scheme_id: scheme ID, column ID, or label key
+            strict: if ``True``,
+                match only columns assigned to the scheme
+
+        Returns:
+            dictionary with table IDs as keys
+            and lists of column ID and label mapping
+            as values.
+            The mapping is ``None``
+            if the column stores the scheme directly
+
+        """
+        if self._version != self._scheme_sources_version:
+            self._scheme_sources = {}
+            self._scheme_sources_version = self._version
+        key = (scheme_id, strict)
+        if key in self._scheme_sources:
+            return self._scheme_sources[key]
+
+        def scheme_in_column(scheme_id, column, column_id):
+            # Check if scheme_id
+            # is attached to a column,
+            # or identical with the column name
+            return (
+                scheme_id == column_id
+                and not strict
+                or (column.scheme_id is not None and scheme_id == column.scheme_id)
+            )
+
+        # --- Check if scheme is stored as label in other schemes
+        scheme_mappings = []
+        for other_id, scheme in self.schemes.items():
+            # Labels stored as misc table
+            if scheme.uses_table and other_id in self.misc_tables:
+                for column_id, column in self[other_id].columns.items():
+                    if scheme_in_column(scheme_id, column, column_id):
+                        scheme_mappings.append((other_id, column_id))
+
+            # Labels stored in scheme
+            elif (
+                not strict
+                and isinstance(scheme.labels, dict)
+                # Skip simple mappings like {'a0': 'a text'}
+                and isinstance(list(scheme.labels.values())[0], dict)
+                and any(scheme_id in label for label in scheme.labels.values())
+            ):
+                scheme_mappings.append((other_id, scheme_id))
+
+        # --- Find columns with scheme
+        sources = {}
+        for table_id, table in self.tables.items():
+            for column_id, column in table.columns.items():
+                if scheme_in_column(scheme_id, column, column_id):
+                    matches = [(column_id, None)]
+                else:
+                    matches = [
+                        (column_id, mapping)
+                        for other_id, mapping in scheme_mappings
+                        if scheme_in_column(other_id, column, column_id)
+                    ]
+                if matches:
+                    sources.setdefault(table_id, []).extend(matches)
+
+        self._scheme_sources[key] = sources
+        return sources
+
     def _set_attachment(
         self,
         attachment_id: str,
@@ -1608,6 +2105,7 @@ class Database(HeaderBase):
     ) -> Scheme:
         scheme._db = self
         scheme._id = scheme_id
+        self._version = next_version()
         if hasattr(scheme, "labels") and scheme.labels is not None:
             scheme._check_labels(scheme.labels)
         return scheme
@@ -1627,4 +2125,57 @@ class Database(HeaderBase):
             raise BadIdError("media", table.media_id, self.media)
         table._db = self
         table._id = table_id
+        self._version = next_version()
         return table
+
+
+def _load_header(path: str, cache_root: typing.Optional[str]) -> dict:
+    r"""Load header from YAML file.
+
+    If ``cache_root`` is given,
+    the parsed header is cached as a pickle file
+    named after the MD5 sum of the YAML file.
+    As the MD5 sum is calculated
+    before any file is unpickled,
+    a cached header is only used
+    for a YAML file with the same content.
+
+    Args:
+        path: path to YAML file
+        cache_root: folder of cached headers
+
+    Returns:
+        header
+
+    """
+    with open(path, "rb") as fp:
+        content = fp.read()
+    if cache_root is None:
+        return yaml.load(content, Loader=Loader)
+
+    md5 = hashlib.md5(content).hexdigest()
+    cache_path = audeer.path(cache_root, f"{md5}.pkl")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as fp:
+                return pickle.load(fp)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # Ignore broken cache
+            pass
+
+    header = yaml.load(content, Loader=Loader)
+
+    try:
+        audeer.mkdir(cache_root)
+        with atomic_path(cache_path) as tmp_path:
+            with open(tmp_path, "wb") as fp:
+                pickle.dump(
+                    header,
+                    fp,
+                    protocol=4,  # supported by Python >= 3.4
+                )
+    except OSError:
+        # Cache is optional
+        pass
+
+    return header
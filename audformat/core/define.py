@@ -310,7 +310,7 @@ class TableStorageFormat(DefineBase):
 
     Specifies string values
     used as file extensions
-    of the CSV and PKL files
+    of the files
     that are used to store
     a table or misc table.
     Those string values
@@ -337,6 +337,15 @@ class TableStorageFormat(DefineBase):
     CSV = "csv"
     """File extension for tables stored in CSV format."""
 
+    FEATHER = "feather"
+    """File extension for tables stored in Arrow IPC (FEATHER) format.
+
+    Tables are stored uncompressed,
+    so they can be memory-mapped
+    when loaded with ``memory_map=True``.
+
+    """
+
     PARQUET = "parquet"
     """File extension for tables stored in PARQUET format."""
 
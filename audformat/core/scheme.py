@@ -1,8 +1,11 @@
 import datetime
+import hashlib
+import pickle
 import random
 import string
 import typing
 
+import numpy as np
 import pandas as pd
 
 from audformat.core import common
@@ -117,6 +120,8 @@ class Scheme(common.HeaderBase):
 
         self._db = None
         self._id = None
+        self._mapping = None
+        self._mapping_key = None
 
         if dtype is not None:
             if dtype in self._dtypes:
@@ -441,6 +446,38 @@ class Scheme(common.HeaderBase):
                     f"'{dtype_labels}'."
                 )
 
+    def _contains_values(
+        self,
+        values: pd.Series,
+    ) -> np.ndarray:
+        r"""Check for every value if it is covered by scheme.
+
+        Vectorized version of :meth:`Scheme.__contains__`.
+        Values are compared with the current labels,
+        including labels changed in place.
+
+        Returns:
+            boolean array
+
+        """
+        if self.labels is not None:
+            if not isinstance(self.labels, str):
+                labels = list(self.labels)
+            elif self._db is not None and self.labels in self._db:
+                labels = self._db[self.labels].index
+            else:
+                labels = []
+            return values.isna().to_numpy() | values.isin(labels).to_numpy()
+        contained = np.ones(len(values), dtype=bool)
+        if self.is_numeric:
+            numbers = values.to_numpy(dtype="float", na_value=np.nan)
+            if self.minimum is not None:
+                contained &= numbers >= self.minimum
+            if self.maximum is not None:
+                contained &= numbers <= self.maximum
+            contained |= values.isna().to_numpy()
+        return contained
+
     def _dtype_from_labels(
         self,
         labels: typing.Union[dict, list, str],
@@ -469,6 +506,34 @@ class Scheme(common.HeaderBase):
 
         return dtype
 
+    def _label_mapping(self) -> typing.Optional["LabelMapping"]:
+        r"""Return compiled mapping of labels.
+
+        The mapping is cached
+        until the content of the labels changes,
+        so that labels changed in place,
+        e.g. entries of a label dictionary
+        or values of the misc table holding the labels,
+        are detected as well.
+        Labels of a misc table
+        are compared by a hash of the table data.
+
+        """
+        if self.labels is None:
+            return None
+        if isinstance(self.labels, str):
+            key = (self.labels,)
+            if self._db is not None and self.labels in self._db:
+                df = self._db[self.labels].df
+                md5 = hashlib.md5(pd.util.hash_pandas_object(df).to_numpy())
+                key += (tuple(df.columns), md5.hexdigest())
+        else:
+            key = pickle.dumps(self.labels)
+        if self._mapping is None or self._mapping_key != key:
+            self._mapping = LabelMapping(self._labels_to_dict())
+            self._mapping_key = key
+        return self._mapping
+
     def _labels_to_dict(
         self,
         labels: typing.Union[dict, list, str] = None,
@@ -512,3 +577,85 @@ class Scheme(common.HeaderBase):
                 if self.maximum is not None and not item <= self.maximum:
                     return False
         return True
+
+    def __setattr__(self, name: str, value: typing.Any):
+        r"""Set attribute and track change of labels."""
+        super().__setattr__(name, value)
+        if name == "labels" and self._db is not None:
+            # Columns matching a scheme
+            # depend on the database version
+            self._db._version = common.next_version()
+
+
+class LabelMapping:
+    r"""Compiled mapping of scheme labels to label fields.
+
+    Holds the labels of a scheme as an index
+    and maps them once per field,
+    so that column values can be mapped
+    by their position in the index.
+
+    Args:
+        labels: labels as dictionary
+
+    Examples:
+        >>> mapping = LabelMapping({"a": {"x": 1}, "b": {"x": 2}})
+        >>> mapping.keys
+        ['x']
+        >>> mapping.values("x")
+        <IntegerArray>
+        [1, 2]
+        Length: 2, dtype: Int64
+
+    """
+
+    def __init__(
+        self,
+        labels: typing.Dict,
+    ):
+        self.index = pd.Index(list(labels))
+        r"""Labels"""
+        self.has_mapping = any(labels.values())
+        r"""If at least one label provides a mapping"""
+        keys = set()
+        for value in labels.values():
+            if isinstance(value, dict):
+                keys.update(value)
+        self.keys = sorted(keys)
+        r"""Available label fields"""
+
+        self._labels = labels
+        self._values = {}
+
+    def values(
+        self,
+        map: str,
+        dtype: typing.Union[str, pd.api.types.CategoricalDtype] = None,
+    ) -> pd.api.extensions.ExtensionArray:
+        r"""Values of label field in order of labels.
+
+        Labels that do not provide the field
+        are mapped to ``NaN``.
+
+        Args:
+            map: label field
+            dtype: :mod:`pandas` data type of values.
+                If ``None``
+                it is inferred from the values
+
+        Returns:
+            mapped labels
+
+        """
+        key = (map, dtype)
+        if key not in self._values:
+            values = []
+            for value in self._labels.values():
+                if isinstance(value, dict):
+                    value = value.get(map, np.nan)
+                values.append(value)
+            if dtype is None:
+                dtype = pd.api.types.infer_dtype(values)
+                dtype = common.to_pandas_dtype(common.to_audformat_dtype(dtype))
+            self._values[key] = pd.Series(values, dtype=object).astype(dtype).array
+        return self._values[key]
@@ -1,13 +1,18 @@
 from __future__ import annotations  # allow typing without string
 
+import bisect
 import copy
+import json
 import os
 import pickle
 import typing
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.csv as csv
+import pyarrow.feather as feather
 import pyarrow.parquet as parquet
 
 import audeer
@@ -17,6 +22,8 @@ from audformat.core import utils
 from audformat.core.column import Column
 from audformat.core.common import HeaderBase
 from audformat.core.common import HeaderDict
+from audformat.core.common import atomic_path
+from audformat.core.common import next_version
 from audformat.core.common import to_pandas_dtype
 from audformat.core.errors import BadIdError
 from audformat.core.index import filewise_index
@@ -50,12 +57,19 @@ class Base(HeaderBase):
             sort_by_key=False,
             value_type=Column,
             set_callback=self._set_column,
+            del_callback=self._del_column,
         )
         r"""Table columns"""
 
         self._df = pd.DataFrame(index=index)
         self._db = None
         self._id = None
+        self._load_columns = None
+        self._load_files = None
+        self._memory_map = False
+        self._partially_loaded = False
+        self._saved_state = None
+        self._version = next_version()
 
     def __add__(self, other: typing.Self) -> typing.Self:
         r"""Create new table by combining two tables.
@@ -115,7 +129,7 @@ class Base(HeaderBase):
         other: Base,
     ) -> bool:
         r"""Compare if table equals other table."""
-        if self.dump() != other.dump():
+        if self._structure() != other._structure():
             return False
         return self.df.equals(other.df)
 
@@ -123,6 +137,14 @@ class Base(HeaderBase):
         r"""Number of rows in table."""
         return len(self.df)
 
+    def __setattr__(self, name: str, value: typing.Any):
+        r"""Set attribute and track change of split."""
+        super().__setattr__(name, value)
+        if name == "split_id" and getattr(self, "_db", None) is not None:
+            # Selection of tables by split
+            # depends on the database version
+            self._db._version = next_version()
+
     def __setitem__(self, column_id: str, column: Column) -> Column:
         r"""Add new column to table.
 
@@ -199,7 +221,9 @@ class Base(HeaderBase):
             # if database was loaded with 'load_data=False'
             # we have to load the table data now
             path = os.path.join(self.db.root, f"{self.db._name}.{self._id}")
-            self.load(path)
+            self._load(path, columns=self._load_columns, files=self._load_files)
+            self._load_columns = None
+            self._load_files = None
         return self._df
 
     @property
@@ -284,6 +308,7 @@ class Base(HeaderBase):
         self.df.drop(column_ids_, inplace=True, axis="columns")
         for column_id in column_ids_:
             self.columns.pop(column_id)
+        self._update_version()
 
         return self
 
@@ -314,6 +339,7 @@ class Base(HeaderBase):
         index = utils.intersect([table.index, index])
         new_index = utils.difference([table.index, index])
         table._df = table.df.reindex(new_index)
+        table._update_version()
 
         if inplace:
             _maybe_update_scheme(table)
@@ -356,6 +382,7 @@ class Base(HeaderBase):
                     table.df.fillna({key: value}, inplace=True)
             else:
                 table.df.fillna(fill_values, inplace=True)
+        table._update_version()
 
         if inplace:
             _maybe_update_scheme(table)
@@ -368,6 +395,7 @@ class Base(HeaderBase):
         *,
         map: typing.Dict[str, typing.Union[str, typing.Sequence[str]]] = None,
         copy: bool = True,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
     ) -> pd.DataFrame:
         r"""Get labels.
 
@@ -381,6 +409,19 @@ class Base(HeaderBase):
         Args:
             index: index
             copy: return a copy of the labels
+            columns: only return selected columns.
+                If the table data was not loaded yet,
+                e.g. after calling :meth:`audformat.Database.load`
+                with ``load_data=False``,
+                only the selected columns
+                (and files of ``index``)
+                are read from disk,
+                without keeping the table data in memory.
+                The same applies to all columns,
+                if the database was loaded with ``memory_map=True``
+                and the table is read from a FEATHER or PARQUET file.
+                Columns referenced by ``map``
+                have to be selected as well
             map: map scheme or scheme fields to column values.
                 For example if your table holds a column ``speaker`` with
                 speaker IDs, which is assigned to a scheme that contains a
@@ -404,10 +445,37 @@ class Base(HeaderBase):
         """
         result_is_copy = False
 
-        if index is None:
-            result = self.df
+        if columns is not None:
+            columns = audeer.to_list(columns)
+
+        key = self._cache_key(index, map, columns)
+        if key is not None:
+            result = self.db._cache.get(key)
+            if result is not None:
+                return result
+
+        if self._df is None and (columns is not None or self._use_memory_map()):
+            # Read only selected columns and files from disk
+            files = self._load_files
+            if index is not None and define.IndexField.FILE in index.names:
+                index_files = index.unique(level=define.IndexField.FILE)
+                if files is None:
+                    files = index_files
+                else:
+                    files = index_files.intersection(audeer.to_list(files))
+            if columns is None:
+                columns = self._load_columns
+            df = self._load_from_root(columns=columns, files=files)
+            result = df if index is None else self._get_by_index(index, df)
+            result_is_copy = True
         else:
-            result = self._get_by_index(index)
+            if index is None:
+                result = self.df
+            else:
+                result = self._get_by_index(index, self.df)
+            if columns is not None:
+                result = result.loc[:, columns]
+                result_is_copy = True
 
         if map is not None:
             if self.db is None:
@@ -419,103 +487,122 @@ class Base(HeaderBase):
                 result = result.copy()
                 result_is_copy = True  # to avoid another copy
 
+            # Collect original values first,
+            # as a mapped column might replace a column
+            # that is mapped afterwards
+            ys = {column: result[column] for column in map}
             for column, mapped_columns in map.items():
                 mapped_columns = audeer.to_list(mapped_columns)
                 if len(mapped_columns) == 1:
-                    result[mapped_columns[0]] = self.columns[column].get(
-                        index,
-                        map=mapped_columns[0],
+                    result[mapped_columns[0]] = self.columns[column]._map(
+                        ys[column],
+                        mapped_columns[0],
                     )
                 else:
                     for mapped_column in mapped_columns:
                         if mapped_column != column:
-                            result[mapped_column] = self.columns[column].get(
-                                index,
-                                map=mapped_column,
+                            result[mapped_column] = self.columns[column]._map(
+                                ys[column],
+                                mapped_column,
                             )
                 if column not in mapped_columns:
                     result.drop(columns=column, inplace=True)
 
+        if key is not None:
+            self.db._cache.put(key, result)
+
         return result.copy() if (copy and not result_is_copy) else result
 
+    def iter_batches(
+        self,
+        batch_size: int = 65536,
+        *,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
+    ) -> typing.Iterator[pd.DataFrame]:
+        r"""Iterate over labels in batches of rows.
+
+        If the table data was not loaded yet,
+        e.g. after calling :meth:`audformat.Database.load`
+        with ``load_data=False``,
+        and the table is read from a PARQUET file,
+        see :meth:`audformat.Table.load`,
+        the batches are streamed from the file,
+        i.e. only a single batch is held in memory at a time.
+        Otherwise,
+        the batches are sliced from the table data.
+
+        Args:
+            batch_size: maximum number of rows per batch
+            columns: only return selected columns
+
+        Returns:
+            iterator over labels of batches of rows
+
+        Raises:
+            ValueError: if ``batch_size`` is smaller than 1
+
+        """
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' has to be at least 1, but is {batch_size}.")
+        if columns is not None:
+            columns = audeer.to_list(columns)
+
+        if self._df is None:
+            # Stream from PARQUET file,
+            # if it is the file load() would read
+            path = audeer.path(self.db.root, f"{self.db._name}.{self._id}")
+            file = self._file_to_read(path)
+            if file == f"{path}.{define.TableStorageFormat.PARQUET}":
+                return self._iter_parquet_batches(
+                    file,
+                    batch_size,
+                    columns=columns,
+                )
+
+        df = self.df
+        if columns is not None:
+            df = df.loc[:, columns]
+        return (
+            df.iloc[start : start + batch_size]
+            for start in range(0, len(df), batch_size)
+        )
+
     def load(
         self,
         path: str,
+        *,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
     ):
         r"""Load table data from disk.
 
-        Tables are stored as CSV, PARQUET and/or PKL files to disk.
+        Tables are stored as CSV, FEATHER, PARQUET and/or PKL files to disk.
         If the PKL file exists,
         it will load the PKL file
         as long as its modification date is the newest,
         otherwise it will raise an error
         and ask to delete one of the files.
+        The same applies to the FEATHER file,
+        if no PKL file exists.
+
+        If ``columns`` is given,
+        all other columns are removed from the table,
+        compare :meth:`audformat.MiscTable.pick_columns`.
+        For PARQUET and CSV files
+        only the selected columns are read from disk.
 
         Args:
             path: file path without extension
+            columns: only load selected columns.
+                Column IDs that are not part of the table are ignored
 
         Raises:
             RuntimeError: if table file(s) are missing
-            RuntimeError: if CSV or PARQUET file is newer than PKL file
+            RuntimeError: if CSV, FEATHER or PARQUET file is newer than PKL file
+            RuntimeError: if CSV or PARQUET file is newer than FEATHER file
 
         """
-        path = audeer.path(path)
-        csv_file = f"{path}.{define.TableStorageFormat.CSV}"
-        parquet_file = f"{path}.{define.TableStorageFormat.PARQUET}"
-        pkl_file = f"{path}.{define.TableStorageFormat.PICKLE}"
-
-        if (
-            not os.path.exists(pkl_file)
-            and not os.path.exists(csv_file)
-            and not os.path.exists(parquet_file)
-        ):
-            raise RuntimeError(
-                f"No file found for table with path '{path}.{{csv|parquet|pkl}}'"
-            )
-
-        # Load from PKL if file exists
-        # and is newer than CSV or PARQUET file.
-        # If files are written by Database.save()
-        # this is always the case
-        # as it stores first the PKL file
-        pickled = False
-        if os.path.exists(pkl_file):
-            for file in [parquet_file, csv_file]:
-                if os.path.exists(file) and os.path.getmtime(file) > os.path.getmtime(
-                    pkl_file
-                ):
-                    ext = audeer.file_extension(file).upper()
-                    raise RuntimeError(
-                        f"The table {ext} file '{file}' is newer "
-                        f"than the table PKL file '{pkl_file}'. "
-                        f"If you want to load from the {ext} file, "
-                        "please delete the PKL file. "
-                        "If you want to load from the PKL file, "
-                        f"please delete the {ext} file."
-                    )
-            pickled = True
-
-        if pickled:
-            try:
-                self._load_pickled(pkl_file)
-            except (AttributeError, ValueError, EOFError) as ex:
-                # If exception is raised
-                # (e.g. unsupported pickle protocol)
-                # try to load from PARQUET or CSV
-                # and save it again
-                # otherwise raise error
-                if os.path.exists(parquet_file):
-                    self._load_parquet(parquet_file)
-                    self._save_pickled(pkl_file)
-                elif os.path.exists(csv_file):
-                    self._load_csv(csv_file)
-                    self._save_pickled(pkl_file)
-                else:
-                    raise ex
-        elif os.path.exists(parquet_file):
-            self._load_parquet(parquet_file)
-        else:
-            self._load_csv(csv_file)
+        self._load(path, columns=columns)
+        self._update_version()
 
     def pick_columns(
         self,
@@ -569,6 +656,7 @@ class Base(HeaderBase):
 
         new_index = utils.intersect([table.index, index])
         table._df = table.df.reindex(new_index)
+        table._update_version()
 
         if inplace:
             _maybe_update_scheme(table)
@@ -581,12 +669,17 @@ class Base(HeaderBase):
         *,
         storage_format: str = define.TableStorageFormat.PARQUET,
         update_other_formats: bool = True,
+        parquet_options: typing.Dict[str, typing.Any] = None,
     ):
         r"""Save table data to disk.
 
         Existing files will be overwritten.
+        Every file is first written to a temporary file
+        in the same folder,
+        which is then renamed,
+        so that a file is never partially written.
 
-        When using ``"parquet"`` as ``storage_format``
+        When using ``"parquet"`` or ``"feather"`` as ``storage_format``
         a hash,
         based on the content of the table,
         is stored under the key ``b"hash"``
@@ -604,10 +697,50 @@ class Base(HeaderBase):
 
             pyarrow.parquet.read_schema(f"{path}.parquet").metadata[b"hash"].decode()
 
+        The hash is calculated with :func:`audformat.utils.hash`
+        using ``strict=True``.
+        Its version is stored under the key ``b"hash_version"``,
+        files without this key
+        contain a hash of version ``1``.
+
         The hash is used by :mod:`audb`
         when publishing a database
         to track changes of database files.
 
+        ``parquet_options`` controls how the PARQUET file is written.
+        It supports the following keys:
+
+        * ``"compression"``:
+          compression codec, e.g. ``"zstd"``
+          (default ``"snappy"``)
+        * ``"compression_level"``:
+          compression level of codec
+        * ``"row_group_size"``:
+          maximum number of rows per row group.
+          If the table has a ``file`` level,
+          row groups are only split between files,
+          i.e. a file with more rows
+          is stored in a single row group
+        * ``"sort_by_file"``:
+          if ``True``,
+          rows are stored sorted by the ``file`` level,
+          so that reading selected files
+          skips all other row groups
+          based on their statistics.
+          The order of the rows of files
+          is kept
+        * ``"use_dictionary"``:
+          if columns are dictionary encoded,
+          or list of columns to dictionary encode,
+          e.g. ``["file"]``
+          (default ``True``)
+
+        The options are stored under the key ``b"parquet_options"``
+        in the metadata of the schema of the PARQUET file.
+        If ``parquet_options`` is ``None``,
+        the options stored in an existing PARQUET file
+        at ``path`` are used.
+
         Args:
             path: file path without extension
             storage_format: storage format of table.
@@ -616,42 +749,52 @@ class Base(HeaderBase):
             update_other_formats: if ``True`` it will not only save
                 to the given ``storage_format``,
                 but update all files stored in other storage formats as well
+            parquet_options: options for writing the PARQUET file.
+                If ``None``,
+                the options of an existing PARQUET file are used
+
+        Raises:
+            RuntimeError: if table was loaded
+                with selected columns or files,
+                see :meth:`audformat.Database.load`
+            ValueError: if ``parquet_options`` contains unknown keys
 
         """
+        self._assert_not_partially_loaded()
         path = audeer.path(path)
         define.TableStorageFormat._assert_has_attribute_value(storage_format)
-
-        csv_file = f"{path}.{define.TableStorageFormat.CSV}"
-        parquet_file = f"{path}.{define.TableStorageFormat.PARQUET}"
-        pickle_file = f"{path}.{define.TableStorageFormat.PICKLE}"
+        parquet_options = self._resolve_parquet_options(parquet_options, path)
 
         # Ensure the following storage order:
         # 1. PARQUET file
         # 2. CSV file
-        # 3. PKL file
-        # The PKl is expected to be the oldest by load(),
+        # 3. FEATHER file
+        # 4. PKL file
+        # The PKL file is expected to be the newest by load(),
+        # followed by the FEATHER file,
         # the order of PARQUET and CSV file
         # is only a convention for now.
-        if storage_format == define.TableStorageFormat.PICKLE:
-            if update_other_formats and os.path.exists(parquet_file):
-                self._save_parquet(parquet_file)
-            if update_other_formats and os.path.exists(csv_file):
-                self._save_csv(csv_file)
-            self._save_pickled(pickle_file)
-
-        if storage_format == define.TableStorageFormat.PARQUET:
-            self._save_parquet(parquet_file)
-            if update_other_formats and os.path.exists(csv_file):
-                self._save_csv(csv_file)
-            if update_other_formats and os.path.exists(pickle_file):
-                self._save_pickled(pickle_file)
-
-        if storage_format == define.TableStorageFormat.CSV:
-            if update_other_formats and os.path.exists(parquet_file):
-                self._save_parquet(parquet_file)
-            self._save_csv(csv_file)
-            if update_other_formats and os.path.exists(pickle_file):
-                self._save_pickled(pickle_file)
+        files = self._storage_files(path, storage_format, update_other_formats)
+        table_hash = None
+        for ext in [
+            define.TableStorageFormat.PARQUET,
+            define.TableStorageFormat.CSV,
+            define.TableStorageFormat.FEATHER,
+            define.TableStorageFormat.PICKLE,
+        ]:
+            file = f"{path}.{ext}"
+            if file not in files:
+                continue
+            if ext == define.TableStorageFormat.PARQUET:
+                table_hash = self._save_parquet(file, parquet_options)
+            elif ext == define.TableStorageFormat.CSV:
+                self._save_csv(file)
+            elif ext == define.TableStorageFormat.FEATHER:
+                table_hash = self._save_feather(file)
+            else:
+                self._save_pickled(file)
+
+        self._set_saved_state(path, files, table_hash)
 
     def set(
         self,
@@ -680,6 +823,9 @@ class Base(HeaderBase):
         Raises:
             ValueError: if values cannot be converted
                 to match the schemes dtype
+            ValueError: if values do not match
+                the labels or the minimum and maximum value
+                of the scheme
 
         """
         for idx, data in values.items():
@@ -690,6 +836,10 @@ class Base(HeaderBase):
         others: typing.Union[typing.Self, typing.Sequence[typing.Self]],
         *,
         overwrite: bool = False,
+        aggregate_function: typing.Union[
+            str, typing.Callable[[pd.Series], typing.Any]
+        ] = None,
+        aggregate_strategy: str = "mismatch",
     ) -> typing.Self:
         r"""Update table with other table(s).
 
@@ -709,12 +859,27 @@ class Base(HeaderBase):
         or one column contains ``NaN``.
         If ``overwrite`` is set to ``True``,
         the value of the last table in the list is kept.
+        If ``overwrite`` is set to ``False``,
+        overlapping values can be combined
+        with ``aggregate_function``,
+        see :func:`audformat.utils.concat`.
 
         The index type of the table must not change.
 
         Args:
             others: table object(s)
             overwrite: overwrite values where indices overlap
+            aggregate_function: callable or name of a built-in aggregation
+                to combine overlapping values,
+                e.g. ``'majority_vote'``
+            aggregate_strategy: if ``aggregate_function`` is not ``None``,
+                ``aggregate_strategy`` decides
+                when ``aggregate_function`` is applied.
+                ``'overlap'``: apply to all samples
+                that have an overlapping index;
+                ``'mismatch'``: apply to all samples
+                that have an overlapping index
+                and a different value
 
         Returns:
             the updated table
@@ -727,7 +892,10 @@ class Base(HeaderBase):
             ValueError: if a missing scheme or rater cannot be copied
                 because a different object with the same ID exists
             ValueError: if values in same position overlap
+                and ``aggregate_function`` is ``None``
             ValueError: if level and dtypes of table indices do not match
+            ValueError: if ``aggregate_function`` or ``aggregate_strategy``
+                is not valid
 
         """
         if self.db is None:
@@ -830,6 +998,8 @@ class Base(HeaderBase):
         df = utils.concat(
             [self.df] + [other.df for other in others],
             overwrite=overwrite,
+            aggregate_function=aggregate_function,
+            aggregate_strategy=aggregate_strategy,
         )
 
         # insert missing schemes and raters
@@ -846,17 +1016,273 @@ class Base(HeaderBase):
 
         # update table data
         self._df = df
+        self._update_version()
 
         return self
 
+    def _assert_not_partially_loaded(self):
+        r"""Raise error if table was loaded with selected columns or files.
+
+        Its header and data do not match
+        the table files.
+
+        """
+        if self._partially_loaded:
+            raise RuntimeError(
+                f"Cannot save table '{self._id}', "
+                "as it was loaded with selected columns or files."
+            )
+
+    def _cache_key(
+        self,
+        index: typing.Optional[pd.Index],
+        map: typing.Optional[typing.Dict],
+        columns: typing.Optional[typing.Sequence[str]],
+    ) -> typing.Optional[typing.Tuple]:
+        r"""Key of cached result of :meth:`get`.
+
+        Only results that are mapped
+        or read from disk
+        are cached,
+        compare :meth:`audformat.Database.enable_cache`.
+
+        Args:
+            index: index
+            map: map scheme or scheme fields to column values
+            columns: selected columns
+
+        Returns:
+            key or ``None`` if result is not cached
+
+        """
+        if index is not None or self.db is None or self.db._cache is None:
+            return None
+        from_disk = self._df is None and (columns is not None or self._use_memory_map())
+        if map is None and not from_disk:
+            return None
+        if map is not None:
+            map = tuple(
+                (column, tuple(audeer.to_list(mapped_columns)))
+                for column, mapped_columns in map.items()
+            )
+            # Mapped values depend on schemes and misc tables
+            state = self.db._version
+        else:
+            state = None
+        if columns is not None:
+            columns = tuple(columns)
+        return "get", self._version, map, columns, state
+
+    def _del_column(self, column_id: str):
+        # Column was removed
+        self._update_version()
+
+    def _file_to_read(self, path: str) -> str:
+        r"""Select table file to read table data from.
+
+        Args:
+            path: file path without extension
+
+        Returns:
+            path of CSV, FEATHER, PARQUET or PKL file
+
+        Raises:
+            RuntimeError: if table file(s) are missing
+            RuntimeError: if CSV, FEATHER or PARQUET file is newer than PKL file
+            RuntimeError: if CSV or PARQUET file is newer than FEATHER file
+
+        """
+        csv_file = f"{path}.{define.TableStorageFormat.CSV}"
+        feather_file = f"{path}.{define.TableStorageFormat.FEATHER}"
+        parquet_file = f"{path}.{define.TableStorageFormat.PARQUET}"
+        pkl_file = f"{path}.{define.TableStorageFormat.PICKLE}"
+
+        if (
+            not os.path.exists(pkl_file)
+            and not os.path.exists(feather_file)
+            and not os.path.exists(csv_file)
+            and not os.path.exists(parquet_file)
+        ):
+            raise RuntimeError(
+                "No file found for table with path "
+                f"'{path}.{{csv|feather|parquet|pkl}}'"
+            )
+
+        # Load from PKL or FEATHER file if it exists
+        # and is newer than the files it caches.
+        # If files are written by Database.save()
+        # this is always the case
+        # as it stores first the FEATHER
+        # and then the PKL file
+        for cache_file, other_files in [
+            (pkl_file, [parquet_file, csv_file, feather_file]),
+            (feather_file, [parquet_file, csv_file]),
+        ]:
+            if not os.path.exists(cache_file):
+                continue
+            cache_ext = audeer.file_extension(cache_file).upper()
+            for file in other_files:
+                if os.path.exists(file) and os.path.getmtime(file) > os.path.getmtime(
+                    cache_file
+                ):
+                    ext = audeer.file_extension(file).upper()
+                    raise RuntimeError(
+                        f"The table {ext} file '{file}' is newer "
+                        f"than the table {cache_ext} file '{cache_file}'. "
+                        f"If you want to load from the {ext} file, "
+                        f"please delete the {cache_ext} file. "
+                        f"If you want to load from the {cache_ext} file, "
+                        f"please delete the {ext} file."
+                    )
+
+        # Memory-mapped tables follow the same order,
+        # so that a newer PKL file is not ignored
+        for file in [pkl_file, feather_file, parquet_file]:
+            if os.path.exists(file):
+                return file
+        return csv_file
+
     def _get_by_index(
         self,
         index: pd.Index,
-    ) -> (pd.DataFrame, bool):  # pragma: no cover
+        df: pd.DataFrame,
+    ) -> pd.DataFrame:  # pragma: no cover
         # Executed when calling `self.get(index=index)`.
-        # Returns `df, df_is_copy`
+        # Returns the rows of `df` selected by `index`
         raise NotImplementedError()
 
+    def _hash(self) -> typing.Optional[str]:
+        r"""Hash of table data.
+
+        Returns:
+            hash, see :func:`audformat.utils.hash`
+            with ``strict=True`` and ``version=2``,
+            or ``None``
+            if table data cannot be converted
+            to a :class:`pyarrow.Table`,
+            e.g. when a column holds values of different types
+
+        """
+        try:
+            return utils.hash(self.df, strict=True, version=2)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+
+    def _is_saved(
+        self,
+        path: str,
+        storage_format: str,
+        update_other_formats: bool,
+        parquet_options: typing.Dict[str, typing.Any] = None,
+    ) -> bool:
+        r"""Check if table files are up-to-date.
+
+        Table files are up-to-date
+        if the table data was not loaded,
+        or if it did not change
+        since it was loaded from or saved to the files,
+        and the files were not modified since then.
+        A PARQUET file is not up-to-date
+        if it was written with other options
+        than ``parquet_options``.
+
+        Args:
+            path: file path without extension
+            storage_format: storage format of table
+            update_other_formats: if files in other storage formats
+                are considered as well
+            parquet_options: options for writing the PARQUET file,
+                see :meth:`save`
+
+        Returns:
+            ``True`` if :meth:`save` can be skipped
+
+        """
+        path = audeer.path(path)
+        files = self._storage_files(path, storage_format, update_other_formats)
+        if not all(os.path.exists(file) for file in files):
+            return False
+        if (
+            parquet_options is not None
+            and f"{path}.{define.TableStorageFormat.PARQUET}" in files
+            and (
+                self._resolve_parquet_options(parquet_options, path)
+                != self._resolve_parquet_options(None, path)
+            )
+        ):
+            return False
+
+        if self._df is None:
+            # Table data was not loaded
+            # and is unchanged
+            # as long as all columns and files
+            # were selected when loading the database
+            return (
+                self._load_columns is None
+                and self._load_files is None
+                and path == audeer.path(self.db.root, f"{self.db._name}.{self._id}")
+            )
+
+        if self._saved_state is None:
+            return False
+        saved_path, saved_hash, saved_files = self._saved_state
+        if path != saved_path:
+            return False
+        for file in files:
+            stat = os.stat(file)
+            if saved_files.get(file) != (stat.st_size, stat.st_mtime_ns):
+                return False
+        return self._hash() == saved_hash
+
+    def _iter_parquet_batches(
+        self,
+        path: str,
+        batch_size: int,
+        *,
+        columns: typing.Sequence[str] = None,
+    ) -> typing.Iterator[pd.DataFrame]:
+        r"""Stream table from PARQUET file in batches.
+
+        Args:
+            path: path to table, including file extension
+            batch_size: maximum number of rows per batch
+            columns: only read selected columns,
+                if ``None`` all columns of the table are read
+
+        Yields:
+            table data of next batch of rows
+
+        """
+        if columns is None:
+            columns = self._load_columns or list(self.columns)
+        files = self._load_files
+        if files is not None:
+            files = pa.array(audeer.to_list(files), pa.string())
+
+        levels = list(self._levels_and_dtypes.keys())
+        parquet_file = parquet.ParquetFile(path, memory_map=self._memory_map)
+        row_groups = None
+        if files is not None and _parquet_options_from_metadata(
+            parquet_file.schema_arrow.metadata
+        ).get("sort_by_file"):
+            # Rows are sorted by file,
+            # which means the statistics of a row group
+            # tell if it contains any of the selected files
+            row_groups = _select_row_groups(parquet_file, files.to_pylist())
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_size,
+            row_groups=row_groups,
+            columns=levels + list(columns),
+        ):
+            table = pa.Table.from_batches([batch])
+            if files is not None:
+                table = table.filter(
+                    pc.is_in(table[define.IndexField.FILE], value_set=files)
+                )
+                if table.num_rows == 0:
+                    continue
+            yield self._pyarrow_table_to_dataframe(table)
+
     @property
     def _levels_and_dtypes(self) -> typing.Dict[str, str]:
         r"""Levels and dtypes of index columns.
@@ -871,10 +1297,65 @@ class Base(HeaderBase):
         # when reading CSV files.
         raise NotImplementedError()  # pragma: no cover
 
-    def _load_csv(self, path: str):
-        r"""Load table from CSV file.
+    def _load(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ):
+        r"""Load table data from disk and store it under ``self._df``.
 
-        The loaded table is stored under ``self._df``.
+        Args:
+            path: file path without extension
+            columns: only load selected columns
+                and remove all other columns from the table
+            files: only load rows of selected files
+
+        """
+        # The version is updated by load(),
+        # but not when table data is loaded on demand,
+        # as it does not change the table
+        self._df = self._read(path, columns=columns, files=files)
+        if columns is not None:
+            self._remove_other_columns(columns)
+        elif files is None:
+            # Use hash stored in PARQUET and FEATHER file
+            # to detect changes of the table
+            # in save()
+            path = audeer.path(path)
+            parquet_file = f"{path}.{define.TableStorageFormat.PARQUET}"
+            feather_file = f"{path}.{define.TableStorageFormat.FEATHER}"
+            pickle_file = f"{path}.{define.TableStorageFormat.PICKLE}"
+            hashes = set()
+            for file, read_schema in [
+                (parquet_file, parquet.read_schema),
+                (feather_file, lambda file: pa.ipc.open_file(file).schema),
+            ]:
+                if os.path.exists(file):
+                    metadata = read_schema(file).metadata or {}
+                    if metadata.get(b"hash_version") == b"2":
+                        hashes.add(metadata[b"hash"])
+                    else:
+                        hashes.add(None)
+            if len(hashes) == 1 and None not in hashes:
+                # Table data was read from PARQUET, FEATHER or PKL file,
+                # but the CSV file might be outdated
+                files = [
+                    file
+                    for file in [parquet_file, feather_file, pickle_file]
+                    if os.path.exists(file)
+                ]
+                self._set_saved_state(path, files, hashes.pop().decode())
+
+    def _load_csv(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
+        r"""Load table from CSV file.
 
         Loading a CSV file with :func:`pandas.read_csv()` is slower
         than the method applied here.
@@ -885,22 +1366,37 @@ class Base(HeaderBase):
 
         Args:
             path: path to table, including file extension
+            columns: only load selected columns,
+                if ``None`` all columns are loaded
+            files: only load rows of selected files
+
+        Returns:
+            table data
 
         """
         levels = list(self._levels_and_dtypes.keys())
-        columns = list(self.columns.keys())
+        if columns is None:
+            columns = list(self.columns.keys())
         try:
             table = csv.read_csv(
                 path,
                 read_options=csv.ReadOptions(
-                    column_names=levels + columns,
+                    column_names=levels + list(self.columns.keys()),
                     skip_rows=1,
                 ),
                 convert_options=csv.ConvertOptions(
                     column_types=self._pyarrow_csv_schema(),
+                    include_columns=levels + columns,
                     strings_can_be_null=True,
                 ),
             )
+            if files is not None:
+                table = table.filter(
+                    pc.is_in(
+                        table[define.IndexField.FILE],
+                        value_set=pa.array(files, pa.string()),
+                    )
+                )
             df = self._pyarrow_table_to_dataframe(table, from_csv=True)
         except pa.lib.ArrowInvalid:
             # If pyarrow fails to parse the CSV file
@@ -910,7 +1406,8 @@ class Base(HeaderBase):
             # index
             columns_and_dtypes = self._levels_and_dtypes
             # columns
-            for column_id, column in self.columns.items():
+            for column_id in columns:
+                column = self.columns[column_id]
                 if column.scheme_id is not None:
                     columns_and_dtypes[column_id] = self.db.schemes[
                         column.scheme_id
@@ -937,31 +1434,144 @@ class Base(HeaderBase):
                 converters=converters,
                 float_precision="round_trip",
             )
+            if files is not None:
+                df = _filter_files(df, files)
 
-        self._df = df
+        return df
+
+    def _load_feather(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
+        r"""Load table from Arrow IPC (FEATHER) file.
+
+        If the table is memory-mapped,
+        the file is accessed with :func:`pyarrow.memory_map`
+        and the data is not copied
+        before converting it to a dataframe.
+
+        Args:
+            path: path to table, including file extension
+            columns: only load selected columns,
+                if ``None`` all columns are loaded
+            files: only load rows of selected files
+
+        Returns:
+            table data
+
+        """
+        if columns is not None:
+            columns = list(self._levels_and_dtypes.keys()) + list(columns)
+        table = feather.read_table(
+            path,
+            columns=columns,
+            memory_map=self._memory_map,
+        )
+        if files is not None:
+            table = table.filter(
+                pc.is_in(
+                    table[define.IndexField.FILE],
+                    value_set=pa.array(files, pa.string()),
+                )
+            )
+        return self._pyarrow_table_to_dataframe(table)
+
+    def _load_from_root(
+        self,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
+        r"""Read table data from database root.
 
-    def _load_parquet(self, path: str):
+        Args:
+            columns: only read selected columns
+            files: only read rows of selected files
+
+        Returns:
+            table data
+
+        """
+        path = os.path.join(self.db.root, f"{self.db._name}.{self._id}")
+        return self._read(path, columns=columns, files=files)
+
+    def _load_parquet(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
         r"""Load table from PARQUET file.
 
-        The loaded table is stored under ``self._df``.
+        Selected columns and files
+        are pushed down to the PARQUET reader,
+        i.e. other columns and row groups
+        are not read from disk.
+        If the table is memory-mapped,
+        the file is accessed with :func:`pyarrow.memory_map`,
+        which lets processes reading the same file
+        share the operating system's page cache.
 
         Args:
             path: path to table, including file extension
+            columns: only load selected columns,
+                if ``None`` all columns are loaded
+            files: only load rows of selected files
+
+        Returns:
+            table data
 
         """
-        # Read PARQUET file
-        table = parquet.read_table(path)
+        if columns is not None:
+            columns = list(self._levels_and_dtypes.keys()) + list(columns)
+        filters = None
+        if files is not None:
+            filters = pc.field(define.IndexField.FILE).isin(
+                pa.array(files, pa.string())
+            )
+        # Read PARQUET file,
+        # string levels of a MultiIndex
+        # are read dictionary-encoded,
+        # see _pyarrow_table_to_dataframe()
+        read_dictionary = None
+        if len(self._levels_and_dtypes) > 1:
+            read_dictionary = [
+                level
+                for level, dtype in self._levels_and_dtypes.items()
+                if dtype == define.DataType.STRING
+            ]
+        table = parquet.read_table(
+            path,
+            columns=columns,
+            filters=filters,
+            memory_map=self._memory_map,
+            read_dictionary=read_dictionary,
+        )
         df = self._pyarrow_table_to_dataframe(table)
 
-        self._df = df
+        return df
 
-    def _load_pickled(self, path: str):
+    def _load_pickled(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
         r"""Load table from PKL file.
 
-        The loaded table is stored under ``self._df``.
-
         Args:
             path: path to table, including file extension
+            columns: only return selected columns,
+                if ``None`` all columns are returned
+            files: only return rows of selected files
+
+        Returns:
+            table data
 
         """
         # Older versions of audformat used xz compression
@@ -976,17 +1586,24 @@ class Base(HeaderBase):
         # Older versions of audformat stored columns
         # assigned to a string scheme as 'object',
         # so we need to convert those to 'string'
-        for column_id, column in self.columns.items():
+        for column_id in self.columns if columns is None else columns:
+            column = self.columns[column_id]
             if (
                 column.scheme_id is not None
                 and (self.db.schemes[column.scheme_id].dtype == define.DataType.STRING)
                 and df[column_id].dtype == "object"
             ):
                 df[column_id] = df[column_id].astype("string", copy=False)
+
+        if columns is not None:
+            df = df[columns]
+        if files is not None:
+            df = _filter_files(df, files)
+
         # Fix index entries as well
         df.index = _maybe_convert_dtype_to_string(df.index)
 
-        self._df = df
+        return df
 
     def _pyarrow_convert_dtypes(
         self,
@@ -1046,6 +1663,9 @@ class Base(HeaderBase):
 
         # --- Columns ---
         for column_id, column in self.columns.items():
+            if column_id not in df.columns:
+                # Column was not selected when reading
+                continue
             if column.scheme_id is not None:
                 scheme = self.db.schemes[column.scheme_id]
                 if scheme.labels is not None:
@@ -1082,7 +1702,14 @@ class Base(HeaderBase):
                 categories=labels,
                 ordered=False,
             )
-            df[column] = df[column].astype(dtype)
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                # Unordered categorical dtypes are equal
+                # independent of the order of their categories,
+                # hence astype() would keep the order
+                # in which labels appear in the file
+                df[column] = df[column].cat.set_categories(dtype.categories)
+            else:
+                df[column] = df[column].astype(dtype)
         return df
 
     def _pyarrow_csv_schema(self) -> pa.Schema:
@@ -1152,27 +1779,216 @@ class Base(HeaderBase):
             dataframe
 
         """
+        index_columns = list(self._levels_and_dtypes.keys())
+        encoded_columns = []
+        if len(index_columns) > 1:
+            # String levels of a MultiIndex,
+            # e.g. the file level of a segmented table,
+            # contain repeated values.
+            # We dictionary-encode them,
+            # so that every value is converted
+            # only once to a Python string
+            # and the MultiIndex is created
+            # from the dictionary indices
+            for level, dtype in self._levels_and_dtypes.items():
+                if dtype != define.DataType.STRING or level not in table.column_names:
+                    continue
+                if pa.types.is_string(table.schema.field(level).type):
+                    table = table.set_column(
+                        table.schema.get_field_index(level),
+                        level,
+                        pc.dictionary_encode(table[level]),
+                    )
+                if pa.types.is_dictionary(table.schema.field(level).type):
+                    encoded_columns.append(level)
         df = table.to_pandas(
             deduplicate_objects=False,
             types_mapper={
                 pa.string(): pd.StringDtype(),
             }.get,  # we have to provide a callable, not a dict
         )
+        for column in encoded_columns:
+            # Sort categories,
+            # as pandas does when factorizing a level
+            values = df[column].array
+            df[column] = values.reorder_categories(values.categories.sort_values())
         # Adjust dtypes and set index
         df = self._pyarrow_convert_dtypes(df, convert_all=from_csv)
-        index_columns = list(self._levels_and_dtypes.keys())
-        df = self._set_index(df, index_columns)
+        df = self._set_index(
+            df,
+            index_columns,
+            {column: "string" for column in encoded_columns},
+        )
         return df
 
+    def _pyarrow_table_with_hash(self) -> pa.Table:
+        r"""Convert table data to pyarrow table.
+
+        The hash of the table,
+        see :meth:`_save_parquet`,
+        is stored in the metadata of the schema
+        under the key ``b"hash"``.
+
+        Returns:
+            pyarrow table
+
+        """
+        table = pa.Table.from_pandas(self.df.reset_index(), preserve_index=False)
+
+        # Create hash of table
+        table_hash = utils._hash_arrow_table(table)
+
+        # Store in metadata of file,
+        # see https://stackoverflow.com/a/58978449
+        metadata = {"hash": table_hash, "hash_version": "2"}
+        return table.replace_schema_metadata({**metadata, **table.schema.metadata})
+
+    def _read(
+        self,
+        path: str,
+        *,
+        columns: typing.Sequence[str] = None,
+        files: typing.Sequence[str] = None,
+    ) -> pd.DataFrame:
+        r"""Read table data from disk.
+
+        Args:
+            path: file path without extension
+            columns: only read selected columns,
+                if ``None`` all columns of the table are read
+            files: only read rows of selected files
+
+        Returns:
+            table data
+
+        Raises:
+            RuntimeError: if table file(s) are missing
+            RuntimeError: if CSV, FEATHER or PARQUET file is newer than PKL file
+            RuntimeError: if CSV or PARQUET file is newer than FEATHER file
+
+        """
+        if columns is not None:
+            columns = [column for column in self.columns if column in columns]
+        if files is not None:
+            files = audeer.to_list(files)
+        # Never store partially loaded tables
+        # as PKL file
+        partial = columns is not None or files is not None
+
+        path = audeer.path(path)
+        csv_file = f"{path}.{define.TableStorageFormat.CSV}"
+        feather_file = f"{path}.{define.TableStorageFormat.FEATHER}"
+        parquet_file = f"{path}.{define.TableStorageFormat.PARQUET}"
+        pkl_file = f"{path}.{define.TableStorageFormat.PICKLE}"
+
+        file = self._file_to_read(path)
+        if file == pkl_file:
+            try:
+                df = self._load_pickled(pkl_file, columns=columns, files=files)
+            except (AttributeError, ValueError, EOFError) as ex:
+                # If exception is raised
+                # (e.g. unsupported pickle protocol)
+                # try to load from FEATHER, PARQUET or CSV
+                # and save it again
+                # otherwise raise error
+                if os.path.exists(feather_file):
+                    df = self._load_feather(feather_file, columns=columns, files=files)
+                elif os.path.exists(parquet_file):
+                    df = self._load_parquet(parquet_file, columns=columns, files=files)
+                elif os.path.exists(csv_file):
+                    df = self._load_csv(csv_file, columns=columns, files=files)
+                else:
+                    raise ex
+                if not partial:
+                    self._save_pickled(pkl_file, df)
+        elif file == feather_file:
+            df = self._load_feather(feather_file, columns=columns, files=files)
+        elif file == parquet_file:
+            df = self._load_parquet(parquet_file, columns=columns, files=files)
+        else:
+            df = self._load_csv(csv_file, columns=columns, files=files)
+
+        return df
+
+    def _remove_other_columns(
+        self,
+        columns: typing.Union[str, typing.Sequence[str]],
+    ):
+        r"""Remove columns from header that are not selected.
+
+        Args:
+            columns: selected column IDs
+
+        """
+        columns = audeer.to_list(columns)
+        for column_id in list(self.columns):
+            if column_id not in columns:
+                self.columns.pop(column_id)
+
+    def _resolve_parquet_options(
+        self,
+        parquet_options: typing.Optional[typing.Dict[str, typing.Any]],
+        path: str,
+    ) -> typing.Dict[str, typing.Any]:
+        r"""Validate options for writing the PARQUET file.
+
+        Args:
+            parquet_options: options for writing the PARQUET file.
+                If ``None``,
+                the options stored in the existing PARQUET file
+                are returned
+            path: file path without extension
+
+        Returns:
+            options
+
+        Raises:
+            ValueError: if ``parquet_options`` contains unknown keys
+
+        """
+        if parquet_options is None:
+            file = f"{path}.{define.TableStorageFormat.PARQUET}"
+            if not os.path.exists(file):
+                return {}
+            return _parquet_options_from_metadata(parquet.read_schema(file).metadata)
+        _assert_parquet_options(parquet_options)
+        return dict(parquet_options)
+
     def _save_csv(self, path: str):
         # Load table before opening CSV file
         # to avoid creating a CSV file
         # that is newer than the PKL file
         df = self.df  # loads table
-        with open(path, "w") as fp:
-            df.to_csv(fp, encoding="utf-8")
+        with atomic_path(path) as tmp_path:
+            with open(tmp_path, "w") as fp:
+                df.to_csv(fp, encoding="utf-8")
+
+    def _save_feather(self, path: str) -> str:
+        r"""Save table as uncompressed Arrow IPC (FEATHER) file.
+
+        The file can be memory-mapped
+        and read without copying the data.
+        As for PARQUET files,
+        a hash is stored in its metadata,
+        see :meth:`_save_parquet`.
+
+        Args:
+            path: path, including file extension
+
+        Returns:
+            hash of table
 
-    def _save_parquet(self, path: str):
+        """
+        table = self._pyarrow_table_with_hash()
+        with atomic_path(path) as tmp_path:
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+        return table.schema.metadata[b"hash"].decode()
+
+    def _save_parquet(
+        self,
+        path: str,
+        parquet_options: typing.Dict[str, typing.Any] = None,
+    ) -> str:
         r"""Save table as PARQUET file.
 
         A PARQUET file is written in a non-deterministic way,
@@ -1190,27 +2006,90 @@ class Base(HeaderBase):
 
             pyarrow.parquet.read_schema(path).metadata[b"hash"].decode()
 
+        The hash is identical to
+        ``audformat.utils.hash(self.df, strict=True, version=2)``,
+        but reuses the pyarrow table
+        that is written to the file.
+        If the rows are sorted by file
+        before writing,
+        the hash of the sorted rows is stored.
+        ``parquet_options`` are stored
+        under the key ``b"parquet_options"``
+        in the metadata as well.
+
         Args:
             path: path, including file extension
+            parquet_options: options for writing the PARQUET file,
+                see :meth:`save`
 
-        """
-        table = pa.Table.from_pandas(self.df.reset_index(), preserve_index=False)
+        Returns:
+            hash of table
 
-        # Create hash of table
-        table_hash = utils.hash(self.df, strict=True)
+        """
+        options = {**_PARQUET_OPTIONS, **(parquet_options or {})}
+        table = self._pyarrow_table_with_hash()
+        table_hash = table.schema.metadata[b"hash"].decode()
+        has_file = define.IndexField.FILE in self._levels_and_dtypes
+
+        if options["sort_by_file"] and has_file:
+            indices = pc.sort_indices(
+                table,
+                sort_keys=[(define.IndexField.FILE, "ascending")],
+            )
+            if not np.array_equal(indices.to_numpy(), np.arange(len(indices))):
+                table = table.take(indices)
+                table = table.replace_schema_metadata(
+                    {
+                        **table.schema.metadata,
+                        b"hash": utils._hash_arrow_table(table),
+                    }
+                )
 
-        # Store in metadata of file,
-        # see https://stackoverflow.com/a/58978449
-        metadata = {"hash": table_hash}
-        table = table.replace_schema_metadata({**metadata, **table.schema.metadata})
+        if parquet_options:
+            table = table.replace_schema_metadata(
+                {
+                    **table.schema.metadata,
+                    b"parquet_options": json.dumps(parquet_options).encode(),
+                }
+            )
 
-        parquet.write_table(table, path, compression="snappy")
+        row_groups = None
+        if options["row_group_size"] is not None and has_file:
+            row_groups = _file_aligned_row_groups(
+                table[define.IndexField.FILE],
+                options["row_group_size"],
+            )
 
-    def _save_pickled(self, path: str):
-        self.df.to_pickle(
-            path,
-            protocol=4,  # supported by Python >= 3.4
-        )
+        with atomic_path(path) as tmp_path:
+            with parquet.ParquetWriter(
+                tmp_path,
+                table.schema,
+                compression=options["compression"],
+                compression_level=options["compression_level"],
+                use_dictionary=options["use_dictionary"],
+            ) as writer:
+                if row_groups is None:
+                    writer.write_table(
+                        table,
+                        row_group_size=options["row_group_size"],
+                    )
+                else:
+                    for start, end in row_groups:
+                        writer.write_table(
+                            table.slice(start, end - start),
+                            row_group_size=max(end - start, 1),
+                        )
+        return table_hash
+
+    def _save_pickled(self, path: str, df: pd.DataFrame = None):
+        if df is None:
+            df = self.df
+        with atomic_path(path) as tmp_path:
+            df.to_pickle(
+                tmp_path,
+                compression=None,
+                protocol=4,  # supported by Python >= 3.4
+            )
 
     def _set_column(self, column_id: str, column: Column) -> Column:
         levels = (
@@ -1243,10 +2122,16 @@ class Base(HeaderBase):
 
         column._id = column_id
         column._table = self
+        self._update_version()
 
         return column
 
-    def _set_index(self, df: pd.DataFrame, columns: typing.Sequence) -> pd.DataFrame:
+    def _set_index(
+        self,
+        df: pd.DataFrame,
+        columns: typing.Sequence,
+        dtypes: typing.Dict[str, str] = None,
+    ) -> pd.DataFrame:
         r"""Set columns as index.
 
         Setting of index columns is performed inplace!
@@ -1254,6 +2139,8 @@ class Base(HeaderBase):
         Args:
             df: dataframe
             columns: columns to be set as index of dataframe
+            dtypes: dtypes of index levels,
+                that differ from the dtypes of the columns
 
         Returns:
             updated dataframe
@@ -1265,12 +2152,99 @@ class Base(HeaderBase):
         # so we need to set them manually.
         #
         if len(columns) > 1:
-            dtypes = {column: df[column].dtype for column in columns}
+            dtypes = {
+                column: df[column].dtype for column in columns
+            } | (dtypes or {})
         df.set_index(columns, inplace=True)
         if len(columns) > 1:
             df.index = utils.set_index_dtypes(df.index, dtypes)
         return df
 
+    def _set_saved_state(
+        self,
+        path: str,
+        files: typing.Sequence[str],
+        table_hash: typing.Optional[str],
+    ):
+        r"""Remember hash of table data stored in files.
+
+        Args:
+            path: file path without extension
+            files: table files containing the table data
+            table_hash: hash of table data
+                stored in the PARQUET or FEATHER file,
+                see :meth:`_hash`.
+                If ``None``,
+                changes of the table data are not tracked
+
+        """
+        if table_hash is None:
+            self._saved_state = None
+            return
+        states = {}
+        for file in files:
+            stat = os.stat(file)
+            states[file] = (stat.st_size, stat.st_mtime_ns)
+        self._saved_state = (path, table_hash, states)
+
+    @staticmethod
+    def _storage_files(
+        path: str,
+        storage_format: str,
+        update_other_formats: bool,
+    ) -> typing.List[str]:
+        r"""Table files written by :meth:`save`.
+
+        Args:
+            path: file path without extension
+            storage_format: storage format of table
+            update_other_formats: if existing files
+                in other storage formats are updated
+
+        Returns:
+            file paths
+
+        """
+        files = [f"{path}.{storage_format}"]
+        if update_other_formats:
+            for ext in define.TableStorageFormat._attribute_values():
+                file = f"{path}.{ext}"
+                if ext != storage_format and os.path.exists(file):
+                    files.append(file)
+        return files
+
+    def _update_version(self):
+        r"""Assign new version number to table and its database.
+
+        Compare :func:`audformat.core.common.next_version`.
+
+        """
+        self._version = next_version()
+        if self._db is not None:
+            self._db._version = self._version
+
+    def _use_memory_map(self) -> bool:
+        r"""Check if table data is read lazily from a memory-mapped file.
+
+        Only PARQUET and FEATHER files are memory-mapped.
+        If the table file to read is a CSV or PKL file,
+        the table data is loaded into memory
+        on first access instead,
+        compare :meth:`audformat.Database.load`.
+
+        Returns:
+            ``True`` if table data is read from a memory-mapped file
+
+        """
+        if self._df is not None or not self._memory_map:
+            return False
+        path = os.path.join(self.db.root, f"{self.db._name}.{self._id}")
+        ext = audeer.file_extension(self._file_to_read(path))
+        return ext in [
+            define.TableStorageFormat.FEATHER,
+            define.TableStorageFormat.PARQUET,
+        ]
+
 
 class MiscTable(Base):
     r"""Miscellaneous table.
@@ -1427,8 +2401,8 @@ class MiscTable(Base):
             meta=meta,
         )
 
-    def _get_by_index(self, index: pd.Index) -> pd.DataFrame:
-        return self.df.loc[index]
+    def _get_by_index(self, index: pd.Index, df: pd.DataFrame) -> pd.DataFrame:
+        return df.loc[index]
 
     @property
     def _levels_and_dtypes(self) -> typing.Dict[str, str]:
@@ -1683,6 +2657,7 @@ class Table(Base):
             else:
                 level = None
             self.df.drop(index, inplace=True, level=level)
+        self._update_version()
 
         return self
 
@@ -1692,6 +2667,7 @@ class Table(Base):
         *,
         map: typing.Dict[str, typing.Union[str, typing.Sequence[str]]] = None,
         copy: bool = True,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
         as_segmented: bool = False,
         allow_nat: bool = True,
         root: str = None,
@@ -1710,6 +2686,19 @@ class Table(Base):
             index: index conform to
                 :ref:`table specifications <data-tables:Tables>`
             copy: return a copy of the labels
+            columns: only return selected columns.
+                If the table data was not loaded yet,
+                e.g. after calling :meth:`audformat.Database.load`
+                with ``load_data=False``,
+                only the selected columns
+                and the files of ``index``
+                are read from disk,
+                without keeping the table data in memory.
+                The same applies to all columns,
+                if the database was loaded with ``memory_map=True``
+                and the table is read from a FEATHER or PARQUET file.
+                Columns referenced by ``map``
+                have to be selected as well
             map: :ref:`map scheme or scheme fields to column values
                 <map-scheme-labels>`.
                 For example if your table holds a column ``speaker`` with
@@ -1750,7 +2739,7 @@ class Table(Base):
             ValueError: if trying to map to a non-existing field
 
         """
-        result = super().get(index, map=map, copy=copy)
+        result = super().get(index, map=map, copy=copy, columns=columns)
 
         # if necessary, convert to segmented index and replace NaT
         is_segmented = is_segmented_index(result.index)
@@ -1771,6 +2760,49 @@ class Table(Base):
 
         return result
 
+    def load(
+        self,
+        path: str,
+        *,
+        columns: typing.Union[str, typing.Sequence[str]] = None,
+        files: typing.Union[str, typing.Sequence[str]] = None,
+    ):
+        r"""Load table data from disk.
+
+        Tables are stored as CSV, FEATHER, PARQUET and/or PKL files to disk.
+        If the PKL file exists,
+        it will load the PKL file
+        as long as its modification date is the newest,
+        otherwise it will raise an error
+        and ask to delete one of the files.
+        The same applies to the FEATHER file,
+        if no PKL file exists.
+
+        If ``columns`` or ``files`` is given,
+        only the selected part of the table is loaded,
+        compare :meth:`audformat.Table.pick_columns`
+        and :meth:`audformat.Table.pick_files`.
+        For PARQUET files
+        selected columns and files
+        are pushed down to the reader,
+        i.e. other columns and row groups
+        are not read from disk.
+
+        Args:
+            path: file path without extension
+            columns: only load selected columns.
+                Column IDs that are not part of the table are ignored
+            files: only load rows of selected files
+
+        Raises:
+            RuntimeError: if table file(s) are missing
+            RuntimeError: if CSV, FEATHER or PARQUET file is newer than PKL file
+            RuntimeError: if CSV or PARQUET file is newer than FEATHER file
+
+        """
+        self._load(path, columns=columns, files=files)
+        self._update_version()
+
     def map_files(
         self,
         func: typing.Callable[[str], str],
@@ -1786,6 +2818,7 @@ class Table(Base):
 
         """
         self.df.index = utils.map_file_path(self.df.index, func)
+        self._update_version()
 
     def pick_files(
         self,
@@ -1821,23 +2854,25 @@ class Table(Base):
             index = self.files.intersection(files)
             index.name = define.IndexField.FILE
             self._df = self.get(index, copy=False)
+        self._update_version()
 
         return self
 
     def _get_by_index(
         self,
         index: pd.Index,
+        df: pd.DataFrame,
     ) -> pd.DataFrame:
-        if index_type(self.index) == index_type(index):
-            result = self.df.loc[index]
+        if index_type(df.index) == index_type(index):
+            result = df.loc[index]
         else:
             files = index.get_level_values(define.IndexField.FILE)
-            if self.is_filewise:  # index is segmented
-                result = self.df.loc[files]
+            if is_filewise_index(df.index):  # index is segmented
+                result = df.loc[files]
                 result.index = index
             else:  # index is filewise
                 files = list(dict.fromkeys(files))  # remove duplicates
-                result = self.df.loc[files]
+                result = df.loc[files]
 
         return result
 
@@ -1858,6 +2893,29 @@ class Table(Base):
         return levels_and_dtypes
 
 
+_PARQUET_OPTIONS = {
+    "compression": "snappy",
+    "compression_level": None,
+    "row_group_size": None,
+    "sort_by_file": False,
+    "use_dictionary": True,
+}
+r"""Supported options for writing PARQUET files and their defaults."""
+
+
+def _assert_parquet_options(
+    parquet_options: typing.Optional[typing.Dict[str, typing.Any]],
+):
+    r"""Raise error if options for writing PARQUET file are unknown."""
+    for key in parquet_options or {}:
+        if key not in _PARQUET_OPTIONS:
+            raise ValueError(
+                f"Unknown PARQUET option '{key}', "
+                "parquet_options keys need to be one of: "
+                + ", ".join(_PARQUET_OPTIONS)
+            )
+
+
 def _assert_table_index(
     table: Base,
     index: pd.Index,
@@ -1902,6 +2960,51 @@ def _assert_table_index(
         )
 
 
+def _file_aligned_row_groups(
+    files: pa.ChunkedArray,
+    row_group_size: int,
+) -> typing.List[typing.Tuple[int, int]]:
+    r"""Split rows into row groups at file boundaries.
+
+    Consecutive rows of the same file
+    are put into the same row group.
+    A row group holds at most ``row_group_size`` rows,
+    unless a single file has more rows.
+
+    Args:
+        files: file column
+        row_group_size: maximum number of rows per row group
+
+    Returns:
+        start and end row of every row group
+
+    """
+    num_rows = len(files)
+    if num_rows == 0:
+        return [(0, 0)]
+    files = files.combine_chunks()
+    changed = pc.not_equal(files[1:], files[:-1]).to_numpy(zero_copy_only=False)
+    boundaries = (np.flatnonzero(changed) + 1).tolist() + [num_rows]
+    row_groups = []
+    start = previous = 0
+    for boundary in boundaries:
+        if boundary - start > row_group_size and previous > start:
+            row_groups.append((start, previous))
+            start = previous
+        previous = boundary
+    row_groups.append((start, num_rows))
+    return row_groups
+
+
+def _filter_files(
+    df: pd.DataFrame,
+    files: typing.Sequence[str],
+) -> pd.DataFrame:
+    r"""Select rows of dataframe that belong to files."""
+    mask = utils._isin_level(df.index, define.IndexField.FILE, files)
+    return df[mask]
+
+
 def _maybe_convert_dtype_to_string(
     index: pd.Index,
 ) -> pd.Index:
@@ -1924,3 +3027,43 @@ def _maybe_update_scheme(
         for scheme in table.db.schemes.values():
             if table._id == scheme.labels:
                 scheme.replace_labels(table._id)
+
+
+def _parquet_options_from_metadata(
+    metadata: typing.Optional[typing.Dict[bytes, bytes]],
+) -> typing.Dict[str, typing.Any]:
+    r"""Options stored in metadata of schema of PARQUET file."""
+    if metadata is None or b"parquet_options" not in metadata:
+        return {}
+    return json.loads(metadata[b"parquet_options"])
+
+
+def _select_row_groups(
+    parquet_file: parquet.ParquetFile,
+    files: typing.Sequence[str],
+) -> typing.List[int]:
+    r"""Select row groups that might contain files.
+
+    Uses the minimum and maximum file
+    stored in the statistics of every row group.
+
+    Args:
+        parquet_file: PARQUET file
+        files: selected files
+
+    Returns:
+        indices of row groups
+
+    """
+    files = sorted(files)
+    column = parquet_file.schema_arrow.get_field_index(define.IndexField.FILE)
+    row_groups = []
+    for idx in range(parquet_file.metadata.num_row_groups):
+        stats = parquet_file.metadata.row_group(idx).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            row_groups.append(idx)
+            continue
+        pos = bisect.bisect_left(files, stats.min)
+        if pos < len(files) and files[pos] <= stats.max:
+            row_groups.append(idx)
+    return row_groups
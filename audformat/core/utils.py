@@ -1,4 +1,3 @@
-import collections
 import errno
 import hashlib
 import os
@@ -39,7 +38,9 @@ def concat(
     objs: typing.Sequence[typing.Union[pd.Series, pd.DataFrame]],
     *,
     overwrite: bool = False,
-    aggregate_function: typing.Callable[[pd.Series], typing.Any] = None,
+    aggregate_function: typing.Union[
+        str, typing.Callable[[pd.Series], typing.Any]
+    ] = None,
     aggregate_strategy: str = "mismatch",
 ) -> typing.Union[pd.Series, pd.DataFrame]:
     r"""Concatenate objects.
@@ -73,6 +74,11 @@ def concat(
     with ``aggregate_function``
     that converts the overlapping values
     into a single value.
+    Built-in aggregations can be selected by name,
+    they are executed for all overlapping entries
+    of a column at once
+    and are much faster
+    than a custom function.
 
     Args:
         objs: objects
@@ -88,7 +94,16 @@ def concat(
             to average the values
             or to
             ``tuple``
-            to return them as a tuple
+            to return them as a tuple.
+            Or the name of a built-in aggregation,
+            which ignores ``NaN``:
+            ``'first'``: value of the first object;
+            ``'majority_vote'``: most frequent value,
+            on a tie the value of the first object;
+            ``'mean'``: average of values;
+            ``'median'``: median of values;
+            ``'mode'``: most frequent value,
+            on a tie the smallest value
         aggregate_strategy: if ``aggregate_function`` is not ``None``,
             ``aggregate_strategy`` decides
             when ``aggregate_function`` is applied.
@@ -104,8 +119,15 @@ def concat(
     Raises:
         ValueError: if level and dtypes of object indices do not match
         ValueError: if columns with the same name have different dtypes
+        ValueError: if ``aggregate_function`` is a string
+            and not one of
+            ``'first'``, ``'majority_vote'``, ``'mean'``,
+            ``'median'``, ``'mode'``
         ValueError: if ``aggregate_strategy`` is not one of
             ``'overlap'``, ``'mismatch'``
+        ValueError: if ``aggregate_function`` is ``'mean'`` or ``'median'``
+            and overlapping values of a column
+            are not numeric, dates or times
         ValueError: if ``aggregate_function`` is ``None``,
             ``overwrite`` is ``False``,
             and values in the same position do not match
@@ -161,6 +183,17 @@ def concat(
         dtype: Int64
         >>> concat(
         ...     [
+        ...         pd.Series([1.0, 1.0], index=pd.Index([0, 1])),
+        ...         pd.Series([1.0, 2.0], index=pd.Index([0, 1])),
+        ...         pd.Series([1.0, 6.0], index=pd.Index([0, 1])),
+        ...     ],
+        ...     aggregate_function="median",
+        ... )
+        0    1.0
+        1    2.0
+        dtype: float64
+        >>> concat(
+        ...     [
         ...         pd.Series(
         ...             [0.0, 1.0],
         ...             index=pd.Index(
@@ -232,6 +265,14 @@ def concat(
         f3   0 days NaT    2.0      b
 
     """
+    if isinstance(aggregate_function, str):
+        allowed_values = ["first", "majority_vote", "mean", "median", "mode"]
+        if aggregate_function not in allowed_values:
+            raise ValueError(
+                "aggregate_function needs to be a callable or one of: "
+                f"{', '.join(allowed_values)}"
+            )
+
     allowed_values = ["overlap", "mismatch"]
     if aggregate_strategy not in allowed_values:
         raise ValueError(
@@ -251,21 +292,32 @@ def concat(
     # the new index is a union of the individual objects
     index = union([obj.index for obj in objs])
 
-    # list with all columns we need to concatenate
+    # list with all columns we need to concatenate,
+    # together with the integer positions
+    # of their entries in the new index.
+    # The positions are calculated once per object,
+    # afterwards all operations are positional
     columns = []
     return_as_frame = False
     for obj in objs:
+        positions = index.get_indexer(obj.index)
         if isinstance(obj, pd.Series):
-            columns.append(obj)
+            columns.append((obj, positions))
         else:
             return_as_frame = True
             for column in obj:
-                columns.append(obj[column])
+                columns.append((obj[column], positions))
 
     # reindex all columns to the new index
     columns_reindex = {}
+    # mask of entries in the new index
+    # that are already set to a non-NaN value
+    columns_filled = {}
     overlapping_values = {}
-    for column in columns:
+    for column, positions in columns:
+        values = column.array
+        valid = column.notna().to_numpy()
+
         # if we already have a column with that name, we have to merge them
         if column.name in columns_reindex:
             dtype_1 = columns_reindex[column.name].dtype
@@ -287,57 +339,40 @@ def concat(
                 )
 
             # Fix changed handling of float32/float64 in pandas>=1.3
-            if "float64" in [dtype_1, dtype_2]:
+            if "float64" in [dtype_1, dtype_2] and dtype_1 != "float64":
                 columns_reindex[column.name] = columns_reindex[column.name].astype(
                     "float64"
                 )
 
             # Handle overlapping values
             if not overwrite:
-
-                def collect_overlap(overlapping_values, column, index):
-                    """Collect overlap for aggregate function."""
-                    if column.name not in overlapping_values:
-                        overlapping_values[column.name] = []
-                    overlapping_values[column.name].append(column.loc[index])
-                    column = column.loc[~column.index.isin(index)]
-                    column = column.dropna()
-                    return column, overlapping_values
-
-                # Apply aggregate function only to overlapping entries
-                intersection = intersect(
-                    [
-                        columns_reindex[column.name].dropna().index,
-                        column.dropna().index,
-                    ]
-                )
-                # We use len() here as index.empty takes a very long time
-                if len(intersection) > 0:
+                # Entries that are not NaN in both columns
+                overlap = valid & columns_filled[column.name][positions]
+                if overlap.any():
                     # Apply aggregate function
                     # to all overlapping entries
                     if (
                         aggregate_function is not None
                         and aggregate_strategy == "overlap"
                     ):
-                        column, overlapping_values = collect_overlap(
-                            overlapping_values,
-                            column,
-                            intersection,
+                        overlapping_values.setdefault(column.name, []).append(
+                            column[overlap]
+                        )
+                        valid = valid & ~overlap
+                        _assign_positions(
+                            columns_reindex[column.name],
+                            columns_filled[column.name],
+                            positions[valid],
+                            values[valid],
                         )
-                        columns_reindex[column.name][column.index] = column
                         continue
 
                     # Find data that differ and cannot be joined
-                    combine = pd.DataFrame(
-                        {
-                            "left": columns_reindex[column.name][intersection],
-                            "right": column[intersection],
-                        }
-                    )
-                    combine.dropna(inplace=True)
-                    differ = combine["left"] != combine["right"]
+                    left = columns_reindex[column.name].array.take(positions[overlap])
+                    right = values[overlap]
+                    differ = np.asarray(left != right, dtype=bool)
 
-                    if np.any(differ):
+                    if differ.any():
                         # Apply aggregate function
                         # to overlapping entries
                         # that do not match in value
@@ -345,17 +380,27 @@ def concat(
                             aggregate_function is not None
                             and aggregate_strategy == "mismatch"
                         ):
-                            column, overlapping_values = collect_overlap(
-                                overlapping_values,
-                                column,
-                                intersection[differ],
+                            mismatch = np.zeros(len(column), dtype=bool)
+                            mismatch[np.flatnonzero(overlap)[differ]] = True
+                            overlapping_values.setdefault(column.name, []).append(
+                                column[mismatch]
+                            )
+                            valid = valid & ~mismatch
+                            _assign_positions(
+                                columns_reindex[column.name],
+                                columns_filled[column.name],
+                                positions[valid],
+                                values[valid],
                             )
-                            columns_reindex[column.name][column.index] = column
                             continue
 
                         # Raise error if values don't match and are not NaN
                         else:
                             max_display = 10
+                            combine = pd.DataFrame(
+                                {"left": left, "right": right},
+                                index=column.index[overlap],
+                            )
                             overlap = combine[differ]
                             msg_overlap = str(overlap[:max_display])
                             msg_tail = "\n..." if len(overlap) > max_display else ""
@@ -366,7 +411,8 @@ def concat(
                             )
 
             # drop NaN to avoid overwriting values from other column
-            column = column.dropna()
+            positions = positions[valid]
+            values = values[valid]
         else:
             # Adjust dtype and initialize empty column
             if pd.api.types.is_integer_dtype(column.dtype):
@@ -379,37 +425,49 @@ def concat(
                 index=index,
                 dtype=dtype,
             )
-        columns_reindex[column.name].loc[column.index] = column
+            columns_filled[column.name] = np.zeros(len(index), dtype=bool)
+        _assign_positions(
+            columns_reindex[column.name],
+            columns_filled[column.name],
+            positions,
+            values,
+        )
 
-    # Apply custom aggregation function
+    # Apply aggregation function
     # on collected overlapping data
     # (no overlapping data is collected
     #  when no aggregation function is provided)
-    if len(overlapping_values) > 0:
-        for column in overlapping_values:
+    for column, ys in overlapping_values.items():
+        dtype = columns_reindex[column].dtype
+
+        if isinstance(aggregate_function, str):
+            positions, y = _aggregate(
+                aggregate_function,
+                column,
+                columns_reindex[column],
+                [(index.get_indexer(y.index), y) for y in ys],
+            )
+        else:
             # Add data of first column
             # overlapping with all other columns
-            union_index = union([y.index for y in overlapping_values[column]])
-            overlapping_values[column].insert(
-                0, columns_reindex[column].loc[union_index]
-            )
+            union_index = union([y.index for y in ys])
+            ys.insert(0, columns_reindex[column].loc[union_index])
 
             # Convert list of overlapping data series to data frame
             # and apply aggregate function
-            df = pd.concat(
-                overlapping_values[column],
-                axis=1,
-                ignore_index=True,
-            )
-            dtype = columns_reindex[column].dtype
+            df = pd.concat(ys, axis=1, ignore_index=True)
             y = df.apply(aggregate_function, axis=1)
+            positions = None
 
-            # Restore the original dtype if possible
-            try:
-                y = y.astype(dtype)
-            except (TypeError, ValueError):
-                columns_reindex[column] = columns_reindex[column].astype(y.dtype)
+        # Restore the original dtype if possible
+        try:
+            y = y.astype(dtype)
+        except (TypeError, ValueError):
+            columns_reindex[column] = columns_reindex[column].astype(y.dtype)
+        if positions is None:
             columns_reindex[column].loc[y.index] = y
+        else:
+            columns_reindex[column].iloc[positions] = y.array
 
     # Use `None` to force `{}` return the correct index, see
     # https://github.com/pandas-dev/pandas/issues/52404
@@ -542,14 +600,12 @@ def difference(
     objs = _maybe_convert_single_level_multi_index(objs)
     _assert_index_alike(objs)
 
-    index = list(objs[0])
-    for obj in objs[1:]:
-        index += list(obj)
-
-    counting = collections.Counter(index)
-    index = [idx for idx, count in counting.items() if count == 1]
-
-    index = _alike_index(objs[0], index)
+    # Combine all index entries
+    # and keep entries that occur only once,
+    # duplicates are detected by hashing the index values
+    index = objs[0].append(objs[1:])
+    index = index[~index.duplicated(keep=False)]
+    index = _set_alike_dtypes(index, objs[0])
 
     return index
 
@@ -667,6 +723,8 @@ def expand_file_path(
 def hash(
     obj: typing.Union[pd.Index, pd.Series, pd.DataFrame],
     strict: bool = False,
+    *,
+    version: int = 1,
 ) -> str:
     r"""Create hash from object.
 
@@ -689,11 +747,27 @@ def hash(
             the hash takes into account
             the order of rows
             and column/level names
+        version: version of the hash
+            if ``strict`` is ``True``.
+            ``1`` hashes the string representation
+            of every column,
+            which includes only the first and last values
+            of columns with more than 1000 entries;
+            ``2`` hashes the binary data
+            of every column
+            after converting it to :mod:`pyarrow`,
+            which is much faster
+            and includes all values.
+            :meth:`audformat.Table.save`
+            uses version ``2``
 
     Returns:
         hash string with 19 characters,
         or 32 characters if ``strict`` is ``True``
 
+    Raises:
+        ValueError: if ``version`` is not ``1`` or ``2``
+
     Examples:
         >>> index = filewise_index(["f1", "f2"])
         >>> hash(index)
@@ -707,8 +781,17 @@ def hash(
         '0741235e2250e0fcd9ab7b64972f5047'
         >>> hash(index[::-1], strict=True)  # reversed index
         'c6639d377897dd9353dc3e8b2968170d'
+        >>> hash(index, strict=True, version=2)
+        '08ce537fac12d524a82eb683c84b5e3b'
 
     """
+    allowed_values = [1, 2]
+    if version not in allowed_values:
+        raise ValueError(
+            "version needs to be one of: "
+            f"{', '.join(str(v) for v in allowed_values)}"
+        )
+
     if strict:
         if isinstance(obj, pd.Index):
             df = obj.to_frame()
@@ -718,6 +801,8 @@ def hash(
             df = obj.reset_index()
         # Handle column names and dtypes
         table = pa.Table.from_pandas(df, preserve_index=False)
+        if version == 2:
+            return _hash_arrow_table(table)
         schema_str = table.schema.to_string(
             # schema.metadata contains pandas related information,
             # and the used pyarrow and pandas version,
@@ -790,15 +875,21 @@ def index_has_overlap(
     if is_filewise_index(index):
         return False
 
-    for _, sub_index in iter_by_file(index):
-        sub_index = sub_index.sortlevel(define.IndexField.START)[0]
-        starts = sub_index.get_level_values(define.IndexField.START)
-        ends = sub_index.get_level_values(define.IndexField.END)
-        ends = ends.fillna(pd.Timedelta(sys.maxsize))
-        if any(ends[:-1] > starts[1:]):
-            return True
+    # Sort segments once by file, start, and end
+    # and compare the end of every segment
+    # with the start of the next segment
+    # of the same file
+    files = index.codes[index.names.index(define.IndexField.FILE)]
+    starts = index.get_level_values(define.IndexField.START).to_numpy()
+    ends = index.get_level_values(define.IndexField.END)
+    ends = ends.fillna(pd.Timedelta(sys.maxsize)).to_numpy()
+    order = np.lexsort((ends, starts, files))
+    files = files[order]
+    starts = starts[order]
+    ends = ends[order]
+    same_file = files[:-1] == files[1:]
 
-    return False
+    return bool(np.any(same_file & (ends[:-1] > starts[1:])))
 
 
 def intersect(
@@ -912,27 +1003,17 @@ def intersect(
     objs = _maybe_convert_single_level_multi_index(objs)
     _assert_index_alike(objs)
 
-    # sort objects by length
-    objs_sorted = sorted(objs, key=lambda obj: len(obj))
-
-    # return if the shortest obj has no entries
-    if len(objs_sorted[0]) == 0:
-        return _alike_index(objs[0])
-
-    # start from shortest object
-    index = list(objs_sorted[0])
-    for obj in objs_sorted[1:]:
-        index = [idx for idx in index if idx in obj]
+    # Keep entries of first object
+    # that are contained in all other objects,
+    # lookups are done by hashing the index values
+    index = objs[0].drop_duplicates()
+    for obj in sorted(objs[1:], key=lambda obj: len(obj)):
+        index = index[obj.unique().get_indexer(index) >= 0]
         if len(index) == 0:
             # break early if no more intersection is possible
             break
 
-    index = _alike_index(objs[0], index)
-
-    # Ensure we have order of first object
-    index = objs[0].intersection(index)
-    if isinstance(index, pd.MultiIndex):
-        index = set_index_dtypes(index, objs[0].dtypes.to_dict())
+    index = _set_alike_dtypes(index, objs[0])
 
     return index
 
@@ -1038,7 +1119,7 @@ def iter_by_file(
 
     # We use len() here as index.empty takes a very long time
     if len(index) != 0:
-        files = index.get_level_values("file").drop_duplicates()
+        files = index.unique(level=define.IndexField.FILE)
         if is_filewise_index(index):
             for file in files:
                 sub_index = filewise_index(file)
@@ -1747,6 +1828,8 @@ def to_segmented_index(
             it is added to the mapping.
             Expects absolute file names
             and durations as :class:`pd.Timedelta` objects.
+            If ``num_workers`` is not 1,
+            the mapping has to be thread-safe.
             Only relevant if ``allow_nat`` is set to ``False``
         root: root directory under which the files referenced in the index
             are stored
@@ -1831,7 +1914,10 @@ def to_segmented_index(
 
                 return dur
 
-            params = [([file], {}) for file in files[idx_nat]]
+            # Read duration only once per file
+            files_nat = files[idx_nat]
+            files_unique = files_nat.unique()
+            params = [([file], {}) for file in files_unique]
             durs = audeer.run_tasks(
                 job,
                 params,
@@ -1839,6 +1925,8 @@ def to_segmented_index(
                 progress_bar=verbose,
                 task_description="Read duration",
             )
+            durs = dict(zip(files_unique, durs))
+            durs = [durs[file] for file in files_nat]
 
             # Replace all NaT entries in end
             # by the collected duration values.
@@ -1975,6 +2063,12 @@ def union(
     objs = _maybe_convert_single_level_multi_index(objs)
     _assert_index_alike(objs)
 
+    # Skip indices that equal the first one,
+    # e.g. when combining columns of the same table
+    objs = objs[:1] + [obj for obj in objs[1:] if not obj.equals(objs[0])]
+    if len(objs) == 1:
+        return objs[0].drop_duplicates()
+
     # Combine all index entries and drop duplicates afterwards,
     # faster than using index.union(),
     # compare https://github.com/audeering/audformat/pull/98
@@ -2020,6 +2114,83 @@ def union(
     return index
 
 
+def _aggregate(
+    aggregate_function: str,
+    column: typing.Hashable,
+    y: pd.Series,
+    overlaps: typing.Sequence[typing.Tuple[np.ndarray, pd.Series]],
+) -> typing.Tuple[np.ndarray, pd.Series]:
+    r"""Apply built-in aggregation to overlapping values.
+
+    All values are stacked into a single series
+    and reduced per position in a single groupby operation,
+    ``NaN`` values are ignored.
+
+    Args:
+        aggregate_function: name of aggregation
+        column: name of column
+        y: concatenated column
+        overlaps: positions in ``y``
+            and overlapping values
+
+    Returns:
+        positions in ``y`` and aggregated values
+
+    Raises:
+        ValueError: if ``aggregate_function`` is ``'mean'`` or ``'median'``
+            and ``y`` is not numeric, a date or a time
+
+    """
+    if aggregate_function in ["mean", "median"] and not (
+        pd.api.types.is_numeric_dtype(y.dtype)
+        or pd.api.types.is_datetime64_any_dtype(y.dtype)
+        or pd.api.types.is_timedelta64_dtype(y.dtype)
+    ):
+        raise ValueError(
+            f"Cannot apply aggregate_function '{aggregate_function}' "
+            f"to column '{column}' "
+            f"of dtype '{y.dtype}'."
+        )
+
+    positions = np.unique(np.concatenate([pos for pos, _ in overlaps]))
+
+    # Values of first column are stacked first
+    # to make them win ties
+    keys = np.concatenate([positions] + [pos for pos, _ in overlaps])
+    values = pd.concat(
+        [y.iloc[positions]] + [ys for _, ys in overlaps],
+        ignore_index=True,
+    )
+    if aggregate_function in ["mean", "median"] and pd.api.types.is_numeric_dtype(
+        values.dtype
+    ):
+        values = values.astype("float64")
+    df = pd.DataFrame({"position": keys, "value": values.array})
+    df = df[df["value"].notna()]
+
+    if aggregate_function in ["first", "mean", "median"]:
+        grouped = df.groupby("position", sort=True)["value"]
+        y = getattr(grouped, aggregate_function)()
+    else:
+        # Count occurrences of every value per position
+        # and remember where the value occurred first
+        df["order"] = np.arange(len(df))
+        counts = (
+            df.groupby(["position", "value"], sort=False, observed=True)["order"]
+            .agg(["size", "min"])
+            .reset_index()
+        )
+        tie_breaker = "value" if aggregate_function == "mode" else "min"
+        counts = counts.sort_values(
+            ["position", "size", tie_breaker],
+            ascending=[True, False, True],
+            kind="stable",
+        ).drop_duplicates("position")
+        y = pd.Series(counts["value"].array, index=counts["position"].to_numpy())
+
+    return y.index.to_numpy(), y
+
+
 def _alike_index(
     index: pd.Index,
     data: typing.Sequence = [],
@@ -2082,6 +2253,25 @@ def _assert_index_alike(
     raise ValueError(msg)
 
 
+def _assign_positions(
+    y: pd.Series,
+    filled: np.ndarray,
+    positions: np.ndarray,
+    values: pd.api.extensions.ExtensionArray,
+):
+    r"""Set values of series at integer positions.
+
+    Updates ``filled`` in place
+    to mark the positions,
+    where ``y`` holds a non-NaN value.
+
+    """
+    # We use len() here as index.empty takes a very long time
+    if len(positions) > 0:
+        y.iloc[positions] = values
+        filled[positions] = pd.notna(values)
+
+
 def _audformat_dtypes(index) -> typing.List[str]:
     r"""List of audformat data types of index.
 
@@ -2096,6 +2286,74 @@ def _audformat_dtypes(index) -> typing.List[str]:
     return [to_audformat_dtype(dtype) for dtype in dtypes]
 
 
+def _hash_arrow_array(
+    md5: "hashlib._Hash",
+    y: pa.Array,
+):
+    r"""Stream canonical bytes of array into digest.
+
+    Values at positions of missing values are replaced,
+    so that the bytes depend only on the mask
+    of missing values
+    and on the valid values.
+
+    """
+    if pa.types.is_dictionary(y.type):
+        _hash_arrow_array(md5, y.dictionary)
+        _hash_arrow_array(md5, y.indices)
+        return
+
+    md5.update(np.int64(len(y)).tobytes())
+    if y.null_count > 0:
+        valid = y.is_valid().to_numpy(zero_copy_only=False)
+        md5.update(np.packbits(valid).tobytes())
+
+    if pa.types.is_null(y.type):
+        return
+    elif pa.types.is_string(y.type) or pa.types.is_large_string(y.type):
+        # Hash length of every string
+        # and the concatenated bytes of all strings
+        y = y.fill_null("").cast(pa.large_binary())
+        offsets = np.frombuffer(y.buffers()[1], dtype="int64")
+        offsets = offsets[y.offset : y.offset + len(y) + 1]
+        md5.update(np.diff(offsets).tobytes())
+        if len(y) > 0:
+            md5.update(memoryview(y.buffers()[2])[offsets[0] : offsets[-1]])
+        return
+    elif pa.types.is_boolean(y.type):
+        values = y.fill_null(False).to_numpy(zero_copy_only=False)
+    elif pa.types.is_integer(y.type) or pa.types.is_floating(y.type):
+        values = y.fill_null(0).to_numpy()
+    elif pa.types.is_timestamp(y.type) or pa.types.is_duration(y.type):
+        values = y.cast(pa.int64()).fill_null(0).to_numpy()
+    else:
+        # Other data types,
+        # e.g. nested lists,
+        # are hashed by their string representation
+        md5.update(str(y.to_pylist()).encode())
+        return
+    md5.update(values.tobytes())
+
+
+def _hash_arrow_table(table: pa.Table) -> str:
+    r"""Strict hash of table.
+
+    Hashes the schema of the table
+    and streams the canonical bytes of every column
+    into the digest.
+
+    """
+    schema_str = table.schema.to_string(
+        show_field_metadata=False,
+        show_schema_metadata=False,
+    )
+    md5 = hashlib.md5()
+    md5.update(schema_str.encode())
+    for column in table.columns:
+        _hash_arrow_array(md5, column.combine_chunks())
+    return md5.hexdigest()
+
+
 def _is_same_dtype(d1, d2) -> bool:
     r"""Helper function to compare pandas dtype."""
     if d1.name.startswith("bool") and d2.name.startswith("bool"):
@@ -2113,6 +2371,35 @@ def _is_same_dtype(d1, d2) -> bool:
     return d1.name == d2.name
 
 
+def _isin_level(
+    index: pd.Index,
+    level: str,
+    values: typing.Sequence,
+) -> np.ndarray:
+    r"""Check which entries of a level are contained in values.
+
+    For a :class:`pandas.MultiIndex`
+    only the unique values of the level are checked,
+    instead of the values of every entry.
+
+    Args:
+        index: index
+        level: name of level
+        values: values
+
+    Returns:
+        boolean mask
+
+    """
+    if not isinstance(index, pd.MultiIndex):
+        return index.isin(values)
+    idx = index.names.index(level)
+    # Append False for missing values,
+    # which have a code of -1
+    isin = np.append(index.levels[idx].isin(values), False)
+    return isin[index.codes[idx]]
+
+
 def _levels(index) -> typing.List[str]:
     r"""List of levels of index.
 
@@ -2238,3 +2525,14 @@ def _pandas_dtypes(index) -> typing.List[typing.Any]:
         return list(index.dtypes)
     else:
         return [index.dtype]
+
+
+def _set_alike_dtypes(
+    index: pd.Index,
+    other: pd.Index,
+) -> pd.Index:
+    r"""Set dtypes of index to dtypes of other index."""
+    if isinstance(index, pd.MultiIndex):
+        return set_index_dtypes(index, other.dtypes.to_dict())
+    else:
+        return set_index_dtypes(index, other.dtype)
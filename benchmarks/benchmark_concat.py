@@ -0,0 +1,326 @@
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+
+import audformat
+from audformat.core.utils import _assert_index_alike
+from audformat.core.utils import _is_same_dtype
+from audformat.core.utils import _maybe_convert_filewise_index
+from audformat.core.utils import _maybe_convert_single_level_multi_index
+from audformat.utils import intersect
+from audformat.utils import union
+
+
+# Benchmark for the utility function
+# audformat.utils.concat()
+# that combines a list of series and frames,
+# as used by Table.update(), Table.__add__() and Database.get().
+#
+# audformat.utils.concat() aligns all objects once
+# against the union of their index
+# and handles overlapping values
+# with vectorized operations on integer positions.
+# It is compared to its previous implementation,
+# that merged columns one by one
+# using label-based indexing.
+
+
+np.random.seed(1)
+
+
+def concat_legacy(
+    objs: typing.Sequence[typing.Union[pd.Series, pd.DataFrame]],
+    *,
+    overwrite: bool = False,
+    aggregate_function: typing.Callable[[pd.Series], typing.Any] = None,
+    aggregate_strategy: str = "mismatch",
+) -> typing.Union[pd.Series, pd.DataFrame]:
+    r"""Previous implementation of audformat.utils.concat()."""
+    if not objs:
+        return pd.Series([], index=pd.Index([]), dtype="object")
+
+    if len(objs) == 1:
+        return objs[0]
+
+    objs = _maybe_convert_filewise_index(objs)
+    objs = _maybe_convert_single_level_multi_index(objs)
+    _assert_index_alike(objs)
+
+    # the new index is a union of the individual objects
+    index = union([obj.index for obj in objs])
+
+    # list with all columns we need to concatenate
+    columns = []
+    return_as_frame = False
+    for obj in objs:
+        if isinstance(obj, pd.Series):
+            columns.append(obj)
+        else:
+            return_as_frame = True
+            for column in obj:
+                columns.append(obj[column])
+
+    # reindex all columns to the new index
+    columns_reindex = {}
+    overlapping_values = {}
+    for column in columns:
+        # if we already have a column with that name, we have to merge them
+        if column.name in columns_reindex:
+            dtype_1 = columns_reindex[column.name].dtype
+            dtype_2 = column.dtype
+
+            # assert same dtype
+            if not _is_same_dtype(dtype_1, dtype_2):
+                if dtype_1.name == "category":
+                    dtype_1 = repr(dtype_1)
+                if dtype_2.name == "category":
+                    dtype_2 = repr(dtype_2)
+                raise ValueError(
+                    "Found two columns with name "
+                    f"'{column.name}' "
+                    "but different dtypes:\n"
+                    f"{dtype_1} "
+                    "!= "
+                    f"{dtype_2}."
+                )
+
+            # Fix changed handling of float32/float64 in pandas>=1.3
+            if "float64" in [dtype_1, dtype_2]:
+                columns_reindex[column.name] = columns_reindex[column.name].astype(
+                    "float64"
+                )
+
+            # Handle overlapping values
+            if not overwrite:
+
+                def collect_overlap(overlapping_values, column, index):
+                    """Collect overlap for aggregate function."""
+                    if column.name not in overlapping_values:
+                        overlapping_values[column.name] = []
+                    overlapping_values[column.name].append(column.loc[index])
+                    column = column.loc[~column.index.isin(index)]
+                    column = column.dropna()
+                    return column, overlapping_values
+
+                # Apply aggregate function only to overlapping entries
+                intersection = intersect(
+                    [
+                        columns_reindex[column.name].dropna().index,
+                        column.dropna().index,
+                    ]
+                )
+                # We use len() here as index.empty takes a very long time
+                if len(intersection) > 0:
+                    # Apply aggregate function
+                    # to all overlapping entries
+                    if (
+                        aggregate_function is not None
+                        and aggregate_strategy == "overlap"
+                    ):
+                        column, overlapping_values = collect_overlap(
+                            overlapping_values,
+                            column,
+                            intersection,
+                        )
+                        columns_reindex[column.name][column.index] = column
+                        continue
+
+                    # Find data that differ and cannot be joined
+                    combine = pd.DataFrame(
+                        {
+                            "left": columns_reindex[column.name][intersection],
+                            "right": column[intersection],
+                        }
+                    )
+                    combine.dropna(inplace=True)
+                    differ = combine["left"] != combine["right"]
+
+                    if np.any(differ):
+                        # Apply aggregate function
+                        # to overlapping entries
+                        # that do not match in value
+                        if (
+                            aggregate_function is not None
+                            and aggregate_strategy == "mismatch"
+                        ):
+                            column, overlapping_values = collect_overlap(
+                                overlapping_values,
+                                column,
+                                intersection[differ],
+                            )
+                            columns_reindex[column.name][column.index] = column
+                            continue
+
+                        # Raise error if values don't match and are not NaN
+                        else:
+                            max_display = 10
+                            overlap = combine[differ]
+                            msg_overlap = str(overlap[:max_display])
+                            msg_tail = "\n..." if len(overlap) > max_display else ""
+                            raise ValueError(
+                                "Found overlapping data in column "
+                                f"'{column.name}':\n"
+                                f"{msg_overlap}{msg_tail}"
+                            )
+
+            # drop NaN to avoid overwriting values from other column
+            column = column.dropna()
+        else:
+            # Adjust dtype and initialize empty column
+            if pd.api.types.is_integer_dtype(column.dtype):
+                dtype = "Int64"
+            elif pd.api.types.is_bool_dtype(column.dtype):
+                dtype = "boolean"
+            else:
+                dtype = column.dtype
+            columns_reindex[column.name] = pd.Series(
+                index=index,
+                dtype=dtype,
+            )
+        columns_reindex[column.name].loc[column.index] = column
+
+    # Apply custom aggregation function
+    # on collected overlapping data
+    # (no overlapping data is collected
+    #  when no aggregation function is provided)
+    if len(overlapping_values) > 0:
+        for column in overlapping_values:
+            # Add data of first column
+            # overlapping with all other columns
+            union_index = union([y.index for y in overlapping_values[column]])
+            overlapping_values[column].insert(
+                0, columns_reindex[column].loc[union_index]
+            )
+
+            # Convert list of overlapping data series to data frame
+            # and apply aggregate function
+            df = pd.concat(
+                overlapping_values[column],
+                axis=1,
+                ignore_index=True,
+            )
+            dtype = columns_reindex[column].dtype
+            y = df.apply(aggregate_function, axis=1)
+
+            # Restore the original dtype if possible
+            try:
+                y = y.astype(dtype)
+            except (TypeError, ValueError):
+                columns_reindex[column] = columns_reindex[column].astype(y.dtype)
+            columns_reindex[column].loc[y.index] = y
+
+    # Use `None` to force `{}` return the correct index, see
+    # https://github.com/pandas-dev/pandas/issues/52404
+    df = pd.DataFrame(columns_reindex or None, index=index)
+
+    if not return_as_frame and len(df.columns) == 1:
+        return df[df.columns[0]]
+    else:
+        return df
+
+
+def create_objs(
+    num_obj: int,
+    num_seg: int,
+    num_col: int,
+    segmented: bool,
+) -> typing.List[pd.DataFrame]:
+    r"""Create partial tables with overlapping index and columns.
+
+    Every object covers half of the files
+    of its neighbour
+    and holds a random subset of all columns.
+    Overlapping entries have identical values.
+
+    """
+    num_files = num_obj * num_seg // 2 + num_seg
+    files = [f"file-{idx}" for idx in range(num_files)]
+    values = np.random.randint(0, 10, (num_files, num_col)).astype("float")
+    column_ids = [f"column-{idx}" for idx in range(num_col)]
+    objs = []
+    for idx in range(num_obj):
+        rows = slice(idx * num_seg // 2, idx * num_seg // 2 + num_seg)
+        if segmented:
+            index = audformat.segmented_index(
+                files[rows],
+                [0] * num_seg,
+                [1] * num_seg,
+            )
+        else:
+            index = audformat.filewise_index(files[rows])
+        cols = sorted(np.random.choice(num_col, max(1, num_col // 2), replace=False))
+        obj = pd.DataFrame(
+            values[rows][:, cols],
+            index=index,
+            columns=[column_ids[col] for col in cols],
+        )
+        objs.append(obj)
+    return objs
+
+
+def benchmark(
+    segmented: bool,
+    num_objs: typing.Sequence[int],
+    num_segs: typing.Sequence[int],
+    num_cols: typing.Sequence[int],
+    num_repeat: int,
+) -> pd.DataFrame:
+    ds = []
+
+    for num_obj, num_seg, num_col in zip(num_objs, num_segs, num_cols):
+        objs = create_objs(num_obj, num_seg, num_col, segmented)
+
+        elapsed = {}
+        results = {}
+        for name, func in [
+            ("legacy", concat_legacy),
+            ("vectorized", audformat.utils.concat),
+        ]:
+            t = time.time()
+            for _ in range(num_repeat):
+                results[name] = func(objs)
+            elapsed[name] = (time.time() - t) / num_repeat
+
+        pd.testing.assert_frame_equal(results["legacy"], results["vectorized"])
+
+        d = {
+            "num_obj": num_obj,
+            "num_seg": num_seg,
+            "num_col": num_col,
+            "legacy": elapsed["legacy"],
+            "vectorized": elapsed["vectorized"],
+            "speedup": elapsed["legacy"] / elapsed["vectorized"],
+        }
+        ds.append(d)
+
+    df = pd.DataFrame(ds).set_index(["num_obj", "num_seg", "num_col"])
+
+    return df
+
+
+def main():
+    num_objs = [2, 10, 100, 500]
+    num_segs = [100000, 1000, 100, 100]
+    num_cols = [10, 10, 100, 20]
+    num_repeat = 1
+
+    print(f"Execution time in seconds averaged over {num_repeat} runs.")
+
+    for segmented in [False, True]:
+        print()
+        print(f"{'segmented' if segmented else 'filewise'} index")
+
+        df = benchmark(
+            segmented,
+            num_objs,
+            num_segs,
+            num_cols,
+            num_repeat,
+        )
+        print(df.round(3))
+
+
+if __name__ == "__main__":
+    main()
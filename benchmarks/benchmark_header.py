@@ -0,0 +1,161 @@
+import os
+import tempfile
+import time
+import typing
+
+import oyaml as yaml
+import pandas as pd
+
+import audformat
+
+
+# Benchmark for serializing and comparing the header
+# of a database with a growing number of schemes.
+#
+# audformat.Database.save() writes the header
+# with the C implementation of the YAML dumper,
+# and header objects are compared
+# by their dictionary representation.
+# It is compared to the previous implementation,
+# that used the Python implementation of the YAML dumper
+# and compared the YAML representation
+# of the database,
+# and again of every table.
+
+
+def dump_legacy(
+    obj: audformat.core.common.HeaderBase,
+    stream=None,
+) -> str:
+    r"""Previous implementation of audformat.core.common.HeaderBase.dump()."""
+    return yaml.dump(
+        obj.to_dict(),
+        stream=stream,
+        default_flow_style=None,
+        indent=2,
+        allow_unicode=True,
+    )
+
+
+def save_legacy(
+    db: audformat.Database,
+    root: str,
+):
+    r"""Previous implementation of audformat.Database.save(header_only=True)."""
+    with open(os.path.join(root, "db.yaml"), "w") as fp:
+        dump_legacy(db, fp)
+
+
+def eq_legacy(
+    db: audformat.Database,
+    other: audformat.Database,
+) -> bool:
+    r"""Previous implementation of audformat.Database.__eq__()."""
+    if dump_legacy(db) != dump_legacy(other):
+        return False
+    for table_id in list(db.tables) + list(db.misc_tables):
+        if dump_legacy(db[table_id]) != dump_legacy(other[table_id]):
+            return False
+        if not db[table_id].df.equals(other[table_id].df):
+            return False
+    return True
+
+
+def create_db(
+    num_scheme: int,
+) -> audformat.Database:
+    r"""Create database with one column per scheme.
+
+    Every scheme has a dictionary of labels
+    and is assigned to a column
+    of a filewise table.
+
+    """
+    db = audformat.Database("db")
+    db.raters["rater"] = audformat.Rater()
+    db["files"] = audformat.Table(audformat.filewise_index(["f1.wav", "f2.wav"]))
+    for idx in range(num_scheme):
+        scheme_id = f"scheme-{idx}"
+        db.schemes[scheme_id] = audformat.Scheme(
+            labels={
+                f"label-{label}": {"description": f"Label {label}"}
+                for label in range(10)
+            },
+            description=f"Scheme {idx}",
+        )
+        db["files"][scheme_id] = audformat.Column(
+            scheme_id=scheme_id,
+            rater_id="rater",
+        )
+    return db
+
+
+def benchmark(
+    num_schemes: typing.Sequence[int],
+    num_repeat: int,
+) -> pd.DataFrame:
+    ds = []
+
+    for num_scheme in num_schemes:
+        db = create_db(num_scheme)
+        other = create_db(num_scheme)
+
+        with tempfile.TemporaryDirectory() as root:
+            for operation, legacy, current in [
+                (
+                    "save",
+                    lambda: save_legacy(db, root),
+                    lambda: db.save(root, header_only=True),
+                ),
+                (
+                    "eq",
+                    lambda: eq_legacy(db, other),
+                    lambda: db == other,
+                ),
+            ]:
+                elapsed = {}
+                results = {}
+                for name, func in [
+                    ("legacy", legacy),
+                    ("current", current),
+                ]:
+                    t = time.time()
+                    for _ in range(num_repeat):
+                        results[name] = func()
+                    elapsed[name] = (time.time() - t) / num_repeat
+
+                if operation == "save":
+                    header = audformat.Database.load(root, load_data=False)
+                    save_legacy(db, root)
+                    header_legacy = audformat.Database.load(root, load_data=False)
+                    assert header.to_dict() == header_legacy.to_dict()
+                else:
+                    assert results["legacy"] == results["current"]
+
+                d = {
+                    "operation": operation,
+                    "num_scheme": num_scheme,
+                    "legacy": elapsed["legacy"],
+                    "current": elapsed["current"],
+                    "speedup": elapsed["legacy"] / elapsed["current"],
+                }
+                ds.append(d)
+
+    df = pd.DataFrame(ds).set_index(["operation", "num_scheme"]).sort_index()
+
+    return df
+
+
+def main():
+    num_schemes = [10, 100, 1000]
+    num_repeat = 5
+
+    print(f"Execution time in seconds averaged over {num_repeat} runs.")
+    print()
+
+    df = benchmark(num_schemes, num_repeat)
+    print(df.round(4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import sys
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+
+import audformat
+from audformat.core import define
+from audformat.core.index import is_filewise_index
+from audformat.utils import iter_by_file
+
+
+# Benchmark for the utility function
+# audformat.utils.index_has_overlap()
+# that checks if segments of the same file overlap.
+#
+# audformat.utils.index_has_overlap() sorts all segments once
+# by file, start, and end
+# and compares neighbouring segments with vectorized operations.
+# It is compared to its previous implementation,
+# that iterated over every file.
+
+
+np.random.seed(1)
+
+
+def index_has_overlap_legacy(
+    obj: typing.Union[pd.Index, pd.DataFrame, pd.Series],
+) -> bool:
+    r"""Previous implementation of audformat.utils.index_has_overlap()."""
+    index = obj if isinstance(obj, pd.Index) else obj.index
+
+    if is_filewise_index(index):
+        return False
+
+    for _, sub_index in iter_by_file(index):
+        sub_index = sub_index.sortlevel(define.IndexField.START)[0]
+        starts = sub_index.get_level_values(define.IndexField.START)
+        ends = sub_index.get_level_values(define.IndexField.END)
+        ends = ends.fillna(pd.Timedelta(sys.maxsize))
+        if any(ends[:-1] > starts[1:]):
+            return True
+
+    return False
+
+
+def create_index(
+    num_file: int,
+    num_seg: int,
+    overlap: bool,
+) -> pd.MultiIndex:
+    r"""Create shuffled segmented index.
+
+    Every file holds ``num_seg`` consecutive segments.
+    If ``overlap`` is ``True``,
+    the last segment of the last file
+    overlaps with its predecessor.
+
+    """
+    files = np.repeat([f"file-{idx}" for idx in range(num_file)], num_seg)
+    starts = np.tile(np.arange(num_seg, dtype="float"), num_file)
+    ends = starts + 1
+    if overlap:
+        starts[-1] -= 0.5
+    order = np.random.permutation(len(files))
+    return audformat.segmented_index(files[order], starts[order], ends[order])
+
+
+def benchmark(
+    overlap: bool,
+    num_files: typing.Sequence[int],
+    num_segs: typing.Sequence[int],
+    num_repeat: int,
+) -> pd.DataFrame:
+    ds = []
+
+    for num_file, num_seg in zip(num_files, num_segs):
+        index = create_index(num_file, num_seg, overlap)
+
+        elapsed = {}
+        results = {}
+        for name, func in [
+            ("legacy", index_has_overlap_legacy),
+            ("vectorized", audformat.utils.index_has_overlap),
+        ]:
+            t = time.time()
+            for _ in range(num_repeat):
+                results[name] = func(index)
+            elapsed[name] = (time.time() - t) / num_repeat
+
+        assert results["legacy"] == results["vectorized"] == overlap
+
+        d = {
+            "num_file": num_file,
+            "num_seg": num_seg,
+            "legacy": elapsed["legacy"],
+            "vectorized": elapsed["vectorized"],
+            "speedup": elapsed["legacy"] / elapsed["vectorized"],
+        }
+        ds.append(d)
+
+    df = pd.DataFrame(ds).set_index(["num_file", "num_seg"])
+
+    return df
+
+
+def main():
+    num_files = [100, 1000, 10000, 100000]
+    num_segs = [1000, 100, 10, 10]
+    num_repeat = 1
+
+    print(f"Execution time in seconds averaged over {num_repeat} runs.")
+
+    for overlap in [False, True]:
+        print()
+        print(f"{'with' if overlap else 'without'} overlap")
+
+        df = benchmark(
+            overlap,
+            num_files,
+            num_segs,
+            num_repeat,
+        )
+        print(df.round(3))
+
+
+if __name__ == "__main__":
+    main()
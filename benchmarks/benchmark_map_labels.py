@@ -0,0 +1,174 @@
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+
+import audformat
+from audformat.core.common import to_audformat_dtype
+from audformat.core.common import to_pandas_dtype
+
+
+# Benchmark for mapping column values to a label field
+# with audformat.Column.get(map=...).
+#
+# The labels of a scheme are compiled once
+# into a mapping,
+# that holds the mapped value of every label
+# with a data type derived from the labels.
+# Column values are then mapped
+# by the codes of their categories.
+# It is compared to its previous implementation,
+# that created the mapping dictionary with every call,
+# mapped every value with pandas.Series.map()
+# and inferred the data type from all mapped values.
+
+
+np.random.seed(1)
+
+
+def map_legacy(
+    column: audformat.Column,
+    map: str,
+) -> pd.Series:
+    r"""Previous implementation of audformat.Column.get(map=...)."""
+    y = column.get()
+    db = column._table._db
+    scheme = db.schemes[column.scheme_id]
+    labels = scheme._labels_to_dict()
+
+    mapping = {}
+    for key, value in labels.items():
+        if isinstance(value, dict):
+            if map in value:
+                value = value[map]
+            else:
+                value = np.nan
+        mapping[key] = value
+
+    y = y.map(mapping)
+    y.name = map
+
+    if scheme.uses_table and db[scheme.labels][map].scheme is not None:
+        dtype = db[scheme.labels][map].scheme.to_pandas_dtype()
+    else:
+        dtype = pd.api.types.infer_dtype(list(y.values))
+        dtype = to_pandas_dtype(to_audformat_dtype(dtype))
+
+    return y.astype(dtype)
+
+
+def create_db(
+    num_label: int,
+    num_row: int,
+    misc_table: bool,
+) -> audformat.Database:
+    r"""Create database with a column of speakers.
+
+    Speakers are drawn at random
+    and hold an age and a gender,
+    stored in the labels of the scheme,
+    or in a misc table.
+
+    """
+    db = audformat.Database("db")
+    speakers = [f"spk-{idx}" for idx in range(num_label)]
+    ages = np.random.randint(18, 80, num_label)
+    genders = np.random.choice(["female", "male"], num_label)
+    if misc_table:
+        db.schemes["age"] = audformat.Scheme("int")
+        db["speaker"] = audformat.MiscTable(
+            pd.Index(speakers, name="speaker", dtype="string")
+        )
+        db["speaker"]["age"] = audformat.Column(scheme_id="age")
+        db["speaker"]["age"].set(ages)
+        db["speaker"]["gender"] = audformat.Column()
+        db["speaker"]["gender"].set(genders)
+        labels = "speaker"
+    else:
+        labels = {
+            speaker: {"age": int(age), "gender": str(gender)}
+            for speaker, age, gender in zip(speakers, ages, genders)
+        }
+    db.schemes["speaker"] = audformat.Scheme("str", labels=labels)
+    index = audformat.filewise_index([f"file-{idx}" for idx in range(num_row)])
+    db["files"] = audformat.Table(index)
+    db["files"]["speaker"] = audformat.Column(scheme_id="speaker")
+    # Assign values directly to the table,
+    # as checking every value against the scheme
+    # would dominate the creation of the database
+    db["files"].df["speaker"] = pd.Series(
+        np.random.choice(speakers, num_row),
+        index=index,
+        dtype=db.schemes["speaker"].to_pandas_dtype(),
+    )
+    return db
+
+
+def benchmark(
+    misc_table: bool,
+    num_labels: typing.Sequence[int],
+    num_rows: typing.Sequence[int],
+    num_repeat: int,
+) -> pd.DataFrame:
+    ds = []
+
+    for num_row in num_rows:
+        for num_label in num_labels:
+            db = create_db(num_label, num_row, misc_table)
+            column = db["files"]["speaker"]
+
+            for map in ["age", "gender"]:
+                elapsed = {}
+                results = {}
+                for name, func in [
+                    ("legacy", lambda: map_legacy(column, map)),
+                    ("compiled", lambda: column.get(map=map)),
+                ]:
+                    t = time.time()
+                    for _ in range(num_repeat):
+                        results[name] = func()
+                    elapsed[name] = (time.time() - t) / num_repeat
+
+                pd.testing.assert_series_equal(
+                    results["legacy"],
+                    results["compiled"],
+                )
+
+                d = {
+                    "num_row": num_row,
+                    "num_label": num_label,
+                    "map": map,
+                    "legacy": elapsed["legacy"],
+                    "compiled": elapsed["compiled"],
+                    "speedup": elapsed["legacy"] / elapsed["compiled"],
+                }
+                ds.append(d)
+
+    df = pd.DataFrame(ds).set_index(["num_row", "num_label", "map"])
+
+    return df
+
+
+def main():
+    num_labels = [10, 10000]
+    num_rows = [100000, 10000000]
+    num_repeat = 3
+
+    print(f"Execution time in seconds averaged over {num_repeat} runs.")
+
+    for misc_table in [False, True]:
+        print()
+        print(f"labels from {'misc table' if misc_table else 'dictionary'}")
+
+        df = benchmark(
+            misc_table,
+            num_labels,
+            num_rows,
+            num_repeat,
+        )
+        print(df.round(3))
+
+
+if __name__ == "__main__":
+    main()
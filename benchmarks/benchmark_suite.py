@@ -0,0 +1,502 @@
+import argparse
+import datetime
+import inspect
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import platform
+import resource
+import shutil
+import tempfile
+import time
+import tracemalloc
+import typing
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import audformat
+import audformat.testing
+
+
+# Benchmark suite for the public API of audformat.
+#
+# Creates synthetic databases at several scales
+# with audformat.testing.add_table()
+# and measures the execution time
+# of loading and saving databases in every storage format,
+# requesting labels,
+# and the utility functions working on tables and indices.
+# With --memory it measures in addition
+# the peak memory usage of every benchmark
+# and its ratio to the size of the returned object,
+# which reveals intermediate copies of the data.
+# Results are stored as JSON,
+# so that results of different releases
+# can be compared with --compare.
+# Benchmarks of features
+# that are not available in the installed release
+# are marked as skipped.
+#
+# Example:
+#
+#   python benchmarks/benchmark_suite.py --output new.json
+#   python benchmarks/benchmark_suite.py --output old.json  # older release
+#   python benchmarks/benchmark_suite.py --compare old.json
+#   python benchmarks/benchmark_suite.py --memory --filter get
+
+
+np.random.seed(1)
+
+
+SCALES = {
+    "small": (1_000, 10),
+    "medium": (10_000, 10),
+    "large": (100_000, 10),
+}
+r"""Number of files and segments per file of every scale."""
+
+STORAGE_FORMATS = ["csv", "feather", "parquet", "pkl"]
+r"""Benchmarked storage formats of tables."""
+
+
+def create_db(
+    num_files: int,
+    num_segments_per_file: int,
+) -> audformat.Database:
+    r"""Create database with a filewise and a segmented table.
+
+    Both tables hold a string,
+    a float,
+    and a labeled column.
+
+    """
+    db = audformat.testing.create_db(minimal=True)
+    db.schemes["string"] = audformat.Scheme(audformat.define.DataType.STRING)
+    db.schemes["float"] = audformat.Scheme(audformat.define.DataType.FLOAT)
+    db.schemes["label"] = audformat.Scheme(labels=["a", "b", "c"])
+    columns = list(db.schemes)
+    audformat.testing.add_table(
+        db,
+        "files",
+        audformat.define.IndexType.FILEWISE,
+        columns=columns,
+        num_files=num_files,
+    )
+    audformat.testing.add_table(
+        db,
+        "segments",
+        audformat.define.IndexType.SEGMENTED,
+        columns=columns,
+        num_files=num_files,
+        num_segments_per_file=num_segments_per_file,
+    )
+    return db
+
+
+def create_cases(
+    db: audformat.Database,
+    root: str,
+) -> typing.Dict[str, typing.Optional[typing.Callable[[], typing.Any]]]:
+    r"""Create benchmark cases for database.
+
+    Benchmarks of features
+    that are not available
+    in the installed release of audformat
+    have no function,
+    so that results of older releases
+    can still be compared.
+
+    Args:
+        db: database
+        root: folder to store the database
+
+    Returns:
+        dictionary with name and function of every benchmark,
+        or ``None`` if the benchmark is not supported
+
+    """
+    files = db["files"].index
+    segments = db["segments"].index
+    half = len(files) // 2
+    # Indices that partially overlap
+    indices = [files[:half], files[half // 2 :]]
+    segmented_indices = [
+        segments[: len(segments) // 2],
+        segments[len(segments) // 4 :],
+    ]
+    # Frames with different columns,
+    # that partially overlap
+    objs = [
+        db["segments"].df[["string"]].iloc[: len(segments) // 2],
+        db["segments"].df[["float"]].iloc[len(segments) // 4 :],
+    ]
+    other = db["segments"].copy()
+    other.df["float"] = np.random.randn(len(segments))
+
+    cases = {}
+
+    supported_formats = audformat.define.TableStorageFormat._attribute_values()
+    for storage_format in STORAGE_FORMATS:
+        if storage_format not in supported_formats:
+            cases[f"Database.save[{storage_format}]"] = None
+            cases[f"Database.load[{storage_format}]"] = None
+            continue
+        path = os.path.join(root, storage_format)
+        db.save(path, storage_format=storage_format)
+
+        def save(storage_format=storage_format):
+            # Store to new folder,
+            # as unchanged tables are not written again
+            path = tempfile.mkdtemp(dir=root)
+            db.save(path, storage_format=storage_format)
+            shutil.rmtree(path)
+
+        def load(path=path):
+            return audformat.Database.load(path, load_data=True)
+
+        cases[f"Database.save[{storage_format}]"] = save
+        cases[f"Database.load[{storage_format}]"] = load
+
+    cases["Database.get"] = lambda: db.get("label", ["float"])
+    cases["Database.validate"] = getattr(db, "validate", None)
+    labels = db["segments"]["label"].get()
+    cases["Column.set[label]"] = lambda: db["segments"]["label"].set(labels)
+    cases["Table.get[index]"] = lambda: db["segments"].get(files[:half])
+
+    def update():
+        table = db["segments"].copy()
+        return table.update(other, overwrite=True)
+
+    cases["Table.update"] = update
+    cases["utils.concat"] = lambda: audformat.utils.concat(objs)
+    cases["utils.union[filewise]"] = lambda: audformat.utils.union(indices)
+    cases["utils.union[segmented]"] = lambda: audformat.utils.union(segmented_indices)
+    cases["utils.intersect[segmented]"] = lambda: audformat.utils.intersect(
+        segmented_indices
+    )
+    cases["utils.difference[segmented]"] = lambda: audformat.utils.difference(
+        segmented_indices
+    )
+    cases["utils.hash"] = lambda: audformat.utils.hash(db["segments"].df)
+    if "version" in inspect.signature(audformat.utils.hash).parameters:
+        cases["utils.hash[strict]"] = lambda: audformat.utils.hash(
+            db["segments"].df,
+            strict=True,
+            version=2,
+        )
+    else:
+        cases["utils.hash[strict]"] = None
+    cases["utils.to_segmented_index"] = lambda: audformat.utils.to_segmented_index(
+        db["files"].df
+    )
+    cases["utils.map_file_path"] = lambda: audformat.utils.map_file_path(
+        segments,
+        lambda file: f"/root/{file}",
+    )
+
+    return cases
+
+
+def benchmark(
+    scales: typing.Sequence[str],
+    num_repeat: int,
+    pattern: str = None,
+    memory: bool = False,
+) -> typing.List[typing.Dict]:
+    r"""Run benchmarks.
+
+    Args:
+        scales: scales of database, see ``SCALES``
+        num_repeat: number of runs of every benchmark
+        pattern: only run benchmarks containing pattern
+        memory: measure memory usage,
+            see :func:`measure_memory`
+
+    Returns:
+        execution time
+        (and memory usage)
+        of every benchmark and scale
+
+    """
+    results = []
+
+    for scale in scales:
+        num_files, num_segments_per_file = SCALES[scale]
+        db = create_db(num_files, num_segments_per_file)
+
+        with tempfile.TemporaryDirectory() as root:
+            for name, func in create_cases(db, root).items():
+                if pattern is not None and pattern not in name:
+                    continue
+                if func is None:
+                    results.append(
+                        {
+                            "benchmark": name,
+                            "scale": scale,
+                            "num_files": num_files,
+                            "num_segments": num_files * num_segments_per_file,
+                            "elapsed": None,
+                            "skipped": True,
+                        }
+                    )
+                    continue
+                t = time.time()
+                for _ in range(num_repeat):
+                    func()
+                elapsed = (time.time() - t) / num_repeat
+                result = {
+                    "benchmark": name,
+                    "scale": scale,
+                    "num_files": num_files,
+                    "num_segments": num_files * num_segments_per_file,
+                    "elapsed": elapsed,
+                }
+                if memory:
+                    result.update(measure_memory(func))
+                results.append(result)
+
+    return results
+
+
+def compare(
+    results: typing.List[typing.Dict],
+    other: typing.List[typing.Dict],
+    threshold: float,
+    measure: str = "elapsed",
+) -> pd.DataFrame:
+    r"""Compare results to other results.
+
+    Benchmarks that were skipped
+    in one of the runs
+    are ignored.
+
+    Args:
+        results: results of benchmark
+        other: other results of benchmark, e.g. of an older release
+        threshold: ratio of measured values,
+            above which a benchmark is marked as regression
+        measure: compared value,
+            e.g. ``"elapsed"`` or ``"peak_traced"``
+
+    Returns:
+        measured values,
+        their ratio,
+        and if a benchmark regressed
+
+    """
+    index = ["benchmark", "scale"]
+    df = pd.DataFrame(results).set_index(index)[measure]
+    df_other = pd.DataFrame(other).set_index(index)[measure]
+    df = pd.concat([df_other, df], axis=1, keys=["other", "current"]).dropna()
+    df["ratio"] = df["current"] / df["other"]
+    df["regression"] = df["ratio"] > threshold
+    return df
+
+
+def measure_memory(
+    func: typing.Callable[[], typing.Any],
+) -> typing.Dict[str, typing.Optional[float]]:
+    r"""Measure memory usage of benchmark.
+
+    The benchmark is executed twice,
+    every time in a new forked process:
+
+    * ``peak_traced``:
+      peak of memory allocated by Python and NumPy,
+      measured with :mod:`tracemalloc`,
+      which does not include memory allocated by pyarrow
+    * ``peak_rss``:
+      increase of the peak resident set size
+      of the process,
+      which includes all allocations,
+      but also memory the allocator did not release
+
+    ``peak_ratio`` is the ratio
+    of ``peak_traced``
+    to the size of the returned object,
+    see :func:`object_size`.
+    A ratio of 1 means
+    that no intermediate copies were created.
+
+    Args:
+        func: benchmark
+
+    Returns:
+        memory usage in bytes
+
+    """
+    context = multiprocessing.get_context("fork")
+    result = {}
+    for trace in [True, False]:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_in_process,
+            args=(func, trace, sender),
+        )
+        process.start()
+        result.update(receiver.recv())
+        process.join()
+    result["peak_ratio"] = (
+        result["peak_traced"] / result["result_size"]
+        if result["result_size"] > 0
+        else None
+    )
+    return result
+
+
+def metadata(num_repeat: int) -> typing.Dict:
+    r"""Describe environment of benchmark run."""
+    return {
+        "audformat": audformat.__version__,
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pyarrow": pa.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "num_repeat": num_repeat,
+    }
+
+
+def object_size(obj: typing.Any) -> int:
+    r"""Memory used by object returned by benchmark.
+
+    Args:
+        obj: object
+
+    Returns:
+        size in bytes
+
+    """
+    if isinstance(obj, audformat.Database):
+        return sum(object_size(obj[table_id]) for table_id in obj)
+    if isinstance(obj, (audformat.Table, audformat.MiscTable)):
+        obj = obj.df
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, (pd.Index, pd.Series)):
+        return int(obj.memory_usage(deep=True))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audformat.")
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=list(SCALES),
+        default=["small", "medium"],
+        help="scales of benchmark databases",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of runs of every benchmark",
+    )
+    parser.add_argument(
+        "--filter",
+        default=None,
+        help="only run benchmarks containing the given string",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="store results to JSON file",
+    )
+    parser.add_argument(
+        "--compare",
+        default=None,
+        help="compare results to JSON file of an earlier run",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="ratio of execution times marked as regression",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure peak memory usage (requires Linux)",
+    )
+    args = parser.parse_args()
+
+    results = benchmark(args.scales, args.repeat, args.filter, args.memory)
+
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(
+                {"metadata": metadata(args.repeat), "results": results},
+                fp,
+                indent=2,
+            )
+
+    print(f"Execution time in seconds averaged over {args.repeat} runs.")
+    print()
+    df = pd.DataFrame(results)
+    print(df.pivot(index="benchmark", columns="scale", values="elapsed").round(4))
+
+    if args.memory:
+        print()
+        print("Peak memory usage in MB and ratio to size of result.")
+        print()
+        df = df.set_index(["benchmark", "scale"])
+        df = df[["result_size", "peak_traced", "peak_rss", "peak_ratio"]]
+        df[["result_size", "peak_traced", "peak_rss"]] /= 1024**2
+        print(df.round(2).to_string())
+
+    if args.compare is not None:
+        with open(args.compare) as fp:
+            other = json.load(fp)
+        measures = ["elapsed"]
+        if args.memory and any("peak_traced" in r for r in other["results"]):
+            measures.append("peak_traced")
+        for measure in measures:
+            df = compare(results, other["results"], args.threshold, measure)
+            print()
+            print(
+                f"Comparison of {measure} "
+                f"to audformat {other['metadata']['audformat']} ({args.compare})"
+            )
+            print(df.round(4))
+            regressions = df[df["regression"]]
+            if len(regressions) > 0:
+                print()
+                print(f"{len(regressions)} benchmark(s) regressed.")
+
+
+def _rss() -> int:
+    r"""Current resident set size of process in bytes."""
+    with open("/proc/self/statm") as fp:
+        pages = int(fp.read().split()[1])
+    return pages * resource.getpagesize()
+
+
+def _run_in_process(
+    func: typing.Callable[[], typing.Any],
+    trace: bool,
+    connection: multiprocessing.connection.Connection,
+):
+    r"""Measure memory usage of benchmark in forked process."""
+    if trace:
+        tracemalloc.start()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        connection.send({"result_size": object_size(result), "peak_traced": peak})
+    else:
+        rss = _rss()
+        func()
+        # ru_maxrss is given in kilobytes on Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        connection.send({"peak_rss": max(peak - rss, 0)})
+
+
+if __name__ == "__main__":
+    main()
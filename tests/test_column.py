@@ -333,7 +333,7 @@ def test_get_as_segmented():
 
     # reset db
 
-    db._files_duration = {}
+    db._files_duration.clear()
 
 
 @pytest.mark.parametrize(
@@ -733,6 +733,59 @@ def test_map_dtypes(request, db, map, expected):
         pd.testing.assert_series_equal(y, expected)
 
 
+def test_map_non_categorical(db_scheme_with_labels):
+    # Values that are not stored as categories
+    # are mapped as well,
+    # values that are no labels are mapped to NaN
+    db = db_scheme_with_labels
+    db["table"].df["column"] = pd.Series(
+        ["b", "unknown", None],
+        index=db["table"].index,
+        dtype="object",
+    )
+    y = db["table"]["column"].get(map="int")
+    expected = pd.Series(
+        [0, None, None],
+        index=db["table"].index,
+        name="int",
+        dtype="Int64",
+    )
+    pd.testing.assert_series_equal(y, expected)
+
+
+def test_map_labels_changed_in_place():
+    # Labels changed in place
+    # are considered when mapping
+    db = audformat.Database("db")
+    index = audformat.filewise_index(["f1", "f2"])
+    db["table"] = audformat.Table(index)
+
+    # Label dictionary
+    db.schemes["scheme"] = audformat.Scheme(
+        labels={"a": {"x": 1}, "b": {"x": 2}},
+    )
+    db["table"]["column"] = audformat.Column(scheme_id="scheme")
+    db["table"]["column"].set(["a", "b"])
+    assert list(db["table"]["column"].get(map="x")) == [1, 2]
+    db.schemes["scheme"].labels["a"]["x"] = 5
+    assert list(db["table"]["column"].get(map="x")) == [5, 2]
+    assert list(db.get("x")["x"]) == [5, 2]
+
+    # Misc table
+    db.schemes["age"] = audformat.Scheme("int")
+    db["speaker"] = audformat.MiscTable(
+        pd.Index(["s1", "s2"], name="speaker", dtype="string"),
+    )
+    db["speaker"]["age"] = audformat.Column(scheme_id="age")
+    db["speaker"]["age"].set([20, 30])
+    db.schemes["speaker"] = audformat.Scheme("str", labels="speaker")
+    db["table"]["speaker"] = audformat.Column(scheme_id="speaker")
+    db["table"]["speaker"].set(["s1", "s2"])
+    assert list(db["table"]["speaker"].get(map="age")) == [20, 30]
+    db["speaker"].df.loc["s1", "age"] = 99
+    assert list(db["table"]["speaker"].get(map="age")) == [99, 30]
+
+
 @pytest.mark.parametrize(
     "num_files, num_segments_per_file, values",
     [
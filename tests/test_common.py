@@ -1,3 +1,6 @@
+import pickle
+
+import pandas as pd
 import pytest
 
 import audformat
@@ -58,6 +61,24 @@ def test_items_order():
     assert list(d) == ["b"]
 
 
+@pytest.mark.parametrize("sort_by_key", [False, True])
+def test_del_callback(sort_by_key):
+    removed = []
+    d = audformat.core.common.HeaderDict(
+        sort_by_key=sort_by_key,
+        del_callback=removed.append,
+    )
+    for key in ["a", "b", "c", "d", "e"]:
+        d[key] = key.upper()
+    del d["a"]
+    assert d.pop("b") == "B"
+    assert d.pop("b", None) is None
+    assert d.popitem() == ("e", "E")
+    d.clear()
+    assert removed == ["a", "b", "e", "c", "d"]
+    assert not d
+
+
 @pytest.mark.parametrize(
     "meta",
     [
@@ -77,6 +98,48 @@ def test_meta_dict(meta):
     assert header_2.meta == meta
 
 
+def test_result_cache():
+    obj = pd.DataFrame({"a": [1, 2, 3]})
+    size = int(obj.memory_usage(index=True, deep=True).sum())
+    cache = audformat.core.common.ResultCache(2 * size)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+    cache.put("a", obj)
+    assert len(cache) == 1
+    assert cache.size == size
+    # Cached result is not affected by changes of added and returned object
+    obj.iloc[0] = 0
+    result = cache.get("a")
+    result.iloc[1] = 0
+    pd.testing.assert_frame_equal(cache.get("a"), pd.DataFrame({"a": [1, 2, 3]}))
+
+    # Replace result
+    cache.put("a", obj)
+    assert len(cache) == 1
+    assert cache.size == size
+    pd.testing.assert_frame_equal(cache.get("a"), obj)
+
+    # Discard least recently used result
+    cache.put("b", obj["a"])
+    cache.get("a")
+    cache.put("c", obj)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size <= cache.max_size
+
+    # Results larger than cache are not stored
+    cache.put("d", pd.concat([obj] * 10))
+    assert cache.get("d") is None
+
+    cache = pickle.loads(pickle.dumps(cache))
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
 @pytest.mark.parametrize(
     "dtype, expected",
     [
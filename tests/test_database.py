@@ -1,9 +1,14 @@
+import copy
 import datetime
 import filecmp
+import hashlib
+import json
 import os
 import re
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet
 import pytest
 
 import audeer
@@ -304,6 +309,132 @@ def test_pick_tables(db, tables, expected_tables):
     assert list(db) == expected_tables
 
 
+def cache_db() -> audformat.Database:
+    r"""Database with mapped scheme for testing the cache of results."""
+    db = audformat.Database("db")
+    db.splits["test"] = audformat.Split("test")
+    db.schemes["speaker"] = audformat.Scheme(
+        labels={"s1": {"age": 20}, "s2": {"age": 30}},
+    )
+    db.schemes["age"] = audformat.Scheme("int")
+    db["files"] = audformat.Table(audformat.filewise_index(["f1", "f2"]))
+    db["files"]["speaker"] = audformat.Column(scheme_id="speaker")
+    db["files"]["speaker"].set(["s1", "s2"])
+    db["other"] = audformat.Table(audformat.filewise_index(["f4"]))
+    db["other"]["age"] = audformat.Column(scheme_id="age")
+    db["other"]["age"].set([20])
+    return db
+
+
+def update_files(db):
+    other = audformat.Table(audformat.filewise_index(["f3"]))
+    db["other-files"] = other
+    other["speaker"] = audformat.Column(scheme_id="speaker")
+    other["speaker"].set(["s1"])
+    db["files"].update(other)
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda db: None,
+        lambda db: db["files"]["speaker"].set(["s2", "s1"]),
+        lambda db: db["files"].set({"speaker": ["s2", "s2"]}),
+        lambda db: db.schemes["speaker"].replace_labels(
+            {"s1": {"age": 21}, "s2": {"age": 31}}
+        ),
+        lambda db: db["files"].extend_index(
+            audformat.filewise_index("f3"),
+            inplace=True,
+        ),
+        lambda db: db["files"].drop_index(
+            audformat.filewise_index("f1"),
+            inplace=True,
+        ),
+        lambda db: db["files"].pick_index(
+            audformat.filewise_index("f1"),
+            inplace=True,
+        ),
+        lambda db: db["files"].drop_files("f1", inplace=True),
+        lambda db: db["files"].pick_files("f1", inplace=True),
+        lambda db: db["files"].drop_columns("speaker", inplace=True),
+        lambda db: db["files"].pick_columns([], inplace=True),
+        lambda db: db.map_files(lambda file: f"a/{file}"),
+        lambda db: db.drop_tables("files"),
+        lambda db: db.tables.pop("other"),
+        update_files,
+        lambda db: setattr(db["files"], "split_id", "test"),
+        lambda db: setattr(db["other"]["age"], "scheme_id", None),
+    ],
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"splits": "test"},
+        {"strict": True},
+    ],
+)
+def test_enable_cache(modify, kwargs):
+    db = cache_db()
+    db.enable_cache()
+
+    expected = db.get("age", **kwargs)
+    df = db.get("age", **kwargs)
+    pd.testing.assert_frame_equal(df, expected)
+    # Returned object is a copy of the cached result
+    df.iloc[:] = 0
+    pd.testing.assert_frame_equal(db.get("age", **kwargs), expected)
+
+    modify(db)
+    df = db.get("age", **kwargs)
+    db.disable_cache()
+    pd.testing.assert_frame_equal(df, db.get("age", **kwargs))
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_enable_cache_load(tmpdir, memory_map):
+    db = cache_db()
+    db.save(tmpdir)
+    expected = db.get("age")
+    db = audformat.Database.load(tmpdir, memory_map=memory_map)
+    db.enable_cache()
+
+    # Loading tables on demand does not invalidate the cache
+    pd.testing.assert_frame_equal(db.get("age"), expected)
+    num_results = len(db._cache)
+    pd.testing.assert_frame_equal(db.get("age"), expected)
+    assert len(db._cache) == num_results
+
+    # Loading a table explicitly invalidates the cache
+    db["files"]["speaker"].set(["s2", "s2"])
+    db["files"].save(audeer.path(tmpdir, "db.files"))
+    db["files"]["speaker"].set(["s1", "s2"])
+    db["files"].load(audeer.path(tmpdir, "db.files"))
+    df = db.get("age")
+    db.disable_cache()
+    pd.testing.assert_frame_equal(df, db.get("age"))
+    assert not df.equals(expected)
+
+
+def test_enable_cache_size():
+    db = cache_db()
+    db.enable_cache()
+    db.get("age")
+    db.get("speaker")
+    db["files"].get(map={"speaker": "age"})
+    assert len(db._cache) == 3
+    db["other"]["age"].set([30])
+    db.get("age")
+    assert len(db._cache) == 4
+    # Least recently used results are discarded
+    db.enable_cache(max_size=db.get("age").memory_usage(deep=True).sum())
+    db.get("speaker")
+    db.get("age")
+    assert len(db._cache) == 1
+    assert db._cache.size <= db._cache.max_size
+
+
 def test_files_duration():
     db = pytest.DB
 
@@ -354,10 +485,129 @@ def test_files_duration():
 
     # reset db
 
-    db._files_duration = {}
+    db._files_duration.clear()
     db._root = root
 
 
+def test_files_duration_cache(tmpdir, monkeypatch):
+    root = audeer.mkdir(tmpdir, "db")
+    db = audformat.Database("db")
+    index = audformat.filewise_index(["f1.wav", "f2.wav", "f3.wav"])
+    db["files"] = audformat.Table(index)
+    db.save(root)
+    audformat.testing.create_audio_files(db, file_duration="1s")
+    cache_file = os.path.join(root, ".db.files_duration.parquet")
+
+    # Nothing is stored as long as no duration was requested
+    db.save(root)
+    assert not os.path.exists(cache_file)
+
+    # Durations of files outside of root
+    # or of missing files
+    # are not stored
+    external_file = audeer.path(tmpdir, "external.wav")
+    audiofile.write(external_file, np.zeros(8000), 8000)
+    db.files_duration(external_file)
+    db._files_duration[os.path.join(root, "missing.wav")] = pd.Timedelta(1, unit="s")
+    db.save(root)
+    assert not os.path.exists(cache_file)
+
+    expected = db.files_duration(db.files)
+    db.save(root)
+    assert os.path.exists(cache_file)
+
+    # Durations are reused after loading
+    # without reading the audio files
+    def duration(file):
+        raise RuntimeError(file)
+
+    db = audformat.Database.load(root)
+    assert not db._files_duration
+    monkeypatch.setattr(audiofile, "duration", duration)
+    pd.testing.assert_series_equal(db.files_duration(db.files), expected)
+    monkeypatch.undo()
+
+    # Changed files are not taken from the cache
+    db = audformat.Database.load(root)
+    audiofile.write(os.path.join(root, "f1.wav"), np.zeros(4000), 8000)
+    os.remove(os.path.join(root, "f2.wav"))
+    assert os.path.join(root, "f3.wav") in db._files_duration
+    assert os.path.join(root, "f2.wav") not in db._files_duration
+    assert os.path.join(root, "f1.wav") not in db._files_duration
+    expected["f1.wav"] = pd.Timedelta(0.5, unit="s")
+    pd.testing.assert_series_equal(
+        db.files_duration(["f1.wav", "f3.wav"]),
+        expected[["f1.wav", "f3.wav"]],
+    )
+
+    # Stored entries that have not been checked yet are kept
+    db = audformat.Database.load(root)
+    db.save(root)
+    db = audformat.Database.load(root)
+    assert os.path.join(root, "f3.wav") in db._files_duration
+    db._files_duration.clear()
+    assert os.path.join(root, "f3.wav") not in db._files_duration
+
+    # Removing entries
+    db = audformat.Database.load(root)
+    db._files_duration[os.path.join(root, "f3.wav")] = pd.Timedelta(2, unit="s")
+    del db._files_duration[os.path.join(root, "f3.wav")]
+    assert os.path.join(root, "f3.wav") not in db._files_duration
+    with pytest.raises(KeyError):
+        db._files_duration[os.path.join(root, "f3.wav")]
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_files_duration_num_workers(tmpdir, monkeypatch, num_workers):
+    root = audeer.mkdir(tmpdir, "db")
+    db = audformat.Database("db")
+    index = audformat.segmented_index(
+        ["f1.wav", "f1.wav", "f2.wav", "f2.wav"],
+        [0, 0.1, 0, 0.1],
+        [0.1, None, 0.1, None],
+    )
+    db["segments"] = audformat.Table(index)
+    db.save(root)
+    audformat.testing.create_audio_files(db, file_duration="1s")
+
+    # Count how often a duration is read from a file
+    calls = []
+    duration = audiofile.duration
+
+    def count_duration(file):
+        calls.append(file)
+        return duration(file)
+
+    monkeypatch.setattr(audiofile, "duration", count_duration)
+
+    files = ["f1.wav", "f2.wav", "f1.wav", "f2.wav"]
+    y = db.files_duration(files, num_workers=num_workers, verbose=False)
+    expected = pd.Series(
+        [pd.Timedelta(1, unit="s")] * 4,
+        index=files,
+        name=audformat.define.IndexField.FILE,
+    )
+    pd.testing.assert_series_equal(y, expected)
+    assert sorted(calls) == [os.path.join(root, "f1.wav"), os.path.join(root, "f2.wav")]
+
+    # Table.get() shares the cache
+    # and reads every file only once
+    db._files_duration.clear()
+    calls.clear()
+    df = db["segments"].get(allow_nat=False, num_workers=num_workers)
+    assert not df.index.get_level_values("end").isna().any()
+    assert sorted(calls) == [os.path.join(root, "f1.wav"), os.path.join(root, "f2.wav")]
+    calls.clear()
+    db.files_duration(files, num_workers=num_workers)
+    assert not calls
+
+    # Cache can be copied
+    files_duration = copy.deepcopy(db._files_duration)
+    assert files_duration == db._files_duration
+    files_duration[os.path.join(root, "f3.wav")] = pd.Timedelta(1, unit="s")
+    assert files_duration != db._files_duration
+
+
 def test_iter():
     db = audformat.testing.create_db(minimal=True)
     assert list(db) == []
@@ -427,6 +677,222 @@ def test_load(tmpdir):
     assert list(db.schemes) == ["misc", "scheme1", "scheme2", "scheme3"]
 
 
+def test_load_header_cache(tmpdir, monkeypatch):
+    db = audformat.testing.create_db()
+    root = audeer.mkdir(tmpdir, "db")
+    db.save(root)
+    cache_root = audeer.path(tmpdir, "cache")
+    files = sorted(os.listdir(root))
+
+    def cache_file():
+        with open(audeer.path(root, "db.yaml"), "rb") as fp:
+            md5 = hashlib.md5(fp.read()).hexdigest()
+        return audeer.path(cache_root, f"{md5}.pkl")
+
+    def yaml_load(*args, **kwargs):
+        raise RuntimeError("header is parsed")
+
+    # No cache without cache_root
+    db_loaded = audformat.Database.load(root)
+    assert db_loaded == db
+    assert not os.path.exists(cache_root)
+
+    # Loading creates cache,
+    # but does not write to root
+    db_loaded = audformat.Database.load(root, cache_root=cache_root)
+    assert db_loaded == db
+    assert sorted(os.listdir(root)) == files
+    assert os.listdir(cache_root) == [os.path.basename(cache_file())]
+
+    # Cache is used when header is unchanged
+    with monkeypatch.context() as m:
+        m.setattr(audformat.core.database.yaml, "load", yaml_load)
+        db_loaded = audformat.Database.load(root, cache_root=cache_root)
+        assert db_loaded == db
+        assert list(db_loaded.schemes) == list(db.schemes)
+
+        # Cache is not used when header changes
+        db.description = "changed"
+        db.save(root, header_only=True)
+        with pytest.raises(RuntimeError, match="header is parsed"):
+            audformat.Database.load(root, cache_root=cache_root)
+    db_loaded = audformat.Database.load(root, cache_root=cache_root)
+    assert db_loaded.description == "changed"
+    assert len(os.listdir(cache_root)) == 2
+
+    # Broken cache is ignored and replaced
+    with open(cache_file(), "wb") as fp:
+        fp.write(b"broken")
+    db_loaded = audformat.Database.load(root, cache_root=cache_root)
+    assert db_loaded == db
+    with monkeypatch.context() as m:
+        m.setattr(audformat.core.database.yaml, "load", yaml_load)
+        audformat.Database.load(root, cache_root=cache_root)
+
+    # Database is loaded if cache cannot be written,
+    # without leaving temporary files behind
+    os.remove(cache_file())
+    os.mkdir(cache_file())
+    cache_files = sorted(os.listdir(cache_root))
+    db_loaded = audformat.Database.load(root, cache_root=cache_root)
+    assert db_loaded == db
+    assert sorted(os.listdir(cache_root)) == cache_files
+
+
+@pytest.mark.parametrize("storage_format", ["parquet", "pkl"])
+@pytest.mark.parametrize("load_data", [False, True])
+@pytest.mark.parametrize(
+    "columns, files",
+    [
+        (None, None),
+        (["int", "label_map_str"], None),
+        ([], None),
+        (None, ["audio/001.wav", "audio/002.wav"]),
+        ("string", "audio/003.wav"),
+    ],
+)
+def test_load_columns_and_files(tmpdir, storage_format, load_data, columns, files):
+    db = audformat.testing.create_db()
+    # Labels of scheme using a misc table
+    # are not available
+    # when tables are loaded before misc tables
+    for table_id in db.tables:
+        db[table_id].drop_columns("label_map_misc", inplace=True)
+    db.save(tmpdir, storage_format=storage_format)
+    db_loaded = audformat.Database.load(
+        tmpdir,
+        load_data=load_data,
+        columns=columns,
+        files=files,
+    )
+    for table_id in db.tables:
+        expected = db[table_id].copy()
+        if columns is not None:
+            expected.pick_columns(columns, inplace=True)
+        if files is not None:
+            expected.pick_files(files, inplace=True)
+        table = db_loaded[table_id]
+        assert (table._df is not None) == load_data
+        assert list(table.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(table.df, expected.df)
+    # Misc tables are not affected
+    for table_id in db.misc_tables:
+        pd.testing.assert_frame_equal(db_loaded[table_id].df, db[table_id].df)
+
+    # Tables with selected columns or files cannot be saved
+    if columns is None and files is None:
+        db_loaded.save(tmpdir)
+    else:
+        error_msg = re.escape(
+            "Cannot save table 'files', "
+            "as it was loaded with selected columns or files."
+        )
+        with pytest.raises(RuntimeError, match=error_msg):
+            db_loaded.save(tmpdir)
+        with pytest.raises(RuntimeError, match=error_msg):
+            db_loaded["files"].save(audeer.path(tmpdir, "files"))
+        # Copies of tables can be saved
+        db_loaded["files"].copy().save(audeer.path(tmpdir, "files"))
+
+
+@pytest.mark.parametrize("load_data", [False, True])
+@pytest.mark.parametrize(
+    "scheme, tables, splits, strict, original_column_names",
+    [
+        ("int", None, None, False, False),
+        ("int", "segments", None, False, True),
+        ("label_map_str", None, "train", False, False),
+        ("no_scheme", None, None, False, False),
+        ("no_scheme", None, None, True, False),
+        ("non-existing", ["files", "non-existing"], None, False, False),
+    ],
+)
+def test_iter_batches(
+    tmpdir,
+    load_data,
+    scheme,
+    tables,
+    splits,
+    strict,
+    original_column_names,
+):
+    db = audformat.testing.create_db()
+    db.save(tmpdir)
+    db_loaded = audformat.Database.load(tmpdir, load_data=load_data)
+
+    expected = []
+    for table_id in audeer.to_list(tables or list(db.tables)):
+        if table_id not in db.tables:
+            continue
+        table = db[table_id]
+        if splits is not None and table.split_id not in audeer.to_list(splits):
+            continue
+        for column_id, column in table.columns.items():
+            if (column_id == scheme and not strict) or column.scheme_id == scheme:
+                df = table.get(columns=column_id)
+                if not original_column_names:
+                    df = df.rename(columns={column_id: scheme})
+                expected.append(df)
+
+    batches = list(
+        db_loaded.iter_batches(
+            scheme,
+            tables=tables,
+            splits=splits,
+            strict=strict,
+            original_column_names=original_column_names,
+            batch_size=9,
+        )
+    )
+    assert len(batches) == sum([-(-len(df) // 9) for df in expected])
+    for batch in batches:
+        assert len(batch) <= 9
+    for n, df in enumerate(expected):
+        start = sum([-(-len(df) // 9) for df in expected[:n]])
+        stop = start + -(-len(df) // 9)
+        pd.testing.assert_frame_equal(pd.concat(batches[start:stop]), df)
+
+
+@pytest.mark.parametrize("storage_format", ["csv", "feather", "parquet", "pkl"])
+@pytest.mark.parametrize("files", [None, ["audio/001.wav", "audio/004.wav"]])
+def test_load_memory_map(tmpdir, storage_format, files):
+    db = audformat.testing.create_db()
+    db.save(tmpdir, storage_format=storage_format)
+    db_loaded = audformat.Database.load(tmpdir, files=files, memory_map=True)
+    if files is not None:
+        db.pick_files(files)
+
+    # Only requested columns and rows are converted
+    for table_id in list(db.tables) + list(db.misc_tables):
+        table = db_loaded[table_id]
+        for column_id, column in table.columns.items():
+            pd.testing.assert_series_equal(
+                column.get(),
+                db[table_id][column_id].get(),
+            )
+        index = db[table_id].index[:3]
+        pd.testing.assert_frame_equal(table.get(index), db[table_id].get(index))
+    # Misc tables used as scheme labels
+    # are loaded to infer the categories of the labels.
+    # Tables read from CSV or PKL files are not memory-mapped,
+    # but loaded into memory on first access
+    memory_mapped = storage_format in ["feather", "parquet"]
+    for table_id in db.tables:
+        assert (db_loaded[table_id]._df is None) == memory_mapped
+    for scheme_id in ["label_map_str", "string", "int"]:
+        pd.testing.assert_frame_equal(db_loaded.get(scheme_id), db.get(scheme_id))
+    pd.testing.assert_series_equal(
+        db_loaded["files"]["label_map_str"].get(map="prop1"),
+        db["files"]["label_map_str"].get(map="prop1"),
+    )
+    assert (db_loaded["files"]._df is None) == memory_mapped
+
+    # Accessing table data loads it into memory
+    for table_id in list(db.tables) + list(db.misc_tables):
+        pd.testing.assert_frame_equal(db_loaded[table_id].df, db[table_id].df)
+        assert db_loaded[table_id]._df is not None
+
+
 @pytest.mark.parametrize(
     "num_workers",
     [
@@ -476,6 +942,12 @@ def test_map_files(num_workers):
             False,
             4,
         ),
+        (
+            audformat.testing.create_db(),
+            audformat.define.TableStorageFormat.FEATHER,
+            False,
+            4,
+        ),
         (
             audformat.testing.create_db(),
             audformat.define.TableStorageFormat.PICKLE,
@@ -646,7 +1118,8 @@ def test_save_and_load(tmpdir, db, storage_format, load_data, num_workers):
         # The replace part handles Windows paths
         table_path = table_file[:-4].replace("\\", "\\\\")
         error_msg = (
-            r"No file found for table with path " rf"'{table_path}.{{csv|parquet|pkl}}'"
+            r"No file found for table with path "
+            rf"'{table_path}.{{csv|feather|parquet|pkl}}'"
         )
         with pytest.raises(RuntimeError, match=error_msg):
             db = audformat.Database.load(
@@ -656,6 +1129,161 @@ def test_save_and_load(tmpdir, db, storage_format, load_data, num_workers):
             db[table_id].get()
 
 
+def test_save_incremental(tmpdir):
+    db = audformat.testing.create_db()
+    table_ids = list(db.tables) + list(db.misc_tables)
+    root = audeer.mkdir(tmpdir, "db")
+
+    # Write all tables, skip unchanged tables
+    assert db.save(root) == table_ids
+    assert db.save(root) == []
+    assert db.save(root, header_only=True) == []
+
+    # Write changed tables
+    db["files"].df.loc[db.files[0], "string"] = "changed"
+    db["segments"].drop_index(db["segments"].index[:1], inplace=True)
+    assert db.save(root) == ["files", "segments"]
+    assert db.save(root) == []
+
+    # Write tables to new location
+    assert db.save(tmpdir, name="other") == table_ids
+    assert db.save(root) == table_ids
+
+    # Write tables to new storage formats
+    assert db.save(root, storage_format="csv") == table_ids
+    assert db.save(root, storage_format="csv") == []
+    assert db.save(root, storage_format="pkl", update_other_formats=False) == (
+        table_ids
+    )
+    assert db.save(root, storage_format="pkl") == table_ids
+    assert db.save(root, storage_format="parquet") == []
+
+    # Write tables when files were modified
+    path = os.path.join(root, "db.files.csv")
+    os.utime(path, ns=(0, 0))
+    assert db.save(root) == ["files"]
+
+    # Skip tables loaded from disk
+    for file in audeer.list_file_names(root, filetype="csv"):
+        os.remove(file)
+    for load_data in [False, True]:
+        db = audformat.Database.load(root, load_data=load_data)
+        assert db.save(root) == []
+    db["files"].df.loc[db.files[0], "string"] = "changed again"
+    assert db.save(root) == ["files"]
+
+    # Write tables loaded from disk with a CSV file,
+    # as the CSV file might be outdated
+    db.save(root, storage_format="csv")
+    db = audformat.Database.load(root, load_data=True)
+    assert db.save(root) == table_ids
+    assert db.save(root) == []
+
+    # Write tables loaded from or stored to files without hash.
+    # Labels of scheme using a misc table
+    # are not available
+    # when tables are loaded before misc tables
+    for table_id in db.tables:
+        db[table_id].drop_columns("label_map_misc", inplace=True)
+    root = audeer.mkdir(tmpdir, "db-pkl")
+    db.save(root, storage_format="pkl")
+    db = audformat.Database.load(root, load_data=True)
+    for _ in range(2):
+        assert db.save(root, storage_format="pkl") == table_ids
+    root = audeer.mkdir(tmpdir, "db-parquet")
+    db.save(root)
+    path = os.path.join(root, "db.misc.parquet")
+    table = pyarrow.parquet.read_table(path)
+    pyarrow.parquet.write_table(table.replace_schema_metadata(), path)
+    db = audformat.Database.load(root, load_data=True)
+    assert db.save(root) == ["misc"]
+
+    # Table data that cannot be converted to Arrow
+    # is not tracked and always written
+    db = audformat.testing.create_db(minimal=True)
+    db["table"] = audformat.Table(audformat.filewise_index(["f1", "f2"]))
+    db["table"]["column"] = audformat.Column()
+    db["table"]["column"].set([1, "a"])
+    root = audeer.mkdir(tmpdir, "db-object")
+    for _ in range(2):
+        assert db.save(root, storage_format="pkl") == ["table"]
+    db["table"]["column"].set([1, 2])
+    assert db.save(root) == ["table"]
+    assert db.save(root) == []
+    db["table"]["column"].set([1, "a"])
+    assert db.save(
+        root,
+        storage_format="pkl",
+        update_other_formats=False,
+    ) == ["table"]
+
+
+def test_save_parquet_options(tmpdir):
+    db = audformat.testing.create_db()
+    db["empty"] = audformat.Table(audformat.filewise_index())
+    db["empty"]["column"] = audformat.Column()
+    table_ids = list(db.tables) + list(db.misc_tables)
+    options = {"compression": "zstd", "row_group_size": 25, "sort_by_file": True}
+    assert db.save(tmpdir, parquet_options=options) == table_ids
+    assert db.save(tmpdir) == []
+    assert db.save(tmpdir, parquet_options=options) == []
+
+    # Options are stored in PARQUET files
+    db_loaded = audformat.Database.load(tmpdir)
+    for table_id in table_ids:
+        assert "parquet_options" not in db_loaded[table_id].meta
+        metadata = pyarrow.parquet.read_schema(
+            os.path.join(tmpdir, f"db.{table_id}.parquet")
+        ).metadata
+        assert json.loads(metadata[b"parquet_options"]) == options
+    assert db_loaded.save(tmpdir) == []
+    assert db_loaded.save(tmpdir, parquet_options=options) == []
+    assert db_loaded == db
+
+    # Row groups of selected files are read
+    files = ["audio/002.wav", "audio/005.wav"]
+    db_loaded = audformat.Database.load(tmpdir, files=files)
+    for table_id in ["files", "segments"]:
+        pd.testing.assert_frame_equal(
+            pd.concat(db_loaded[table_id].iter_batches(3)),
+            db[table_id].get(index=audformat.filewise_index(files)),
+        )
+    assert list(db_loaded["empty"].iter_batches(3)) == []
+
+    # Changed options
+    assert db.save(tmpdir, parquet_options={}) == table_ids
+    for table_id in table_ids:
+        metadata = pyarrow.parquet.read_schema(
+            os.path.join(tmpdir, f"db.{table_id}.parquet")
+        ).metadata
+        assert b"parquet_options" not in metadata
+    assert db.save(tmpdir) == []
+
+    error_msg = "Unknown PARQUET option 'level'"
+    with pytest.raises(ValueError, match=error_msg):
+        db.save(tmpdir, parquet_options={"level": 5})
+
+
+def test_save_header_last(tmpdir, monkeypatch):
+    # Header is not written
+    # if writing tables fails
+    db = audformat.testing.create_db()
+
+    def save(*args, **kwargs):
+        raise RuntimeError("interrupted")
+
+    with monkeypatch.context() as m:
+        m.setattr(audformat.Table, "save", save)
+        with pytest.raises(RuntimeError, match="interrupted"):
+            db.save(tmpdir)
+    assert not os.path.exists(os.path.join(tmpdir, "db.yaml"))
+    assert db.root is None
+
+    db.save(tmpdir)
+    assert os.path.exists(os.path.join(tmpdir, "db.yaml"))
+    assert db.root == tmpdir
+
+
 def test_save_symlink(tmpdir):
     folder = audeer.mkdir(tmpdir, "folder")
     link = audeer.path(tmpdir, "link")
@@ -963,3 +1591,49 @@ def test_update(tmpdir):
         db.update(other1, overwrite=True, copy_attachments=True)
     with pytest.raises(RuntimeError):
         db.update(other1, overwrite=True, copy_media=True)
+
+
+def test_validate():
+    db = audformat.testing.create_db()
+    db.validate()
+
+    # Values of misc table
+    db.schemes["age"] = audformat.Scheme("int", minimum=0)
+    db["speaker"] = audformat.MiscTable(
+        pd.Index(["spk1", "spk2"], name="speaker", dtype="string")
+    )
+    db["speaker"]["age"] = audformat.Column(scheme_id="age")
+    db["speaker"]["age"].set([30, None])
+    db.validate()
+    db["speaker"].df["age"] = [-1, -1]
+    error_msg = re.escape(
+        "Column 'age' of table 'speaker' does not match its scheme.\n"
+        "Some value(s) do not match scheme\n"
+        f"{db.schemes['age']}\n"
+        "with scheme ID 'age':\n"
+        "-1"
+    )
+    with pytest.raises(ValueError, match=error_msg):
+        db.validate()
+    db["speaker"]["age"].set([30, 40])
+
+    # Labels from misc table
+    db.schemes["speaker"] = audformat.Scheme("str", labels="speaker")
+    db["files"]["speaker"] = audformat.Column(scheme_id="speaker")
+    db["files"]["speaker"].set("spk1")
+    db.validate()
+    db["files"].df["speaker"] = "spk3"
+    error_msg = re.escape(
+        "Column 'speaker' of table 'files' does not match its scheme.\n"
+        "Some value(s) do not match scheme\n"
+        f"{db.schemes['speaker']}\n"
+        "with scheme ID 'speaker':\n"
+        "'spk3'"
+    )
+    with pytest.raises(ValueError, match=error_msg) as ex:
+        db.validate()
+    assert isinstance(ex.value.__cause__, ValueError)
+
+    # Labels changed in place
+    db["speaker"].df.loc["spk3", "age"] = 50
+    db.validate()
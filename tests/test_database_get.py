@@ -696,6 +696,43 @@ def test_database_get(request, db, scheme, additional_schemes, expected):
                 dtype="Int64",
             ),
         ),
+        (
+            # Select first value with built-in aggregation
+            #
+            # files, age: 23, NaN, 59
+            "mono_db",
+            "age",
+            [],
+            False,
+            "first",
+            "mismatch",
+            pd.DataFrame(
+                {
+                    "age": [23, 34, 59],
+                },
+                index=audformat.filewise_index(["f1.wav", "f2.wav", "f3.wav"]),
+                dtype="Int64",
+            ),
+        ),
+        (
+            # Average values with built-in aggregation
+            #
+            # f1.wav: (23 + 25) / 2
+            # f3.wav: (59 + 45) / 2
+            "mono_db",
+            "age",
+            [],
+            False,
+            "mean",
+            "mismatch",
+            pd.DataFrame(
+                {
+                    "age": [24, 34, 52],
+                },
+                index=audformat.filewise_index(["f1.wav", "f2.wav", "f3.wav"]),
+                dtype="Int64",
+            ),
+        ),
         (
             # Return all columns using column names
             #
@@ -1555,3 +1592,63 @@ def test_database_get_errors(
             tables=tables,
             original_column_names=original_column_names,
         )
+
+
+def test_database_get_modified_db():
+    # Columns matching a scheme are cached,
+    # ensure modifications of the database are reflected
+    db = audformat.Database("db")
+    db.schemes["rating"] = audformat.Scheme("int")
+    db.schemes["winner"] = audformat.Scheme(
+        "str",
+        labels={"w1": {"year": 1995}, "w2": {"year": 1996}},
+    )
+    index = audformat.filewise_index(["f1.wav", "f2.wav"])
+    db["files"] = audformat.Table(index)
+    db["files"]["rating"] = audformat.Column(scheme_id="rating")
+    db["files"]["rating"].set([0, 1])
+
+    expected = db["files"].get()
+    for _ in range(2):
+        pd.testing.assert_frame_equal(db.get("rating"), expected)
+    assert db.get("year").empty
+
+    # Add column
+    db["files"]["winner"] = audformat.Column(scheme_id="winner")
+    db["files"]["winner"].set(["w1", "w2"])
+    expected = pd.DataFrame(
+        {"year": [1995, 1996]},
+        index=index,
+        dtype="Int64",
+    )
+    pd.testing.assert_frame_equal(db.get("year"), expected)
+
+    # Remove scheme
+    scheme = db.schemes.pop("winner")
+    assert db.get("year").empty
+    db.schemes["winner"] = scheme
+    pd.testing.assert_frame_equal(db.get("year"), expected)
+
+    # Replace labels of scheme
+    db.schemes["winner"].replace_labels({"w1": {"age": 30}, "w2": {"age": 40}})
+    assert db.get("year").empty
+
+    # Assign labels of scheme
+    db.schemes["winner"].labels = {"w1": {"year": 1995}, "w2": {"year": 1996}}
+    pd.testing.assert_frame_equal(db.get("year"), expected)
+
+    # Change scheme of column
+    pd.testing.assert_frame_equal(
+        db.get("rating", strict=True),
+        db["files"]["rating"].get().to_frame(),
+    )
+    db["files"]["rating"].scheme_id = None
+    assert db.get("rating", strict=True).empty
+
+    # Remove table
+    pd.testing.assert_frame_equal(
+        db.get("rating"),
+        db["files"]["rating"].get().to_frame(),
+    )
+    db.drop_tables("files")
+    assert db.get("rating").empty
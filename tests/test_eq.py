@@ -108,3 +108,30 @@ def test_hash():
 
     with pytest.raises(TypeError):
         hash(db["files"]["string"])
+
+
+@pytest.mark.parametrize(
+    "meta1, meta2",
+    [
+        ({"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": 1}, {"a": True}),
+        ({"a": 1}, {"a": "1"}),
+        ({"a": 0.1}, {"a": 0.1}),
+        ({"a": float("nan")}, {"a": float("nan")}),
+        ({"a": None}, {"a": "None"}),
+        ({"a": [1, 2]}, {"a": [2, 1]}),
+        ({"a": [1, 2]}, {"a": {1: 2}}),
+        ({"a": {"b": 1, "c": 2}}, {"a": {"b": 1, "c": 2}}),
+        ({"a": {"b": 1, "c": 2}}, {"a": {"c": 2, "b": 1}}),
+        ({"a": 0, "b": 1}, {"b": 1, "a": 0}),
+    ],
+)
+def test_header_structure(meta1, meta2):
+    # Equality of header objects
+    # matches equality of their YAML representation
+    header1 = audformat.core.common.HeaderBase(meta=meta1)
+    header2 = audformat.core.common.HeaderBase(meta=meta2)
+    expected = header1.dump() == header2.dump()
+    assert (header1 == header2) == expected
+    assert (hash(header1) == hash(header2)) == expected
@@ -213,6 +213,49 @@ def test_scheme_contains():
     assert "label1" not in scheme
 
 
+@pytest.mark.parametrize(
+    "scheme, values",
+    [
+        (
+            audformat.Scheme("str"),
+            ["a", None],
+        ),
+        (
+            audformat.Scheme("float", minimum=-1.0, maximum=1.0),
+            [-2.0, -1.0, 0.0, 1.0, 2.0, np.nan, None],
+        ),
+        (
+            audformat.Scheme("int", minimum=0),
+            pd.Series([-1, 0, 1, None], dtype="Int64"),
+        ),
+        (
+            audformat.Scheme("int", maximum=0),
+            np.array([-1, 0, 1]),
+        ),
+        (
+            audformat.Scheme(labels=["a", "b"]),
+            ["a", "b", "c", None, np.nan],
+        ),
+        (
+            audformat.Scheme(labels=["a", "b"]),
+            pd.Series(["a", "c", None], dtype="category"),
+        ),
+        (
+            audformat.Scheme(labels={1: {"x": "a"}, 2: {"x": "b"}}),
+            [0, 1, 2, 1.0, "1", None],
+        ),
+        (
+            audformat.Scheme("str", labels="misc"),
+            ["a", None],
+        ),
+    ],
+)
+def test_scheme_contains_values(scheme, values):
+    expected = np.array([value in scheme for value in values])
+    result = scheme._contains_values(pd.Series(values))
+    np.testing.assert_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "dtype, values",
     [
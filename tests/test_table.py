@@ -1,3 +1,4 @@
+import json
 import os
 import random
 import re
@@ -1085,7 +1086,103 @@ def test_get_as_segmented():
 
     # reset db
 
-    db._files_duration = {}
+    db._files_duration.clear()
+
+
+@pytest.mark.parametrize(
+    "storage_format",
+    [
+        audformat.define.TableStorageFormat.CSV,
+        audformat.define.TableStorageFormat.PARQUET,
+        audformat.define.TableStorageFormat.PICKLE,
+    ],
+)
+@pytest.mark.parametrize(
+    "table_id, index, columns, map",
+    [
+        ("files", None, "int", None),
+        ("files", None, ["string", "label_map_str"], {"label_map_str": "prop1"}),
+        (
+            "files",
+            audformat.filewise_index(["audio/001.wav", "audio/003.wav"]),
+            ["bool", "label_map_int"],
+            {"label_map_int": ["label_map_int", "int"]},
+        ),
+        ("segments", None, "label", None),
+        (
+            "segments",
+            audformat.filewise_index(["audio/002.wav"]),
+            "int",
+            None,
+        ),
+        (
+            "files",
+            audformat.testing.create_db().segments[:3],
+            "float",
+            None,
+        ),
+        ("misc", None, "int", None),
+        ("misc", pd.Index(["label1"], name="labels"), "label", None),
+    ],
+)
+def test_get_columns(tmpdir, storage_format, table_id, index, columns, map):
+    db = audformat.testing.create_db()
+    db.save(tmpdir, storage_format=storage_format)
+    expected = db[table_id].pick_columns(columns).get(index, map=map)
+    db = audformat.Database.load(tmpdir)
+    table = db[table_id]
+
+    # Only selected columns and files are read from disk,
+    # but table data is not stored in memory
+    result = table.get(index, columns=columns, map=map)
+    assert table._df is None
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Table data is in memory
+    table.load(os.path.join(tmpdir, f"db.{table_id}"))
+    assert table._df is not None
+    result = table.get(index, columns=columns, map=map)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_get_cache(tmpdir):
+    db = audformat.testing.create_db()
+    db.save(tmpdir)
+    db = audformat.Database.load(tmpdir, load_data=False)
+    db.enable_cache()
+    table = db["files"]
+
+    # Columns read from disk are cached
+    expected = table.get(columns=["int", "string"])
+    assert len(db._cache) == 1
+    result = table.get(columns=["int", "string"])
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(db._cache) == 1
+    assert table._df is None
+
+    # Copies of table data are not cached
+    table.get()
+    table.get(copy=False)
+    table.get(table.index[:2], map={"label_map_str": "prop1"})
+    assert len(db._cache) == 1
+
+    # Mapped columns are cached
+    map = {"label_map_str": ["label_map_str", "prop1"]}
+    expected = table.get(map=map)
+    assert len(db._cache) == 2
+    result = table.get(map=map)
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(db._cache) == 2
+
+    # Cached mapping is invalidated by new labels
+    labels = db.schemes["label_map_str"].labels
+    labels["label1"]["prop1"] = 100
+    db.schemes["label_map_str"].replace_labels(labels)
+    result = table.get(map=map)
+    assert len(db._cache) == 3
+    db.disable_cache()
+    pd.testing.assert_frame_equal(result, table.get(map=map))
+    assert not result.equals(expected)
 
 
 def test_get_preserves_dtypes():
@@ -1099,6 +1196,90 @@ def test_get_preserves_dtypes():
             pd.testing.assert_series_equal(df.dtypes, table.df.dtypes)
 
 
+@pytest.mark.parametrize("storage_format", ["csv", "feather", "parquet", "pkl"])
+@pytest.mark.parametrize("table_id", ["files", "segments", "misc"])
+@pytest.mark.parametrize(
+    "batch_size, columns",
+    [
+        (1, None),
+        (7, "int"),
+        (100, ["int", "label"]),
+        (1000, None),
+    ],
+)
+def test_iter_batches(tmpdir, storage_format, table_id, batch_size, columns):
+    db = audformat.testing.create_db()
+    db.save(tmpdir, storage_format=storage_format)
+    expected = db[table_id].get(columns=columns)
+
+    def assert_batches(table):
+        batches = list(table.iter_batches(batch_size, columns=columns))
+        assert len(batches) == -(-len(expected) // batch_size)
+        assert all(len(batch) <= batch_size for batch in batches)
+        pd.testing.assert_frame_equal(pd.concat(batches), expected)
+
+    # Table data in memory
+    assert_batches(db[table_id])
+
+    # Table data not loaded
+    db = audformat.Database.load(tmpdir)
+    assert_batches(db[table_id])
+    if storage_format == "parquet" and table_id in db.tables:
+        # Table data is streamed from PARQUET file
+        assert db[table_id]._df is None
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_iter_batches_load_selection(tmpdir, memory_map):
+    db = audformat.testing.create_db()
+    db.save(tmpdir)
+    files = ["audio/001.wav", "audio/002.wav", "audio/099.wav"]
+    db_loaded = audformat.Database.load(
+        tmpdir,
+        columns=["int", "string"],
+        files=files,
+        memory_map=memory_map,
+    )
+    table = db_loaded["segments"]
+    expected = db["segments"].pick_files(files).get(columns=["int", "string"])
+    batches = list(table.iter_batches(10))
+    assert all(len(batch) > 0 for batch in batches)
+    pd.testing.assert_frame_equal(pd.concat(batches), expected)
+    assert table._df is None
+
+
+def test_iter_batches_errors():
+    db = audformat.testing.create_db()
+    error_msg = "'batch_size' has to be at least 1, but is 0."
+    with pytest.raises(ValueError, match=error_msg):
+        db["files"].iter_batches(0)
+    with pytest.raises(ValueError, match=error_msg):
+        db.iter_batches("int", batch_size=0)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_iter_batches_file_precedence(tmpdir, memory_map):
+    # Batches are read from the same file as load(),
+    # i.e. a newer PKL file takes precedence
+    # over the FEATHER and PARQUET file
+    db = audformat.testing.create_db()
+    db.save(tmpdir)
+    db.save(tmpdir, storage_format="feather")
+    db["files"].df["int"] = 0
+    db["files"].save(
+        audeer.path(tmpdir, "db.files"),
+        storage_format="pkl",
+        update_other_formats=False,
+    )
+    db_loaded = audformat.Database.load(tmpdir, memory_map=memory_map)
+    batches = list(db_loaded["files"].iter_batches(10, columns="int"))
+    pd.testing.assert_frame_equal(pd.concat(batches), db["files"].get(columns="int"))
+    pd.testing.assert_series_equal(
+        db_loaded["files"]["int"].get(),
+        db["files"]["int"].get(),
+    )
+
+
 def test_load(tmpdir):
     path_pkl = os.path.join(tmpdir, "db.table.pkl")
     path_no_ext = os.path.join(tmpdir, "db.table")
@@ -1143,6 +1324,153 @@ def test_load(tmpdir):
         os.remove(f"{path_no_ext}.{ext}")
 
 
+@pytest.mark.parametrize(
+    "storage_format",
+    [
+        audformat.define.TableStorageFormat.CSV,
+        audformat.define.TableStorageFormat.PARQUET,
+        audformat.define.TableStorageFormat.PICKLE,
+    ],
+)
+@pytest.mark.parametrize("table_id", ["files", "segments"])
+@pytest.mark.parametrize(
+    "columns, files",
+    [
+        (None, None),
+        ("string", None),
+        (["int", "label_map_str", "non-existing"], None),
+        ([], None),
+        (None, "audio/001.wav"),
+        (["string", "int"], ["audio/002.wav", "audio/003.wav", "non-existing"]),
+        (None, []),
+    ],
+)
+def test_load_columns_and_files(tmpdir, storage_format, table_id, columns, files):
+    db = audformat.testing.create_db()
+    table = db[table_id]
+    path = os.path.join(tmpdir, "db.table")
+    table.save(path, storage_format=storage_format, update_other_formats=False)
+
+    expected = table.copy()
+    if columns is not None:
+        expected.pick_columns(columns, inplace=True)
+    if files is not None:
+        expected.pick_files(files, inplace=True)
+
+    table_loaded = table.copy()
+    table_loaded.load(path, columns=columns, files=files)
+    assert list(table_loaded.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(table_loaded.df, expected.df)
+
+    # Partially loaded tables are not stored as PKL file
+    pkl_file = f"{path}.{audformat.define.TableStorageFormat.PICKLE}"
+    if storage_format != audformat.define.TableStorageFormat.PICKLE:
+        assert not os.path.exists(pkl_file)
+
+
+def test_load_columns_and_files_broken_pickle(tmpdir):
+    table = audformat.testing.create_db()["files"]
+    path = os.path.join(tmpdir, "db.table")
+    pkl_file = f"{path}.{audformat.define.TableStorageFormat.PICKLE}"
+    table.save(path, storage_format=audformat.define.TableStorageFormat.PARQUET)
+
+    # Corrupt PKL file
+    with open(pkl_file, "wb"):
+        pass
+
+    # Partially loaded table is not stored as PKL file
+    table_loaded = table.copy()
+    table_loaded.load(path, columns="int")
+    pd.testing.assert_frame_equal(table_loaded.df, table.df[["int"]])
+    assert os.path.getsize(pkl_file) == 0
+
+    # Fully loaded table restores PKL file
+    table_loaded = table.copy()
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, table.df)
+    pd.testing.assert_frame_equal(pd.read_pickle(pkl_file), table.df)
+
+
+def test_load_feather(tmpdir):
+    table = audformat.testing.create_db()["segments"]
+    path = os.path.join(tmpdir, "db.table")
+    feather_file = f"{path}.{audformat.define.TableStorageFormat.FEATHER}"
+    parquet_file = f"{path}.{audformat.define.TableStorageFormat.PARQUET}"
+    pkl_file = f"{path}.{audformat.define.TableStorageFormat.PICKLE}"
+    table.save(path, storage_format=audformat.define.TableStorageFormat.FEATHER)
+
+    # Selected columns and files
+    files = table.files[:2]
+    table_loaded = table.copy()
+    table_loaded.load(path, columns="string", files=files)
+    pd.testing.assert_frame_equal(
+        table_loaded.df,
+        table.df.loc[table.df.index.isin(files, level="file"), ["string"]],
+    )
+
+    # Memory-mapped
+    table_loaded = table.copy()
+    table_loaded._memory_map = True
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, table.df)
+
+    # Corrupt PKL file falls back to FEATHER file
+    with open(pkl_file, "wb"):
+        pass
+    table_loaded = table.copy()
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, table.df)
+    pd.testing.assert_frame_equal(pd.read_pickle(pkl_file), table.df)
+    os.remove(pkl_file)
+
+    # PARQUET file newer than FEATHER file
+    table.save(
+        path,
+        storage_format=audformat.define.TableStorageFormat.PARQUET,
+        update_other_formats=False,
+    )
+    os.utime(feather_file, (0, 0))
+    error_msg = (
+        f"The table PARQUET file '{parquet_file}' is newer "
+        f"than the table FEATHER file '{feather_file}'. "
+        "If you want to load from the PARQUET file, "
+        "please delete the FEATHER file. "
+        "If you want to load from the FEATHER file, "
+        "please delete the PARQUET file."
+    )
+    with pytest.raises(RuntimeError, match=re.escape(error_msg)):
+        table.copy().load(path)
+
+
+@pytest.mark.parametrize("storage_format", ["csv", "feather", "parquet"])
+def test_load_segmented_file_level(tmpdir, storage_format):
+    # File level is read dictionary-encoded,
+    # but the loaded index is identical
+    files = ["f3", "f1", "f2"] * 3
+    index = audformat.segmented_index(files, range(9), range(1, 10))
+    db = audformat.testing.create_db(minimal=True)
+    db["table"] = audformat.Table(index)
+    path = audeer.path(tmpdir, "table")
+    db["table"].save(path, storage_format=storage_format)
+    table = db["table"].copy()
+    table.load(path)
+    pd.testing.assert_index_equal(table.index, index)
+    assert list(table.index.levels[0]) == ["f1", "f2", "f3"]
+    assert table.index.levels[0].dtype == "string"
+    table.load(path, files=["f1", "f3"])
+    pd.testing.assert_index_equal(table.index, index[index.isin(["f1", "f3"], 0)])
+
+
+def test_load_columns_misc_table(tmpdir):
+    table = audformat.testing.create_db()["misc"]
+    path = os.path.join(tmpdir, "db.misc")
+    table.save(path)
+    table_loaded = table.copy()
+    table_loaded.load(path, columns="int")
+    assert list(table_loaded.columns) == ["int"]
+    pd.testing.assert_frame_equal(table_loaded.df, table.df[["int"]])
+
+
 class TestLoadBrokenCsv:
     r"""Test loading of malformed csv files.
 
@@ -1215,6 +1543,17 @@ class TestLoadBrokenCsv:
         assert "hidden" not in db_loaded["table"].df
         assert "hidden-column" not in db_loaded["empty-table"].df
 
+        # Select columns and files
+        db_loaded = audformat.Database.load(
+            build_dir,
+            load_data=True,
+            columns="date",
+            files="non-existing.wav",
+        )
+        assert list(db_loaded["table"].df.columns) == ["date"]
+        assert len(db_loaded["table"]) == 0
+        assert len(db_loaded["empty-table"].columns) == 0
+
 
 def test_load_old_pickle(tmpdir):
     # We have stored string dtype as object dtype before
@@ -1401,15 +1740,15 @@ class TestHash:
     [
         (
             "files",
-            "a66a22ee4158e0e5100f1d797155ad81",
+            "830b2c4e69b9002394cfead2ae776714",
         ),
         (
             "segments",
-            "f69eb4a5d19da71e5da00a9b13beb3db",
+            "dec8e0151c17149a5a490fd0869bdac6",
         ),
         (
             "misc",
-            "331f79758b195cb9b7d0e8889e830eb2",
+            "ea933065a6d9b43480f4314f95da2fda",
         ),
     ],
 )
@@ -1438,6 +1777,12 @@ def test_parquet_hash_reproducibility(tmpdir, table_id, expected_hash):
     db[table_id].save(path_wo_ext, storage_format="parquet")
     metadata = parquet.read_schema(path).metadata
     assert metadata[b"hash"].decode() == expected_hash
+    assert metadata[b"hash_version"].decode() == "2"
+    assert expected_hash == audformat.utils.hash(
+        db[table_id].df,
+        strict=True,
+        version=2,
+    )
 
     # Load table from PARQUET file, and overwrite it
     db[table_id].load(path_wo_ext)
@@ -1718,7 +2063,8 @@ def test_save_and_load(tmpdir, storage_format):
             "non-existing",
             audformat.errors.BadValueError,
             re.escape(
-                "Bad value 'non-existing', expected one of ['csv', 'parquet', 'pkl']"
+                "Bad value 'non-existing', "
+                "expected one of ['csv', 'feather', 'parquet', 'pkl']"
             ),
         ),
     ],
@@ -1740,6 +2086,124 @@ def test_save_errors(tmpdir, storage_format, expected_error, expected_error_msg)
         db[table_id].save(path_wo_ext, storage_format=storage_format)
 
 
+def test_save_parquet_options(tmpdir):
+    db = audformat.testing.create_db()
+    table = db["segments"]
+    # Reverse order of files,
+    # but keep order of segments of a file
+    table._df = pd.concat(
+        [
+            table.df[table.df.index.isin([file], level="file")]
+            for file in table.files.unique()[::-1]
+        ]
+    )
+    path = audeer.path(tmpdir, "table")
+    parquet_file = f"{path}.parquet"
+    options = {
+        "compression": "zstd",
+        "compression_level": 5,
+        "row_group_size": 25,
+        "sort_by_file": True,
+        "use_dictionary": ["file"],
+    }
+    table.save(path, parquet_options=options)
+    assert "parquet_options" not in table.meta
+    metadata = parquet.read_schema(parquet_file).metadata
+    assert json.loads(metadata[b"parquet_options"]) == options
+
+    # Row groups hold complete files
+    metadata = parquet.ParquetFile(parquet_file).metadata
+    assert [
+        metadata.row_group(idx).num_rows for idx in range(metadata.num_row_groups)
+    ] == [20] * 5
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    # Rows are sorted by file
+    expected = table.df.sort_index(level="file", sort_remaining=False)
+    table_loaded = table.copy()
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, expected)
+    assert parquet.read_schema(parquet_file).metadata[b"hash"].decode() == (
+        audformat.utils.hash(expected, strict=True, version=2)
+    )
+
+    # Stored options are used,
+    # unless other options are given
+    table.save(path)
+    assert parquet.ParquetFile(parquet_file).metadata.num_row_groups == 5
+    table.save(path, parquet_options={})
+    assert b"parquet_options" not in parquet.read_schema(parquet_file).metadata
+    assert parquet.ParquetFile(parquet_file).metadata.num_row_groups == 1
+
+    # Tables without file level
+    table = db["misc"]
+    table.save(path, parquet_options={"row_group_size": 2, "sort_by_file": True})
+    assert parquet.ParquetFile(parquet_file).metadata.num_row_groups == 2
+    table_loaded = table.copy()
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, table.df)
+
+    # Empty table
+    table = audformat.Table(audformat.filewise_index())
+    table["column"] = audformat.Column()
+    table.save(path, parquet_options=options)
+    table_loaded = table.copy()
+    table_loaded.load(path)
+    pd.testing.assert_frame_equal(table_loaded.df, table.df)
+
+    # Unknown option
+    error_msg = (
+        "Unknown PARQUET option 'level', "
+        "parquet_options keys need to be one of: "
+        "compression, compression_level, row_group_size, "
+        "sort_by_file, use_dictionary"
+    )
+    with pytest.raises(ValueError, match=error_msg):
+        table.save(path, parquet_options={"level": 5})
+
+
+@pytest.mark.parametrize("storage_format", ["csv", "feather", "parquet", "pkl"])
+def test_save_interrupted(tmpdir, monkeypatch, storage_format):
+    # Interrupted save keeps existing file
+    # and does not leave temporary files
+    db = audformat.testing.create_db()
+    table = db["files"]
+    path_wo_ext = audeer.path(tmpdir, "files")
+    path = f"{path_wo_ext}.{storage_format}"
+    table.save(path_wo_ext, storage_format=storage_format)
+    with open(path, "rb") as fp:
+        expected = fp.read()
+
+    def write(obj, path_or_buffer, *args, **kwargs):
+        if isinstance(path_or_buffer, str):
+            with open(path_or_buffer, "w") as fp:
+                fp.write("partial")
+        else:
+            path_or_buffer.write("partial")
+        raise KeyboardInterrupt()
+
+    def write_row_group(obj, table, *args, **kwargs):
+        # File was already opened by pyarrow.parquet.ParquetWriter
+        raise KeyboardInterrupt()
+
+    table.df.loc[db.files[0], "string"] = "changed"
+    with monkeypatch.context() as m:
+        m.setattr(pd.DataFrame, "to_csv", write)
+        m.setattr(pd.DataFrame, "to_pickle", write)
+        m.setattr(
+            audformat.core.table.parquet.ParquetWriter,
+            "write_table",
+            write_row_group,
+        )
+        m.setattr(audformat.core.table.feather, "write_feather", write)
+        with pytest.raises(KeyboardInterrupt):
+            table.save(path_wo_ext, storage_format=storage_format)
+
+    with open(path, "rb") as fp:
+        assert fp.read() == expected
+    assert os.listdir(tmpdir) == [os.path.basename(path)]
+
+
 @pytest.mark.parametrize(
     "num_files,num_segments_per_file,values",
     [
@@ -2214,6 +2678,35 @@ def test_update(table, overwrite, others):
             assert column.rater == table[column_id].rater
 
 
+@pytest.mark.parametrize(
+    "aggregate_function, aggregate_strategy, expected",
+    [
+        ("first", "mismatch", ["a", "b", "c"]),
+        ("majority_vote", "mismatch", ["a", "c", "b"]),
+        ("majority_vote", "overlap", ["a", "c", "b"]),
+        (lambda y: y.iloc[-1], "overlap", ["b", "c", "b"]),
+    ],
+)
+def test_update_aggregate_function(
+    aggregate_function,
+    aggregate_strategy,
+    expected,
+):
+    index = audformat.filewise_index(["f1", "f2", "f3"])
+    table = create_db_table(pd.Series(["a", "b", "c"], index))
+    others = [
+        create_db_table(pd.Series(["a", "c", "b"], index)),
+        create_db_table(pd.Series(["b", "c", "b"], index)),
+    ]
+    table.update(
+        others,
+        aggregate_function=aggregate_function,
+        aggregate_strategy=aggregate_strategy,
+    )
+    expected = pd.Series(expected, index, dtype="string")
+    pd.testing.assert_series_equal(table.get().iloc[:, 0], expected, check_names=False)
+
+
 @pytest.mark.parametrize("update_other_formats", [True, False])
 @pytest.mark.parametrize(
     "storage_format, existing_formats",
@@ -2228,6 +2721,9 @@ def test_update(table, overwrite, others):
         ("parquet", ["pkl"]),
         ("parquet", ["csv"]),
         ("parquet", ["pkl", "csv"]),
+        ("feather", ["parquet", "pkl"]),
+        ("parquet", ["feather"]),
+        ("pkl", ["csv", "feather"]),
     ],
 )
 def test_update_other_formats(
@@ -2294,6 +2790,12 @@ def test_update_other_formats(
             assert mtime["pickle"] >= mtime["parquet"]
         if "csv" in formats and "parquet" in formats:
             assert mtime["csv"] >= mtime["parquet"]
+        if "feather" in formats and "csv" in formats:
+            assert mtime["feather"] >= mtime["csv"]
+        if "feather" in formats and "parquet" in formats:
+            assert mtime["feather"] >= mtime["parquet"]
+        if "pkl" in formats and "feather" in formats:
+            assert mtime["pkl"] >= mtime["feather"]
     else:
         for ext in existing_formats:
             assert mtime[ext] == old_mtime[ext]
@@ -263,6 +263,25 @@ from audformat import utils
                 {"idx2": "Int64"},
             ),
         ),
+        (
+            [
+                audformat.segmented_index(
+                    ["f1", "f1", "f2", "f3"],
+                    [0, 0, 0, 0],
+                    [pd.NaT, pd.NaT, 1, pd.NaT],
+                ),
+                audformat.segmented_index(
+                    ["f2", "f3", "f4"],
+                    [0, 0, 0],
+                    [1, 2, pd.NaT],
+                ),
+            ],
+            audformat.segmented_index(
+                ["f3", "f3", "f4"],
+                [0, 0, 0],
+                [pd.NaT, 2, pd.NaT],
+            ),
+        ),
         pytest.param(
             [
                 pd.Index([], name="idx1"),
@@ -710,6 +729,70 @@ def test_hash(obj, strict, mutable, expected):
         assert reverse_md5 != md5
 
 
+def test_hash_version_2():
+    index = audformat.segmented_index(
+        ["f1", "f2", "f3"],
+        [0, 1, 2],
+        [1, 2, pd.NaT],
+    )
+    df = pd.DataFrame(
+        {
+            "int": pd.array([0, 1, None], dtype="Int64"),
+            "float": [0.0, np.nan, 2.0],
+            "bool": [True, False, True],
+            "boolean": pd.array([True, None, False], dtype="boolean"),
+            "str": pd.array(["a", None, "ccc"], dtype="string"),
+            "category": pd.Series(["a", None, "b"], dtype="category"),
+            "time": pd.to_timedelta([0, None, 2], unit="s"),
+            "date": pd.to_datetime(["2000-01-01", None, "2000-01-03"]),
+            "object": ["a", None, "b"],
+            "none": [None, None, None],
+            "list": [[0], [1, 2], []],
+        },
+        index=index,
+    )
+    md5 = audformat.utils.hash(df, strict=True, version=2)
+    assert md5 == "2e9e4cc1ddc900e6301ffddea6c7cf78"
+    assert md5 != audformat.utils.hash(df, strict=True)
+    assert md5 != audformat.utils.hash(df[::-1], strict=True, version=2)
+    for column in df:
+        other = df.drop(columns=column)
+        assert md5 != audformat.utils.hash(other, strict=True, version=2)
+
+    # Values at positions of missing values are ignored
+    y1 = pd.Series(
+        pd.arrays.IntegerArray(np.array([0, 1]), np.array([False, True])),
+        index=audformat.filewise_index(["f1", "f2"]),
+    )
+    y2 = pd.Series(
+        pd.arrays.IntegerArray(np.array([0, 2]), np.array([False, True])),
+        index=audformat.filewise_index(["f1", "f2"]),
+    )
+    assert audformat.utils.hash(y1, strict=True, version=2) == audformat.utils.hash(
+        y2, strict=True, version=2
+    )
+
+    # All values of long columns are included
+    index = audformat.filewise_index([f"f{n}" for n in range(2000)])
+    y1 = pd.Series(np.arange(2000), index=index)
+    y2 = y1.copy()
+    y2.iloc[1000] = -1
+    assert audformat.utils.hash(y1, strict=True) == audformat.utils.hash(
+        y2, strict=True
+    )
+    assert audformat.utils.hash(y1, strict=True, version=2) != audformat.utils.hash(
+        y2, strict=True, version=2
+    )
+
+    # Empty objects
+    assert audformat.utils.hash(
+        audformat.filewise_index(), strict=True, version=2
+    ) != audformat.utils.hash(audformat.segmented_index(), strict=True, version=2)
+
+    with pytest.raises(ValueError, match="version needs to be one of: 1, 2"):
+        audformat.utils.hash(df, strict=True, version=3)
+
+
 @pytest.mark.parametrize(
     "obj, expected",
     [
@@ -765,6 +848,30 @@ def test_hash(obj, strict, mutable, expected):
             ),
             False,
         ),
+        (
+            audformat.segmented_index(
+                ["f1", "f2", "f1", "f2"],
+                [2, 2, 0, 0],
+                [3, 3, 2, 2],
+            ),
+            False,
+        ),
+        (
+            audformat.segmented_index(
+                ["f1", "f2", "f1", "f2"],
+                [2, 2, 0, 0],
+                [3, 3, 2, 2.5],
+            ),
+            True,
+        ),
+        (
+            audformat.segmented_index(
+                ["f1"] * 2,
+                [1, 1],
+                [2, 1],
+            ),
+            False,
+        ),
         (
             pd.Series(
                 index=audformat.segmented_index(
@@ -1060,6 +1167,25 @@ def test_index_has_overlap(obj, expected):
                 {"idx2": "Int64"},
             ),
         ),
+        (
+            [
+                audformat.segmented_index(
+                    ["f1", "f1", "f2", "f3"],
+                    [0, 0, 0, 0],
+                    [pd.NaT, pd.NaT, 1, pd.NaT],
+                ),
+                audformat.segmented_index(
+                    ["f3", "f2", "f1", "f1"],
+                    [0, 0, 0, 0],
+                    [2, 1, pd.NaT, pd.NaT],
+                ),
+            ],
+            audformat.segmented_index(
+                ["f1", "f2"],
+                [0, 0],
+                [pd.NaT, 1],
+            ),
+        ),
         pytest.param(
             [
                 pd.Index([], name="idx1"),
@@ -2516,6 +2642,13 @@ def test_to_filewise_index(tmpdir, obj, expected_file_names):
             ],
             audformat.filewise_index(["f2", "f1"]),
         ),
+        (
+            [
+                audformat.filewise_index(["f1", "f1", "f2"]),
+                audformat.filewise_index(["f1", "f1", "f2"]),
+            ],
+            audformat.filewise_index(["f1", "f2"]),
+        ),
         (
             [
                 audformat.filewise_index(["f1", "f2"]),
@@ -1534,6 +1534,195 @@ def test_concat_aggregate_function_aggregate(
         pd.testing.assert_frame_equal(obj, expected)
 
 
+@pytest.mark.parametrize(
+    "objs",
+    [
+        [
+            pd.Series(
+                [1, 2, 3],
+                index=audformat.filewise_index(["f1", "f2", "f3"]),
+                dtype="Int64",
+            ),
+            pd.Series(
+                [2, 2, np.nan],
+                index=audformat.filewise_index(["f1", "f2", "f3"]),
+                dtype="Int64",
+            ),
+            pd.Series(
+                [2, 3, 1, 4],
+                index=audformat.filewise_index(["f1", "f2", "f3", "f4"]),
+                dtype="Int64",
+            ),
+        ],
+        [
+            pd.Series(
+                [1.0, 2.0],
+                index=audformat.segmented_index(["f1", "f1"], [0, 1], [1, 2]),
+            ),
+            pd.Series(
+                [1.5, np.nan],
+                index=audformat.segmented_index(["f1", "f1"], [0, 1], [1, 2]),
+            ),
+            pd.Series(
+                [0.5, 4.0],
+                index=audformat.segmented_index(["f1", "f1"], [0, 1], [1, 2]),
+            ),
+        ],
+        [
+            pd.DataFrame(
+                {
+                    "a": [1.0, 2.0],
+                    "b": pd.Series(["x", "y"], dtype="category"),
+                },
+                index=audformat.filewise_index(["f1", "f2"]),
+            ),
+            pd.DataFrame(
+                {
+                    "a": [3.0, 2.0],
+                    "b": pd.Series(["y", "x"], dtype="category"),
+                },
+                index=audformat.filewise_index(["f1", "f2"]),
+            ),
+            pd.DataFrame(
+                {
+                    "b": pd.Series(
+                        ["y", "y"],
+                        dtype=pd.CategoricalDtype(["x", "y"]),
+                    ),
+                },
+                index=audformat.filewise_index(["f1", "f2"]),
+            ),
+        ],
+    ],
+)
+@pytest.mark.parametrize(
+    "aggregate_function, expected_function",
+    [
+        ("first", lambda y: y.iloc[0]),
+        ("mean", lambda y: y.mean()),
+        ("median", lambda y: y.median()),
+        ("mode", lambda y: y.mode()[0]),
+    ],
+)
+@pytest.mark.parametrize("aggregate_strategy", ["overlap", "mismatch"])
+def test_concat_aggregate_function_named(
+    objs,
+    aggregate_function,
+    expected_function,
+    aggregate_strategy,
+):
+    # Built-in aggregations have to return the same result
+    # as the corresponding custom aggregation function
+    if aggregate_function in ["mean", "median"]:
+        objs = [obj.drop(columns="b", errors="ignore") for obj in objs]
+    obj = audformat.utils.concat(
+        objs,
+        aggregate_function=aggregate_function,
+        aggregate_strategy=aggregate_strategy,
+    )
+    expected = audformat.utils.concat(
+        objs,
+        aggregate_function=expected_function,
+        aggregate_strategy=aggregate_strategy,
+    )
+    if isinstance(obj, pd.Series):
+        pd.testing.assert_series_equal(obj, expected)
+    else:
+        pd.testing.assert_frame_equal(obj, expected)
+
+
+@pytest.mark.parametrize(
+    "objs, aggregate_function, aggregate_strategy, expected",
+    [
+        (
+            [
+                pd.Series([1, 2, 3], pd.Index(["a", "b", "c"]), dtype="Int64"),
+                pd.Series([2, 3, 3], pd.Index(["a", "b", "c"]), dtype="Int64"),
+                pd.Series([2, 2, 4], pd.Index(["a", "b", "c"]), dtype="Int64"),
+            ],
+            "mean",
+            "overlap",
+            pd.Series(
+                [5 / 3, 7 / 3, 10 / 3],
+                pd.Index(["a", "b", "c"]),
+                dtype="float64",
+            ),
+        ),
+        (
+            [
+                pd.Series([1, 2], pd.Index(["a", "b"]), dtype="Int64"),
+                pd.Series([3, 2], pd.Index(["a", "b"]), dtype="Int64"),
+            ],
+            "mean",
+            "mismatch",
+            pd.Series([2, 2], pd.Index(["a", "b"]), dtype="Int64"),
+        ),
+        (
+            [
+                pd.Series([1.0, 2.0], pd.Index(["a", "b"])),
+                pd.Series([3.0, 2.0], pd.Index(["a", "b"])),
+                pd.Series([8.0, np.nan], pd.Index(["a", "b"])),
+            ],
+            "median",
+            "overlap",
+            pd.Series([3.0, 2.0], pd.Index(["a", "b"])),
+        ),
+        (
+            [
+                pd.Series([True, False], pd.Index(["a", "b"])),
+                pd.Series([False, True], pd.Index(["a", "b"])),
+            ],
+            "mean",
+            "mismatch",
+            pd.Series([0.5, 0.5], pd.Index(["a", "b"])),
+        ),
+        # on a tie majority vote selects the value
+        # that appears first,
+        # mode selects the smallest value
+        (
+            [
+                pd.Series(["b", "a"], pd.Index(["a", "b"]), dtype="string"),
+                pd.Series(["a", "b"], pd.Index(["a", "b"]), dtype="string"),
+            ],
+            "majority_vote",
+            "mismatch",
+            pd.Series(["b", "a"], pd.Index(["a", "b"]), dtype="string"),
+        ),
+        (
+            [
+                pd.Series(["b", "a"], pd.Index(["a", "b"]), dtype="string"),
+                pd.Series(["a", "b"], pd.Index(["a", "b"]), dtype="string"),
+            ],
+            "mode",
+            "mismatch",
+            pd.Series(["a", "a"], pd.Index(["a", "b"]), dtype="string"),
+        ),
+        (
+            [
+                pd.Series(["b", "a"], pd.Index(["a", "b"]), dtype="string"),
+                pd.Series(["a", "b"], pd.Index(["a", "b"]), dtype="string"),
+                pd.Series(["a", pd.NA], pd.Index(["a", "b"]), dtype="string"),
+            ],
+            "majority_vote",
+            "overlap",
+            pd.Series(["a", "a"], pd.Index(["a", "b"]), dtype="string"),
+        ),
+    ],
+)
+def test_concat_aggregate_function_named_values(
+    objs,
+    aggregate_function,
+    aggregate_strategy,
+    expected,
+):
+    obj = audformat.utils.concat(
+        objs,
+        aggregate_function=aggregate_function,
+        aggregate_strategy=aggregate_strategy,
+    )
+    pd.testing.assert_series_equal(obj, expected)
+
+
 @pytest.mark.parametrize(
     "objs, aggregate_function, expected",
     [
@@ -1607,6 +1796,47 @@ def test_concat_overwrite_aggregate_function(
             ValueError,
             "aggregate_strategy needs to be one of: overlap, mismatch",
         ),
+        # wrong aggregate_function argument
+        (
+            [],
+            "non-existent",
+            "mismatch",
+            ValueError,
+            (
+                "aggregate_function needs to be a callable or one of: "
+                "first, majority_vote, mean, median, mode"
+            ),
+        ),
+        # aggregate_function not supported by dtype
+        (
+            [
+                pd.Series(["a"], audformat.filewise_index("f1"), name="c"),
+                pd.Series(["b"], audformat.filewise_index("f1"), name="c"),
+            ],
+            "mean",
+            "mismatch",
+            ValueError,
+            "Cannot apply aggregate_function 'mean' to column 'c' of dtype 'object'.",
+        ),
+        (
+            [
+                pd.Series(
+                    ["a"],
+                    audformat.filewise_index("f1"),
+                    dtype=pd.CategoricalDtype(["a", "b"]),
+                ),
+                pd.Series(
+                    ["b"],
+                    audformat.filewise_index("f1"),
+                    dtype=pd.CategoricalDtype(["a", "b"]),
+                ),
+            ],
+            "median",
+            "mismatch",
+            ValueError,
+            "Cannot apply aggregate_function 'median' to column 'None' "
+            "of dtype 'category'.",
+        ),
         # dtypes do not match
         (
             [